@@ -8,7 +8,7 @@ Logger.SHOW_DEBUG = True
 
 
 from flask_restful import Api
-from backend.app.start import register_routes, preload_models, run_tests, create_app
+from backend.app.start import register_routes, preload_models, run_tests, create_app, start_jobs
 
 Logger.info("Initializing application components...")
 
@@ -29,6 +29,10 @@ Logger.info("Running unit tests before application startup.")
 Logger.info("Preloading models for translation and TTS services.")
 preload_models(config_manager, cache_manager)
 
+# Start the background job workers (resumes jobs interrupted by the last shutdown).
+Logger.info("Starting background job workers.")
+start_jobs(config_manager, cache_manager, mongo_manager, crypto_manager)
+
 Logger.info("Application startup process completed successfully.")
 
 # Start the Flask application.
@@ -1,5 +1,7 @@
 from .route_docker_healthcheck import HealthCheck
+from .route_docker_stats import CacheStats
 
 __all__ = [
-    "HealthCheck"
-]
\ No newline at end of file
+    "HealthCheck",
+    "CacheStats"
+]
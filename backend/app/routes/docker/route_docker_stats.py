@@ -0,0 +1,48 @@
+from flask_restful import Resource
+
+from backend.app.translators import TranslatorPool
+from backend.app.utils import ModelRegistry, BlobStore, BatchScheduler, PriorityGate, JobManager
+from backend.app.utils.util_logger import Logger
+
+
+class CacheStats(Resource):
+    """
+    Statistics endpoint reporting cache hits, misses, evictions, bytes stored and the
+    compute time saved per namespace (translation, tts, stt, models), plus compression, blob store, batching (queue wait per priority class), TTS gate, translation engine and background job figures.
+    """
+
+    def __init__(self, config_manager, cache_manager):
+        """
+        Initialize CacheStats resource with configuration and cache managers.
+        """
+        self.config_manager = config_manager
+        self.cache_manager = cache_manager
+        Logger.info("CacheStats service initialized.")
+
+    def get(self):
+        """
+        Collect the cache and model registry statistics.
+
+        Returns:
+            tuple: A dictionary with the statistics per namespace and the HTTP status code.
+        """
+        try:
+            namespaces = self.cache_manager.get_stats()
+            registry = ModelRegistry()
+            namespaces["models"] = registry.get_namespace_stats()
+
+            return {
+                "max_entries": self.cache_manager.cache.maxsize,
+                "namespaces": namespaces,
+                "compression": self.cache_manager.get_compression_stats(),
+                "models": registry.get_stats(),
+                "blobs": BlobStore().get_stats(),
+                "batching": BatchScheduler().get_stats(),
+                "tts_gate": PriorityGate().get_stats(),
+                "translators": TranslatorPool().get_stats(),
+                "jobs": JobManager().get_stats()
+            }, 200
+
+        except Exception as e:
+            Logger.error(f"Collecting cache statistics failed: {str(e)}")
+            return {"error": str(e)}, 500
@@ -0,0 +1,6 @@
+from .route_jobs import SubmitJob, JobStatus
+
+__all__ = [
+    "SubmitJob",
+    "JobStatus"
+]
\ No newline at end of file
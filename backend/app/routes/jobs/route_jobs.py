@@ -0,0 +1,86 @@
+from flask import request
+from flask_restful import Resource
+
+from backend.app.utils.util_job_manager import JobManager
+from backend.app.utils.util_logger import Logger  # Import the Logger class
+
+
+class SubmitJob(Resource):
+    """
+    Submits a background job (e.g. "translate_book", "tts_book", "ocr_book") and returns its id.
+    """
+
+    def __init__(self, config_manager):
+        """
+        Initializes SubmitJob with the configuration manager.
+        """
+        self.config_manager = config_manager
+        Logger.info("SubmitJob instance initialized.")
+
+    def post(self):
+        """
+        Handles POST requests with a payload {"data": {"type": <job type>, "user": ..., <job parameters>}}.
+
+        Returns:
+            tuple: {"job_id", "status"} with HTTP status 202, or an error message with the status code.
+        """
+        Logger.info("POST request received for SubmitJob.")
+        json_data = request.get_json(silent=True)
+        if not json_data or "data" not in json_data:
+            Logger.warning("Missing 'data' object in request.")
+            return {"error": "Missing data object"}, 400
+
+        params = dict(json_data["data"])
+        job_type = params.pop("type", None)
+        if not job_type:
+            Logger.warning("Missing job type in request.")
+            return {"error": "Missing job type"}, 400
+
+        try:
+            job_id = JobManager().submit(job_type, params, user=params.get("user"))
+            return {"job_id": job_id, "status": "queued"}, 202
+        except ValueError as ve:
+            Logger.error(f"Invalid job request: {str(ve)}")
+            return {"error": str(ve)}, 400
+        except Exception as e:
+            Logger.error(f"Internal Server Error while submitting job: {str(e)}")
+            return {"error": f"Internal Server Error: {str(e)}"}, 500
+
+
+class JobStatus(Resource):
+    """
+    Reports the status and progress of a background job and cancels it.
+    """
+
+    def __init__(self, config_manager):
+        """
+        Initializes JobStatus with the configuration manager.
+        """
+        self.config_manager = config_manager
+        Logger.info("JobStatus instance initialized.")
+
+    def get(self, job_id):
+        """
+        Returns the job document: type, params, status, progress {done, total}, result and error.
+        """
+        try:
+            job = JobManager().get(job_id)
+            if not job:
+                return {"error": "Job not found"}, 404
+            return job, 200
+        except Exception as e:
+            Logger.error(f"Internal Server Error while reading job {job_id}: {str(e)}")
+            return {"error": f"Internal Server Error: {str(e)}"}, 500
+
+    def delete(self, job_id):
+        """
+        Cancels the job. A running job stops after the pages it is currently processing.
+        """
+        try:
+            job = JobManager().cancel(job_id)
+            if not job:
+                return {"error": "Job not found"}, 404
+            return job, 200
+        except Exception as e:
+            Logger.error(f"Internal Server Error while cancelling job {job_id}: {str(e)}")
+            return {"error": f"Internal Server Error: {str(e)}"}, 500
@@ -2,6 +2,7 @@ from flask import request
 from flask_restful import Resource
 from backend.app.services.translation import TranslationService
 from backend.app.utils.util_logger import Logger
+from backend.app.utils.util_streaming import ndjson_response
 
 class TranslateFile(Resource):
     """
@@ -31,6 +32,8 @@ class TranslateFile(Resource):
 
         Receives a JSON payload containing the base64-encoded PDF and the model,
         validates the input, and returns the translated content or an error response.
+        With "stream": true in the payload, the pages are streamed as NDJSON as soon as
+        each one is translated.
 
         Returns:
             tuple: JSON response containing the translated text or an error message, along with the HTTP status code.
@@ -48,6 +51,7 @@ class TranslateFile(Resource):
         data = json_data['data']
         model = data.get('model')
         file = data.get('file')
+        stream = str(data.get('stream', False)).strip().lower() in ('true', '1', 'yes')
 
         # Validate required parameters to ensure all necessary data is provided
         if not model or not file:
@@ -56,6 +60,9 @@ class TranslateFile(Resource):
 
         # Attempt to translate the PDF file and handle potential errors
         try:
+            if stream:
+                Logger.info(f"Streaming translation with model={model}.")
+                return ndjson_response(self.translation_service.stream_file(file, model))
             Logger.info(f"Starting translation with model={model}.")
             result = self.translation_service.translate_file(file, model)
             Logger.info("Translation completed successfully.")
@@ -2,6 +2,7 @@ import json
 from flask import request
 from flask_restful import Resource
 from backend.app.services.translation import TranslationService
+from backend.app.services.translation.service_book_translation import iter_text_items, translate_text_items
 from backend.app.utils.util_logger import Logger
 
 class TranslatePage(Resource):
@@ -9,7 +10,7 @@ class TranslatePage(Resource):
     Handles translation requests by extracting the 'text' field from structured OCR data,
     translating it, encrypting the translated text (as a JSON string) and storing it in the
     MongoDB document under the 'translations' field. The decrypted (plain) translated text
-    is returned in the response.
+    is returned in the response. All text groups of the page are translated with one batched call.
     """
 
     def __init__(self, config_manager, cache_manager, mongo_manager, crypto_manager):
@@ -48,14 +49,13 @@ class TranslatePage(Resource):
             Logger.info(f"Processing translation for user={user}, page={page}, title={title}, model={model}.")
 
             # Check if translation already exists and return decrypted version if so
-            user_files_collection = self.config_manager.get_mongo_config().get("user_files_collection", "user_files")
+            user_text_collection = self.config_manager.get_mongo_config().get("user_text_collection", "user_texts")
             existing_translation = self.mongo_manager.retrieve_and_decrypt_translation(
                 user=user,
                 page=page,
                 title=title,
                 language=language,
-                user_files_collection=user_files_collection,
-                crypto_manager=self.crypto_manager
+                user_files_collection=user_text_collection
             )
 
             if existing_translation:
@@ -77,8 +77,7 @@ class TranslatePage(Resource):
                 user=user,
                 page=page,
                 title=title,
-                user_files_collection=user_files_collection,
-                crypto_manager=self.crypto_manager
+                user_files_collection=user_text_collection
             )
 
             if not source_data:
@@ -105,7 +104,7 @@ class TranslatePage(Resource):
             # Update the MongoDB document with the encrypted translation
             update_query = {"title": title, "page": page, "user": user}
             update_op = {"$set": {f"translations.{language}": encrypted_translation}}
-            update_result = self.mongo_manager.update_document(user_files_collection, update_query, update_op, upsert=True)
+            update_result = self.mongo_manager.update_document(user_text_collection, update_query, update_op, upsert=True)
 
             if update_result.matched_count == 0:
                 Logger.warning(f"No matching document found for query: {update_query}.")
@@ -126,8 +125,8 @@ class TranslatePage(Resource):
     def _extract_and_translate_text_blocks(self, text_data: list, model: str) -> list:
         """
         Processes a list of OCR-like blocks (each containing a "Block" with "Data"),
-        extracts each "text" list, translates it, and replaces the original words with
-        the translated words. Other metadata remains unchanged.
+        extracts each "text" list, translates all of them with one batched call, and replaces
+        the original words with the translated words. Other metadata remains unchanged.
 
         Example input (text_data):
         [
@@ -151,47 +150,6 @@ class TranslatePage(Resource):
             Logger.warning(f"Expected a list of blocks, got {type(text_data)}")
             return text_data
 
-        for block_dict in text_data:
-            if not isinstance(block_dict, dict):
-                Logger.warning("Skipping non-dict block item.")
-                continue
-
-            block_content = block_dict.get("Block")
-            if not isinstance(block_content, dict):
-                Logger.warning("Skipping block because 'Block' is missing or not a dict.")
-                continue
-
-            data_list = block_content.get("Data")
-            if not isinstance(data_list, list):
-                Logger.warning("Skipping block because 'Data' is missing or not a list.")
-                continue
-
-            for item in data_list:
-                if not isinstance(item, dict):
-                    continue
-
-                text_field = item.get("text")
-                if not isinstance(text_field, list):
-                    continue
-
-                # Convert the list of words into a single string
-                original_text = " ".join(text_field).strip()
-                if not original_text:
-                    Logger.debug("Skipping empty text block.")
-                    continue
-
-                Logger.debug(f"Original text to translate: '{original_text}'")
-                # Call the translation service
-                translated_result = self.translation_service.translate_text(model, original_text)
-                if isinstance(translated_result, list):
-                    joined_text = " ".join(translated_result)
-                else:
-                    joined_text = str(translated_result)
-
-                joined_text = joined_text.strip()
-                Logger.debug(f"Translated text: '{joined_text}'")
-                # Replace the text field with the translated words split into a list
-                item["text"] = joined_text.split(" ")
-
-        Logger.info("Successfully processed and translated all text blocks.")
+        counts = translate_text_items(self.translation_service, model, list(iter_text_items(text_data)))
+        Logger.info(f"Successfully translated {counts['segments']} text blocks ({counts['unique']} distinct) in one batch.")
         return text_data
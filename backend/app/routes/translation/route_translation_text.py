@@ -3,6 +3,7 @@ from flask_restful import Resource
 
 from backend.app.services.translation import TranslationService
 from backend.app.utils.util_logger import Logger  # Import the Logger class
+from backend.app.utils.util_streaming import ndjson_response
 
 class TranslateText(Resource):
     """
@@ -30,7 +31,8 @@ class TranslateText(Resource):
         Handles POST requests to translate plain text.
 
         Expects a JSON payload containing the text and model.
-        The translated result is returned in the response.
+        The translated result is returned in the response. With "stream": true in the payload,
+        the translation is streamed as NDJSON, one line per translated chunk.
 
         Returns:
             tuple: JSON response with translated text or error message, along with the HTTP status code.
@@ -48,6 +50,7 @@ class TranslateText(Resource):
         data = json_data['data']
         model = data.get('model')
         text = data.get('text')
+        stream = str(data.get('stream', False)).strip().lower() in ('true', '1', 'yes')
 
         # Validate required parameters.
         if not model or not text:
@@ -56,6 +59,9 @@ class TranslateText(Resource):
 
         # Attempt to perform text translation and handle potential errors.
         try:
+            if stream:
+                Logger.info(f"Streaming text translation with model={model}.")
+                return ndjson_response(self.translation_service.stream_text(model, text))
             Logger.info(f"Starting text translation with model={model}.")
             result = self.translation_service.translate_and_chunk_text(model, text)
             Logger.info("Text translation completed successfully.")
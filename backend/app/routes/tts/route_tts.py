@@ -2,6 +2,7 @@ from flask import request, send_file
 from flask_restful import Resource
 from backend.app.services.tts import TTSService
 from backend.app.utils.util_logger import Logger
+from backend.app.utils.util_streaming import audio_response
 
 class TTS(Resource):
     """
@@ -29,9 +30,10 @@ class TTS(Resource):
             - model (optional): The TTS model to use.
             - speaker (optional): The speaker identifier.
             - language (optional): The language code (default is 'de').
+            - stream (optional): If true, the audio is streamed segment by segment as it is synthesized.
 
         Returns:
-            A downloadable audio file (WAV format) on success,
+            A downloadable audio file (WAV format) on success, a chunked WAV stream in streaming mode,
             or a JSON error message with the appropriate HTTP status code.
         """
         Logger.info("POST request received for TTS.")
@@ -47,6 +49,7 @@ class TTS(Resource):
         model = data.get('model')  # Default model
         speaker = data.get('speaker', None)
         language = data.get('language', "de")
+        stream = str(data.get('stream', False)).strip().lower() in ('true', '1', 'yes')
 
         if not text:
             Logger.warning("Missing required 'text' parameter in the request.")
@@ -57,12 +60,18 @@ class TTS(Resource):
                 f"Starting TTS with text='{text[:30]}...' (truncated), model='{model}', speaker='{speaker}', language='{language}'."
             )
 
+            if stream:
+                Logger.info("Streaming TTS audio segment by segment.")
+                return audio_response(self.tts_service.stream_audio(text, model, speaker, language),
+                                      mimetype=self.config_manager.get_tts_mimetype())
+
             # Ensure all required parameters are passed to synthesize audio.
-            audio_buffer = self.tts_service.synthesize_audio(text, model, speaker, language)
+            # The audio is sent straight from its open blob file, which lets the server use sendfile.
+            audio_file = self.tts_service.synthesize_audio_file(text, model, speaker, language)
 
             Logger.info("TTS completed successfully. Returning audio file.")
             return send_file(
-                audio_buffer,
+                audio_file,
                 mimetype=self.config_manager.get_tts_mimetype(),
                 as_attachment=self.config_manager.get_tts_as_attachment(),
                 download_name=self.config_manager.get_tts_output_filename()
@@ -4,6 +4,7 @@ from flask_restful import Resource
 
 from backend.app.services.tts import TTSService
 from backend.app.utils.util_logger import Logger
+from backend.app.utils.util_streaming import audio_response
 
 
 class TTSPage(Resource):
@@ -31,6 +32,9 @@ class TTSPage(Resource):
           2. Otherwise, retrieves source text from the database,
              synthesizes new audio, encrypts and stores it in GridFS,
              and returns the newly synthesized audio.
+
+        With "stream": true in the payload, newly synthesized audio is streamed segment by segment
+        and stored in GridFS once the last segment has been sent.
         """
         Logger.info("Received POST request for TTS.")
         json_data = request.get_json()
@@ -45,6 +49,7 @@ class TTSPage(Resource):
         language = data.get("language", "en")
         model = data.get("model", "tts_models/multilingual/multi-dataset/xtts_v2")
         speaker = data.get("speaker", "Daisy Studious")
+        stream = str(data.get("stream", False)).strip().lower() in ("true", "1", "yes")
 
         if not user or page is None or not title:
             Logger.warning("Missing required parameters: user, page, or title.")
@@ -79,6 +84,17 @@ class TTSPage(Resource):
             text = self._extract_text_from_structure(source_data)
             Logger.info("Successfully extracted and formatted text for TTS synthesis.")
 
+            if stream:
+                Logger.info("Streaming new TTS audio segment by segment.")
+                return audio_response(
+                    self.tts_service.stream_audio(
+                        text, model, speaker, language,
+                        on_complete=lambda audio: self._encrypt_and_store_audio(user, page, title, language,
+                                                                                io.BytesIO(audio))
+                    ),
+                    mimetype=self.config_manager.get_tts_mimetype()
+                )
+
             # Generate new TTS audio.
             audio_buffer = self._synthesize_audio(text, model, speaker, language)
             Logger.info("New TTS audio synthesized successfully.")
@@ -0,0 +1,5 @@
+from .service_jobs import BookJobService
+
+__all__ = [
+    "BookJobService"
+]
\ No newline at end of file
@@ -0,0 +1,170 @@
+from backend.app.services.ocr.service_ocr import multi_reader
+from backend.app.services.translation import BookTranslationService
+from backend.app.services.translation.service_book_translation import get_dedup_ratio, iter_text_items
+from backend.app.services.tts import TTSService
+from backend.app.utils.util_batch_scheduler import PRIORITY_BULK
+from backend.app.utils.util_logger import Logger  # Import the Logger class
+
+
+class BookJobService:
+    """
+    Background job handlers for operations covering a whole book.
+
+    Every handler processes the pages of a book through JobContext.run, which records the completed
+    pages with the job, reports the progress and stops the job when it is cancelled. A job resumed
+    after a restart therefore only processes the pages that were not completed before.
+
+    Job types:
+        translate_book: Translates all pages (params: user, title, model).
+        tts_book: Renders and stores the TTS audio of all pages (params: user, title, optional language,
+            model, speaker).
+        ocr_book: Re-runs OCR on the uploaded images of all pages (params: user, title, optional model, language).
+    """
+
+    def __init__(self, config_manager, cache_manager, mongo_manager, crypto_manager, pages_per_step=8):
+        """
+        Args:
+            config_manager: Provides the MongoDB collection names.
+            cache_manager: Cache used by the translation and TTS services.
+            mongo_manager: MongoDBManager holding the books.
+            crypto_manager: Encrypts and decrypts the stored pages and audio.
+            pages_per_step (int): Pages processed between two progress updates (translation batches these pages).
+        """
+        self.config_manager = config_manager
+        self.mongo_manager = mongo_manager
+        self.crypto_manager = crypto_manager
+        self.pages_per_step = max(1, pages_per_step)
+        self.book_translation_service = BookTranslationService(config_manager, cache_manager, mongo_manager,
+                                                               crypto_manager)
+        self.tts_service = TTSService(config_manager, cache_manager)
+        mongo_config = config_manager.get_mongo_config()
+        self.user_text_collection = mongo_config.get("user_text_collection") or "user_texts"
+        self.user_files_collection = mongo_config.get("user_files_collection") or "user_files"
+        self.users_collection = mongo_config.get("users_collection") or "users"
+        Logger.info("BookJobService initialized.")
+
+    def register(self, job_manager):
+        """
+        Registers the book job handlers with the JobManager.
+
+        Args:
+            job_manager (JobManager): The job manager running the jobs.
+        """
+        job_manager.register_handler("translate_book", self.translate_book, ("user", "title", "model"))
+        job_manager.register_handler("tts_book", self.render_tts, ("user", "title"))
+        job_manager.register_handler("ocr_book", self.rerun_ocr, ("user", "title"))
+
+    def translate_book(self, job, context):
+        """
+        Translates the pages of a book, `pages_per_step` pages per BookTranslationService pass.
+
+        Returns:
+            dict: {"pages", "translated", "skipped", "segments", "unique_segments", "dedup_ratio"}
+                of the pages processed by this run.
+        """
+        params = job["params"]
+        user, title, model = params["user"], params["title"], params["model"]
+        language = params.get("language") or model.rsplit("-", 1)[-1]
+        totals = {"pages": 0, "translated": 0, "skipped": 0, "segments": 0, "unique_segments": 0}
+        memo = {}  # Segments repeated across steps (running headers, footers) are translated once per job
+
+        def translate(pages):
+            result = self.book_translation_service.translate_book(user, title, model, language, pages=pages,
+                                                                  memo=memo)
+            for key in totals:
+                totals[key] += result[key]
+
+        context.run(self._book_pages(user, title), translate, step=self.pages_per_step)
+        totals["dedup_ratio"] = get_dedup_ratio(totals["segments"], totals["unique_segments"])
+        return totals
+
+    def render_tts(self, job, context):
+        """
+        Synthesizes the audio of every page that has no stored audio in the language yet.
+
+        Returns:
+            dict: {"pages": pages of the book, "rendered": pages rendered by this run}.
+        """
+        params = job["params"]
+        user, title = params["user"], params["title"]
+        language = params.get("language") or "en"
+        model = params.get("model") or "tts_models/multilingual/multi-dataset/xtts_v2"
+        speaker = params.get("speaker") or "Daisy Studious"
+        pages = self._book_pages(user, title)
+        rendered = []
+
+        def render(chunk):
+            for page in chunk:
+                if self._render_tts_page(user, title, page, language, model, speaker):
+                    rendered.append(page)
+
+        context.run(pages, render)
+        return {"pages": len(pages), "rendered": len(rendered)}
+
+    def rerun_ocr(self, job, context):
+        """
+        Re-runs OCR on the uploaded image of every page and replaces the stored source text.
+        Stored translations of a page are removed, as they no longer match its new text.
+
+        Returns:
+            dict: {"pages": pages of the book, "recognized": pages recognized by this run}.
+        """
+        params = job["params"]
+        user, title = params["user"], params["title"]
+        model = params.get("model") or "doctr"
+        users = self.mongo_manager.find_documents(self.users_collection, {"Username": user})
+        if not users:
+            raise ValueError(f"User '{user}' not found")
+        documents = {doc.get("page"): doc for doc in
+                     self.mongo_manager.find_documents(self.user_text_collection, {"user": user, "title": title})}
+        recognized = []
+
+        def recognize(chunk):
+            for page in chunk:
+                self._rerun_ocr_page(users[0], documents[page], model, params.get("language"))
+                recognized.append(page)
+
+        context.run(sorted(documents), recognize)
+        return {"pages": len(documents), "recognized": len(recognized)}
+
+    def _book_pages(self, user, title):
+        """Returns the sorted page numbers of a book."""
+        documents = self.mongo_manager.find_documents(self.user_text_collection, {"user": user, "title": title})
+        if not documents:
+            raise ValueError(f"No pages found for title '{title}'")
+        return sorted(doc.get("page") for doc in documents)
+
+    def _render_tts_page(self, user, title, page, language, model, speaker):
+        """Synthesizes, encrypts and stores the audio of one page; returns False if nothing was rendered."""
+        if self.mongo_manager.retrieve_tts_audio_from_gridfs(user, page, title, language):
+            return False
+        source = self.mongo_manager.retrieve_and_decrypt_page(user, page, title, self.user_text_collection)
+        text = " ".join(" ".join(item["text"]) for item in iter_text_items(source)).strip()
+        if not text:
+            Logger.warning(f"[JOBS] No text to synthesize on page {page} of '{title}'.")
+            return False
+        audio_buffer = self.tts_service.synthesize_audio(text, model, speaker, language, PRIORITY_BULK)
+        encryption_dict = self.crypto_manager.encrypt_audio(user, audio_buffer.getvalue())
+        self.mongo_manager.store_tts_audio_in_gridfs(
+            query={"title": title, "page": page, "user": user, "language": language},
+            file_data=encryption_dict["Ciphertext"],
+            metadata={key: encryption_dict.get(key) for key in ("Nonce", "Tag", "Ephemeral_public_key_der")}
+        )
+        return True
+
+    def _rerun_ocr_page(self, user_doc, doc, model, language=None):
+        """Recognizes the uploaded image of a page again and stores the encrypted result."""
+        username = user_doc.get("Username")
+        files = self.mongo_manager.find_documents(self.user_files_collection, {"_id": doc.get("file_id")})
+        if not files:
+            raise ValueError(f"No uploaded file for page {doc.get('page')}")
+        language = language or (doc.get("text") or {}).get("language")
+        image = self.crypto_manager.decrypt_file(username, files[0]["file_lib"])
+        text = multi_reader(image, model, language=language)
+        if isinstance(text, tuple):
+            raise RuntimeError(f"OCR of page {doc.get('page')} failed: {text[0]}")
+        self.mongo_manager.update_document(
+            self.user_text_collection, {"_id": doc["_id"]},
+            {"$set": {"text.source": self.crypto_manager.encrypt_orc_text(user_doc, text), "text.language": language},
+             "$unset": {"translations": ""}}
+        )
@@ -1,8 +1,10 @@
 import hashlib
+import time
 from io import BytesIO
 
 from backend.app.synthesizers import STTSynthesizer
 from backend.app.utils.util_logger import Logger
+from backend.app.utils.util_single_flight import SingleFlight
 
 class SpeechToTextService:
     """
@@ -19,7 +21,7 @@ class SpeechToTextService:
         self.config_manager = config_manager
         self.cache_manager = cache_manager
         # Create a new instance of the Whisper synthesizer (pretrained model will be downloaded and cached locally)
-        self.synthesizer = STTSynthesizer(self.config_manager.get_stt_models(), self.config_manager)
+        self.synthesizer = STTSynthesizer(self.config_manager.get_stt_models(), self.cache_manager, self.config_manager)
         Logger.info("SpeechToTextService initialized.")
 
     def transcribe_audio(self, audio_file) -> str:
@@ -68,14 +70,34 @@ class SpeechToTextService:
 
         Logger.info(f"[CACHE MISS] No cache entry for key: {cache_key}")
 
+        # Concurrent requests for the same audio wait for the first transcription instead of repeating it.
+        return SingleFlight().do(cache_key, lambda: self._transcribe_and_cache(audio_buffer, cache_key))
+
+    def _transcribe_and_cache(self, audio_buffer: BytesIO, cache_key: str) -> str:
+        """
+        Runs the synthesizer on the audio buffer and caches the transcription.
+
+        Args:
+            audio_buffer (BytesIO): The WAV audio data.
+            cache_key (str): Cache key of the transcription.
+
+        Returns:
+            str: The transcribed text.
+        """
+        cached_transcription = self.cache_manager.get(cache_key, record_stats=False)
+        if cached_transcription:
+            return cached_transcription
+
         # Reset the buffer pointer so it can be processed.
         audio_buffer.seek(0)
 
         try:
+            started = time.perf_counter()
             transcription = self.synthesizer.transcribe(audio_buffer)
             self.cache_manager.set(cache_key, transcription)
+            self.cache_manager.record_compute_time(cache_key, time.perf_counter() - started)
             Logger.info(f"[CACHE SET] Stored transcription in cache for key: {cache_key}")
             return transcription
         except Exception as e:
             Logger.error(f"Error during STT transcription: {str(e)}")
-            raise
\ No newline at end of file
+            raise
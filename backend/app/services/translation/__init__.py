@@ -1,5 +1,7 @@
 from .service_translation import TranslationService
+from .service_book_translation import BookTranslationService
 
 __all__ = [
-    "TranslationService"
+    "TranslationService",
+    "BookTranslationService"
 ]
\ No newline at end of file
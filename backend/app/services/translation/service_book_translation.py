@@ -0,0 +1,179 @@
+import json
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from backend.app.services.translation.service_translation import TranslationService
+from backend.app.utils.util_batch_scheduler import PRIORITY_BULK, PRIORITY_INTERACTIVE
+from backend.app.utils.util_logger import Logger  # Import the Logger class
+
+
+def iter_text_items(text_data):
+    """
+    Yields the items of structured OCR page data whose "text" word list is not empty.
+
+    The page data is a list of blocks of the form
+    {"Block": {"Data": [{"text": ["Voter", "turnout", "was"], "size": 0.14}, ...], ...}}.
+    Invalid blocks and items are skipped.
+
+    Args:
+        text_data (list): OCR data of one page.
+
+    Yields:
+        dict: An item with a "text" list that can be translated in place.
+    """
+    if not isinstance(text_data, list):
+        Logger.warning(f"Expected a list of blocks, got {type(text_data)}")
+        return
+    for block_dict in text_data:
+        if not isinstance(block_dict, dict):
+            continue
+        block_content = block_dict.get("Block")
+        if not isinstance(block_content, dict):
+            continue
+        data_list = block_content.get("Data")
+        if not isinstance(data_list, list):
+            continue
+        for item in data_list:
+            if isinstance(item, dict) and isinstance(item.get("text"), list) and " ".join(item["text"]).strip():
+                yield item
+
+
+def normalize_segment(text):
+    """Returns the text with Unicode normalized (NFKC) and whitespace collapsed, the key used for deduplication."""
+    return ' '.join(unicodedata.normalize('NFKC', text).split())
+
+
+def get_dedup_ratio(segments, unique):
+    """Returns the share of segments that did not need their own translation (0.0 to 1.0)."""
+    return round(1 - unique / segments, 3) if segments else 0.0
+
+
+def translate_text_items(translation_service, model, items, memo=None, priority=PRIORITY_INTERACTIVE):
+    """
+    Translates the "text" word lists of OCR items with one batched call and writes the
+    translated words back into the items.
+
+    Items are deduplicated by normalized content, so running headers, footers and repeated
+    captions are translated once and fanned out to every item carrying them. Items without
+    letters (page numbers, figures) are left unchanged. Items of one page or of many pages can
+    be translated together.
+
+    Args:
+        translation_service (TranslationService): Service translating the segments.
+        model (str): Full translation model name (e.g., "Helsinki-NLP/opus-mt-en-de").
+        items (list): Items yielded by iter_text_items.
+        memo (dict, optional): Normalized segment -> translated words, shared between calls that
+            translate parts of the same book. New translations are added to it.
+        priority (str): Priority class of the translation (PRIORITY_BULK for whole books).
+
+    Returns:
+        dict: {"segments": number of items, "unique": distinct segments sent to the model}.
+    """
+    memo = {} if memo is None else memo
+    segments = [normalize_segment(" ".join(item["text"])) for item in items]
+    distinct = list(dict.fromkeys(
+        segment for segment in segments if segment not in memo and any(char.isalpha() for char in segment)
+    ))
+    if distinct:
+        for segment, translation in zip(distinct, translation_service.translate_segments(model, distinct, priority)):
+            memo[segment] = translation.strip().split(" ")
+    for item, segment in zip(items, segments):
+        if segment in memo:
+            # Replace the 'text' field with the translated words (as a list)
+            item["text"] = list(memo[segment])
+    return {"segments": len(items), "unique": len(distinct)}
+
+
+class BookTranslationService:
+    """
+    Translates every page of a book stored in MongoDB in one pipelined pass.
+
+    Pages are decrypted by a worker pool, the distinct text items of all pages are translated
+    together through TranslationService.translate_segments (batched generate calls shared with
+    other requests), the translated pages are encrypted by the worker pool and all translations
+    are written with a single bulk write.
+    """
+
+    def __init__(self, config_manager, cache_manager, mongo_manager, crypto_manager):
+        """
+        Args:
+            config_manager: Provides the MongoDB collection names and the worker count.
+            cache_manager: Cache used by the translation service.
+            mongo_manager: MongoDBManager holding the book pages.
+            crypto_manager: Encrypts the translated pages.
+        """
+        self.config_manager = config_manager
+        self.mongo_manager = mongo_manager
+        self.crypto_manager = crypto_manager
+        self.translation_service = TranslationService(config_manager, cache_manager)
+        Logger.info("BookTranslationService initialized.")
+
+    def translate_book(self, user, title, model, language, pages=None, memo=None):
+        """
+        Translates all pages of a book that have no translation in the target language yet.
+
+        Args:
+            user (str): Owner of the book.
+            title (str): Title of the book.
+            model (str): Full translation model name (e.g., "Helsinki-NLP/opus-mt-en-de").
+            language (str): Target language the translations are stored under (e.g., "de").
+            pages (list, optional): Page numbers to translate; all pages of the book if omitted.
+            memo (dict, optional): Segment translations shared between calls for parts of the book
+                (see translate_text_items).
+
+        Returns:
+            dict: {"pages": pages of the book, "translated": pages translated now,
+                   "skipped": pages already translated or without usable source text or text items,
+                   "segments": text items of the translated pages, "unique_segments": items sent
+                   to the model after deduplication, "dedup_ratio": share of items saved}.
+        """
+        started = time.perf_counter()
+        collection = self.config_manager.get_mongo_config().get("user_text_collection")
+        query = {"user": user, "title": title}
+        if pages is not None:
+            query["page"] = {"$in": list(pages)}
+        pages = self.mongo_manager.find_documents(collection, query)
+        todo = [doc for doc in pages if not (doc.get("translations") or {}).get(language)]
+        Logger.info(f"[BOOK] '{title}': {len(pages)} pages, {len(todo)} to translate into '{language}'.")
+        if not todo:
+            return {"pages": len(pages), "translated": 0, "skipped": len(pages),
+                    "segments": 0, "unique_segments": 0, "dedup_ratio": 0.0}
+
+        workers = max(1, self.config_manager.get_config_value('TRANSLATE', 'PIPELINE_WORKERS', int, default=4))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="book-pipeline") as executor:
+            sources = list(executor.map(lambda doc: self._decrypt_page(user, doc), todo))
+            # Pages without translatable text items get no translation document, as before.
+            page_items = [(doc, source, list(iter_text_items(source))) for doc, source in zip(todo, sources) if source]
+            translated = [(doc, source, items) for doc, source, items in page_items if items]
+
+            items = [item for _, _, items in translated for item in items]
+            counts = translate_text_items(self.translation_service, model, items, memo, PRIORITY_BULK)
+
+            encrypted = list(executor.map(
+                lambda source: self.crypto_manager.encrypt_string(user, json.dumps(source, ensure_ascii=False)),
+                [source for _, source, _ in translated]
+            ))
+
+        updates = [
+            ({"title": title, "page": doc.get("page"), "user": user},
+             {"$set": {f"translations.{language}": encrypted_translation}})
+            for (doc, _, _), encrypted_translation in zip(translated, encrypted)
+        ]
+        self.mongo_manager.bulk_update_documents(collection, updates, upsert=True)
+        dedup_ratio = get_dedup_ratio(counts["segments"], counts["unique"])
+        Logger.info(f"[BOOK] Translated {len(updates)} pages ({counts['segments']} text blocks, {counts['unique']} "
+                    f"distinct, dedup ratio {dedup_ratio:.1%}) of '{title}' in {time.perf_counter() - started:.1f}s.")
+        return {"pages": len(pages), "translated": len(updates), "skipped": len(pages) - len(updates),
+                "segments": counts["segments"], "unique_segments": counts["unique"], "dedup_ratio": dedup_ratio}
+
+    def _decrypt_page(self, user, doc):
+        """Decrypts the source text of a page document; returns None for pages that cannot be used."""
+        try:
+            source = self.mongo_manager.decrypt_page_document(user, doc)
+        except Exception as e:
+            Logger.warning(f"[BOOK] No usable source text for page {doc.get('page')}: {str(e)}")
+            return None
+        if not isinstance(source, (list, dict)):
+            Logger.error(f"Invalid source text format for page {doc.get('page')}. Expected list or dict.")
+            return None
+        return source
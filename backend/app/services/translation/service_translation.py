@@ -1,8 +1,13 @@
 import base64
 import hashlib
-from backend.app.translators import OpusMTTranslator
+import time
+from backend.app.translators import TranslatorPool
 from backend.app.utils import preprocess_text, split_text_into_chunks, join_and_split_translations, PDFProcessor
 from backend.app.utils.util_logger import Logger  # Import the Logger class
+from backend.app.utils.util_batch_scheduler import BatchScheduler, PRIORITY_INTERACTIVE
+from backend.app.utils.util_single_flight import SingleFlight
+from backend.app.utils.util_text_manager import split_into_sentences
+from backend.app.utils.util_translation_memory import TranslationMemory
 
 class TranslationService:
     """
@@ -50,6 +55,27 @@ class TranslationService:
         else:
             Logger.info(f"[CACHE MISS] No cache entry for: {cache_key}")
 
+        # Concurrent requests for the same file wait for the first translation instead of repeating it.
+        return SingleFlight().do(cache_key, lambda: self._translate_file_uncached(file, model, cache_key))
+
+    def _translate_file_uncached(self, file, model, cache_key):
+        """
+        Extracts and translates every page of a PDF and caches the result.
+
+        Args:
+            file (str): Base64-encoded PDF file.
+            model (str): Full translation model name.
+            cache_key (str): Cache key of the file translation.
+
+        Returns:
+            list: List of translated pages if successful.
+            dict: Error message and HTTP status code if text extraction fails.
+        """
+        cached_translation = self.cache_manager.get(cache_key, record_stats=False)
+        if cached_translation:
+            return cached_translation
+
+        started = time.perf_counter()
         file_content = base64.b64decode(file)
         extracted_text = PDFProcessor.extract_text_from_pdf(file_content)
 
@@ -64,10 +90,91 @@ class TranslationService:
             translated_pages.append(translated_text)
 
         self.cache_manager.set(cache_key, translated_pages)
+        self.cache_manager.record_compute_time(cache_key, time.perf_counter() - started)
         Logger.info(f"[CACHE SET] Storing PDF in cache: {cache_key}")
 
         return translated_pages
 
+    def stream_file(self, file, model):
+        """
+        Translates a base64-encoded PDF file and yields every page as soon as it is translated.
+
+        Pages are extracted one at a time, so only the current page's text and the translated
+        pages are held in memory. The complete result is cached like translate_file() does.
+
+        Args:
+            file (str): Base64-encoded PDF file.
+            model (str): Full translation model name (e.g., "Helsinki-NLP/opus-mt-en-de").
+
+        Yields:
+            dict: {"page": page number starting at 1, "translation": translated page}.
+        """
+        file_hash = hashlib.md5(file.encode()).hexdigest()
+        cache_key = f"{model}-{file_hash}"
+
+        cached_translation = self.cache_manager.get(cache_key)
+        if cached_translation:
+            Logger.info(f"[CACHE HIT] Streaming cached PDF: {cache_key}")
+            for i, page in enumerate(cached_translation):
+                yield {"page": i + 1, "translation": page}
+            return
+
+        Logger.info(f"[CACHE MISS] No cache entry for: {cache_key}")
+        started = time.perf_counter()
+        translated_pages = []
+        for i, page in enumerate(PDFProcessor.iter_text_from_pdf(base64.b64decode(file))):
+            Logger.debug(f"Translating page {i + 1}.")
+            translated_text = self.translate_and_chunk_text(model, page)
+            translated_pages.append(translated_text)
+            yield {"page": i + 1, "translation": translated_text}
+
+        if translated_pages:
+            self.cache_manager.set(cache_key, translated_pages)
+            self.cache_manager.record_compute_time(cache_key, time.perf_counter() - started)
+            Logger.info(f"[CACHE SET] Storing PDF in cache: {cache_key}")
+
+    def stream_text(self, model, text):
+        """
+        Translates plain text and yields every chunk as soon as it is translated.
+
+        Each chunk goes through translate_and_chunk_text(), so chunks use the cache and the
+        translation memory; the joined translation is cached under the key of the whole text.
+
+        Args:
+            model (str): Full translation model name (e.g., "Helsinki-NLP/opus-mt-en-de").
+            text (str): Text to be translated.
+
+        Yields:
+            dict: {"index": chunk index, "total": number of chunks, "translation": translated chunk}.
+
+        Raises:
+            ValueError: If the translation model is not supported.
+        """
+        text = preprocess_text(text)
+        cache_key = f"{model}-{hashlib.md5(text.encode()).hexdigest()}"
+
+        cached_translation = self.cache_manager.get(cache_key)
+        if cached_translation:
+            Logger.info(f"[CACHE HIT] Streaming cached text: {cache_key}")
+            yield {"index": 0, "total": 1, "translation": cached_translation}
+            return
+
+        Logger.info(f"[CACHE MISS] No cache entry for: {cache_key}")
+        started = time.perf_counter()
+        tokenizer = self._load_tokenizer(model)
+        max_token = self.config_manager.get_config_value('TEXT', 'MAX_TOKEN', int)
+        chunks = split_text_into_chunks(tokenizer, text, max_token, preprocessed=True)
+
+        translated_chunks = []
+        for i, chunk in enumerate(chunks):
+            translated_chunk = self.translate_and_chunk_text(model, chunk)
+            translated_chunks.append(translated_chunk)
+            yield {"index": i, "total": len(chunks), "translation": translated_chunk}
+
+        self.cache_manager.set(cache_key, join_and_split_translations(translated_chunks))
+        self.cache_manager.record_compute_time(cache_key, time.perf_counter() - started)
+        Logger.info(f"[CACHE SET] Storing text translation in cache: {cache_key}")
+
     def translate_and_chunk_text(self, model, text):
         """
         Translates plain text using the specified translation model.
@@ -93,23 +200,98 @@ class TranslationService:
         else:
             Logger.info(f"[CACHE MISS] No cache entry for: {cache_key}")
 
-        # Load the tokenizer using the provided model.
-        tokenizer = OpusMTTranslator.load_tokenizer(model)
-        max_token = self.config_manager.get_config_value('TEXT', 'MAX_TOKEN', int)
-        chunks = split_text_into_chunks(tokenizer, text, max_token)
+        # Concurrent requests for the same text wait for the first translation instead of repeating it.
+        return SingleFlight().do(cache_key, lambda: self._translate_and_chunk_text_uncached(model, text, cache_key))
 
-        translated_chunks = []
-        for chunk in chunks:
-            Logger.debug(f"Translating chunk: {chunk[:50]}...")  # Log first 50 characters of the chunk.
-            translated_chunk = self.translate_text(model, chunk)
-            translated_chunks.append(translated_chunk)
+    def _translate_and_chunk_text_uncached(self, model, text, cache_key):
+        """
+        Translates preprocessed text and caches the joined result.
+
+        By default the text is split into token-bounded chunks that are translated as a whole.
+        With [TRANSLATE] TRANSLATION_MEMORY enabled, the text is translated sentence by sentence
+        and only sentences missing from the translation memory reach the model; this trades the
+        context between sentences for reuse of repeated sentences.
+
+        Args:
+            model (str): Full translation model name.
+            text (str): Preprocessed text to translate.
+            cache_key (str): Cache key of the text translation.
+
+        Returns:
+            list: Translated text.
+
+        Raises:
+            ValueError: If the text is empty.
+        """
+        cached_translation = self.cache_manager.get(cache_key, record_stats=False)
+        if cached_translation:
+            return cached_translation
+
+        started = time.perf_counter()
+        if self._use_translation_memory():
+            sentences = split_into_sentences(text)
+            if not sentences:
+                raise ValueError("Input text cannot be empty.")
+            translated_chunks = TranslationMemory(self.cache_manager).translate(
+                model, sentences, lambda sentences: self._translate_sentences(model, sentences)
+            )
+        else:
+            # Load the tokenizer using the provided model.
+            tokenizer = self._load_tokenizer(model)
+            max_token = self.config_manager.get_config_value('TEXT', 'MAX_TOKEN', int)
+            chunks = split_text_into_chunks(tokenizer, text, max_token, preprocessed=True)
+            translated_chunks = self.translate_segments(model, chunks)
 
         translated_text = join_and_split_translations(translated_chunks)
         self.cache_manager.set(cache_key, translated_text)
+        self.cache_manager.record_compute_time(cache_key, time.perf_counter() - started)
         Logger.info(f"[CACHE SET] Storing text translation in cache: {cache_key}")
 
         return translated_text
 
+    def _use_translation_memory(self):
+        """Returns True if texts are translated through the sentence-level translation memory."""
+        enabled = self.config_manager.get_config_value('TRANSLATE', 'TRANSLATION_MEMORY', str, default='False')
+        return str(enabled).strip().lower() in ('true', '1', 'yes')
+
+    def _translate_sentences(self, model, sentences):
+        """
+        Translates sentences that are not in the translation memory.
+
+        Args:
+            model (str): Full translation model name.
+            sentences (list): Unseen sentences.
+
+        Returns:
+            list: One translated string per sentence.
+
+        Raises:
+            ValueError: If the translation model is not supported.
+        """
+        # Fail early with "Unsupported translation model" if the model cannot be loaded.
+        self._load_tokenizer(model)
+        return self.translate_segments(model, sentences)
+
+    def translate_segments(self, model, segments, priority=PRIORITY_INTERACTIVE):
+        """
+        Translates several segments (sentences or chunks) with batched generate calls.
+
+        The segments are queued in the model's BatchScheduler queue, so segments of concurrent
+        requests for the same model are translated in shared micro-batches.
+
+        Args:
+            model (str): Full translation model name (e.g., "Helsinki-NLP/opus-mt-en-de").
+            segments (list): Texts to translate.
+            priority (str): Priority class; interactive segments run before queued bulk segments.
+
+        Returns:
+            list: One translated string per segment, in the original order.
+        """
+        batch_size = self.config_manager.get_config_value('TRANSLATE', 'BATCH_SIZE', int, default=16)
+        translator = self._get_translator(model)
+        return BatchScheduler().submit(translator.registry_key, segments,
+                                       lambda batch: translator.translate_batch(batch, batch_size), priority)
+
     def translate_text(self, model, text):
         """
         Helper method to perform the actual text translation using the specified model.
@@ -121,6 +303,22 @@ class TranslationService:
         Returns:
             list or str: Translated text.
         """
-        # Instantiate the translator using the full model name.
-        translator = OpusMTTranslator(model, self.cache_manager, self.config_manager.get_torch_device())
-        return translator.translate(text)
+        return self._get_translator(model).translate(text)
+
+    def _load_tokenizer(self, model):
+        """
+        Returns the tokenizer of the model's configured engine, loading the model if needed.
+
+        Raises:
+            ValueError: If the translation model is not supported.
+        """
+        try:
+            return self._get_translator(model).get_tokenizer()
+        except Exception as e:
+            Logger.error(f"Failed to load tokenizer for model '{model}': {str(e)}")
+            raise ValueError("Unsupported translation model") from e
+
+    def _get_translator(self, model):
+        """Returns the pooled translator of the model with its configured engine and quantization."""
+        return TranslatorPool().get(model, self.cache_manager, self.config_manager.get_torch_device(),
+                                    self.config_manager.get_translation_engine_config(model))
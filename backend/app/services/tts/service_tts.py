@@ -1,11 +1,20 @@
 import hashlib
+import time
+import wave
 from io import BytesIO
-from backend.app.synthesizers.synthezier_coqui import TTSSynthesizer
+from backend.app.synthesizers.synthezier_coqui import TTSSynthesizer, get_tts_model_key
+from backend.app.utils.util_batch_scheduler import PRIORITY_INTERACTIVE
+from backend.app.utils.util_blob_store import BlobStore
 from backend.app.utils.util_logger import Logger
+from backend.app.utils.util_priority_gate import PriorityGate
+from backend.app.utils.util_single_flight import SingleFlight
+from backend.app.utils.util_streaming import wav_stream_header
 
 class TTSService:
     """
     Provides text-to-speech functionality with caching support.
+
+    Generated audio is written to the content-addressed BlobStore; the cache only keeps its digest.
     """
     def __init__(self, config_manager, cache_manager):
         """
@@ -21,7 +30,7 @@ class TTSService:
         self.synthesizer = None
         Logger.info("TTSService initialized.")
 
-    def synthesize_audio(self, text, model, speaker=None, language="de"):
+    def synthesize_audio(self, text, model, speaker=None, language="de", priority=PRIORITY_INTERACTIVE):
         """
         Synthesizes text into speech and returns the result as a BytesIO object.
 
@@ -30,6 +39,7 @@ class TTSService:
             model (str): The TTS model to use.
             speaker (str, optional): The speaker voice to use (if applicable).
             language (str, optional): The language for synthesis (default is "de").
+            priority (str, optional): Priority class of the synthesis; book-wide renders pass PRIORITY_BULK.
 
         Returns:
             BytesIO: The generated speech audio.
@@ -38,6 +48,149 @@ class TTSService:
             ValueError: If the input text is empty or contains only whitespace.
             Exception: Propagates any exception encountered during synthesis.
         """
+        with self._open_audio(text, model, speaker, language, priority) as audio_file:
+            audio_buffer = BytesIO(audio_file.read())
+        audio_buffer.seek(0)
+        return audio_buffer
+
+    def synthesize_audio_file(self, text, model, speaker=None, language="de"):
+        """
+        Synthesizes text into speech and returns the cached audio file opened for reading, so it can
+        be sent without copying it into memory. The open file stays readable if the blob is garbage
+        collected while it is sent.
+
+        Args:
+            text (str): The text to convert to speech.
+            model (str): The TTS model to use.
+            speaker (str, optional): The speaker voice to use (if applicable).
+            language (str, optional): The language for synthesis (default is "de").
+
+        Returns:
+            BinaryIO: The open audio blob, or a buffer for audio cached before the blob store existed.
+        """
+        return self._open_audio(text, model, speaker, language)
+
+    def _open_audio(self, text, model, speaker, language, priority=PRIORITY_INTERACTIVE):
+        """
+        Opens the cached or newly synthesized audio. If the blob is garbage collected between the
+        lookup and opening it, the audio is looked up (and synthesized) once more.
+
+        Returns:
+            BinaryIO: The open audio blob, or a buffer for audio cached before the blob store existed.
+        """
+        for _ in range(2):
+            audio = self._get_or_synthesize(text, model, speaker, language, priority)
+            if isinstance(audio, bytes):
+                return BytesIO(audio)
+            try:
+                return open(audio, "rb")
+            except FileNotFoundError:
+                Logger.warning(f"[BLOB STORE] Audio blob {audio} was removed before it could be opened.")
+        raise FileNotFoundError("The audio blob was removed before it could be opened.")
+
+    def _get_or_synthesize(self, text, model, speaker, language, priority=PRIORITY_INTERACTIVE):
+        """
+        Looks up the audio in the cache and synthesizes it on a miss.
+
+        Returns:
+            str or bytes: Path of the audio blob, or raw bytes for entries cached before the blob store existed.
+        """
+        language_param, cache_key = self._get_cache_key(text, model, speaker, language)
+
+        cached_audio = self._resolve(self.cache_manager.get(cache_key))
+        if cached_audio:
+            Logger.info(f"[CACHE HIT] Returning cached audio for key: {cache_key}")
+            return cached_audio
+
+        Logger.info(f"[CACHE MISS] No cache entry for key: {cache_key}")
+
+        # Concurrent requests for the same audio wait for the first synthesis instead of repeating it.
+        return SingleFlight().do(
+            cache_key, lambda: self._synthesize_and_cache(text, model, speaker, language_param, cache_key, priority)
+        )
+
+    def stream_audio(self, text, model, speaker=None, language="de", priority=PRIORITY_INTERACTIVE,
+                     on_complete=None):
+        """
+        Synthesizes text into speech and yields the audio as soon as each segment is generated.
+
+        On a cache miss, the first chunk is a WAV header of unknown length (see wav_stream_header),
+        followed by the PCM frames of every segment; the model is held per segment, so other callers
+        can use it between two segments. The complete audio is cached afterwards like the audio of
+        synthesize_audio(). Cached audio is yielded as one complete WAV file.
+
+        Args:
+            text (str): The text to convert to speech.
+            model (str): The TTS model to use.
+            speaker (str, optional): The speaker voice to use (if applicable).
+            language (str, optional): The language for synthesis (default is "de").
+            priority (str, optional): Priority class of the synthesis.
+            on_complete (Callable[[bytes], None], optional): Called with the complete WAV audio after the last chunk.
+
+        Yields:
+            bytes: The audio chunks.
+
+        Raises:
+            ValueError: If the input text is empty or no audio was synthesized.
+        """
+        language_param, cache_key = self._get_cache_key(text, model, speaker, language)
+
+        cached_audio = self._resolve(self.cache_manager.get(cache_key))
+        if cached_audio:
+            Logger.info(f"[CACHE HIT] Streaming cached audio for key: {cache_key}")
+            if not isinstance(cached_audio, bytes):
+                with open(cached_audio, "rb") as audio_file:
+                    cached_audio = audio_file.read()
+            yield cached_audio
+            if on_complete:
+                on_complete(cached_audio)
+            return
+
+        Logger.info(f"[CACHE MISS] Streaming synthesis for key: {cache_key}")
+        started = time.perf_counter()
+        synthesizer = self.synthesizer if self.synthesizer is not None else TTSSynthesizer(self.config_manager, self.cache_manager)
+        segments = synthesizer.iter_segment_audio(text, model, speaker, language_param)
+        model_key = get_tts_model_key(model)
+        params, frames = None, []
+        while True:
+            with PriorityGate().hold(model_key, priority):
+                audio_buffer = next(segments, None)
+            if audio_buffer is None:
+                break
+            with wave.open(audio_buffer, "rb") as wave_file:
+                if params is None:
+                    params = wave_file.getparams()
+                    yield wav_stream_header(params.nchannels, params.sampwidth, params.framerate)
+                pcm = wave_file.readframes(wave_file.getnframes())
+            frames.append(pcm)
+            yield pcm
+        if params is None:
+            raise ValueError("No audio was synthesized for the given text.")
+
+        # Store the complete audio as a blob and cache only its digest.
+        combined_audio = BytesIO()
+        with wave.open(combined_audio, "wb") as combined_wave:
+            combined_wave.setparams(params)
+            combined_wave.writeframes(b"".join(frames))
+        audio = combined_audio.getvalue()
+        digest = BlobStore().put(audio)
+        self.cache_manager.set(cache_key, digest)
+        self.cache_manager.record_compute_time(cache_key, time.perf_counter() - started)
+        Logger.info(f"[CACHE SET] Stored streamed audio blob {digest} in cache for key: {cache_key}")
+        if on_complete:
+            on_complete(audio)
+
+    @staticmethod
+    def _get_cache_key(text, model, speaker, language):
+        """
+        Validates the text and builds the cache key of its audio.
+
+        Returns:
+            tuple: (language passed to the model, None for monolingual models; cache key).
+
+        Raises:
+            ValueError: If the input text is empty or contains only whitespace.
+        """
         if not text or not text.strip():
             Logger.error("Invalid input: Text cannot be empty or whitespace only.")
             raise ValueError("Text cannot be empty or whitespace only.")
@@ -50,31 +203,59 @@ class TTSService:
 
         # Build cache key based on model, speaker, language, and text hash.
         text_hash = hashlib.md5(text.encode()).hexdigest()
-        cache_key = f"tts-{model}-{speaker}-{language_param}-{text_hash}"
+        return language_param, f"tts-{model}-{speaker}-{language_param}-{text_hash}"
 
-        cached_audio = self.cache_manager.get(cache_key)
-        if cached_audio:
-            Logger.info(f"[CACHE HIT] Returning cached audio for key: {cache_key}")
-            audio_buffer = BytesIO(cached_audio)
-            audio_buffer.seek(0)
-            return audio_buffer
+    @staticmethod
+    def _resolve(cached_audio):
+        """
+        Maps a cache entry to the audio it refers to.
 
-        Logger.info(f"[CACHE MISS] No cache entry for key: {cache_key}")
+        Returns:
+            str or bytes or None: The blob path for a digest, raw bytes for legacy entries,
+            or None if there is no entry or its blob was garbage collected.
+        """
+        if isinstance(cached_audio, str):
+            return BlobStore().path(cached_audio)
+        return cached_audio or None
+
+    def _synthesize_and_cache(self, text, model, speaker, language, cache_key, priority=PRIORITY_INTERACTIVE):
+        """
+        Runs the synthesizer and caches the generated audio.
+
+        Args:
+            text (str): The text to convert to speech.
+            model (str): The TTS model to use.
+            speaker (str): The speaker voice to use (if applicable).
+            language (str): The language passed to the model (None for monolingual models).
+            cache_key (str): Cache key of the audio.
+            priority (str): Priority class for the model; interactive requests are admitted before bulk renders.
+
+        Returns:
+            str: Path of the blob holding the generated WAV audio.
+        """
+        cached_audio = self._resolve(self.cache_manager.get(cache_key, record_stats=False))
+        if cached_audio:
+            return cached_audio
 
         try:
             # Use an already assigned synthesizer if available (e.g., injected by tests),
             # otherwise create a new TTSSynthesizer instance.
+            started = time.perf_counter()
             synthesizer = self.synthesizer if self.synthesizer is not None else TTSSynthesizer(self.config_manager, self.cache_manager)
 
-            # Synthesize audio using text, model, speaker, and language.
-            audio_buffer = synthesizer.synthesize(text, model, speaker, language_param)
+            # Synthesize audio using text, model, speaker, and language, one caller per model at a time.
+            with PriorityGate().hold(get_tts_model_key(model), priority):
+                audio_buffer = synthesizer.synthesize(text, model, speaker, language)
 
-            # Rewind the buffer before caching and returning.
+            # Store the audio as a blob and cache only its digest.
             audio_buffer.seek(0)
-            self.cache_manager.set(cache_key, audio_buffer.getvalue())
-            Logger.info(f"[CACHE SET] Stored audio in cache for key: {cache_key}")
+            blob_store = BlobStore()
+            digest = blob_store.put(audio_buffer.getvalue())
+            self.cache_manager.set(cache_key, digest)
+            self.cache_manager.record_compute_time(cache_key, time.perf_counter() - started)
+            Logger.info(f"[CACHE SET] Stored audio blob {digest} in cache for key: {cache_key}")
 
-            return audio_buffer
+            return blob_store.path(digest)
         except Exception as e:
             Logger.error(f"Error during TTS synthesis: {str(e)}")
             raise
@@ -1,11 +1,13 @@
 from .start_configure import create_app
 from .start_execute_unit_tests import run_tests
+from .start_jobs import start_jobs
 from .start_preload import preload_models
 from .start_register_routes import register_routes
 
 __all__ = [
     "create_app",
     "run_tests",
+    "start_jobs",
     "preload_models",
     "register_routes"
 ]
\ No newline at end of file
@@ -4,8 +4,11 @@ from flask import Flask
 from flask_cors import CORS
 import torch
 
-from backend.app.utils import ConfigManager, CacheManager, CryptoManager
+from backend.app.utils import ConfigManager, CacheManager, CryptoManager, ModelRegistry, BlobStore, BatchScheduler, \
+    JobManager
 from backend.app.utils.util_mongo_manager import MongoDBManager
+from backend.app.utils.util_cache_codec import CacheCodec
+from backend.app.utils.util_cache_store import MongoCacheStore
 from backend.app.utils.util_logger import Logger
 
 
@@ -32,16 +35,51 @@ def create_app(config_path='./config/config.ini'):
     # Initialize configuration manager.
     config_manager = ConfigManager()
 
-    # Initialize cache manager using configured maximum entries and clear cache on startup.
-    max_entries = config_manager.get_config_value('CACHE', 'MAX_ENTRIES', int)
-    cache_manager = CacheManager(maxsize=max_entries, clear_cache_on_start=True)
+    # Initialize cache manager using the configured persistent store. With WARM_START the persisted entries
+    # are validated against the cache version and model revisions and reloaded instead of being cleared.
+    cache_config = config_manager.get_cache_config()
+    cache_manager = CacheManager(
+        cache_file=cache_config['store_path'],
+        maxsize=cache_config['max_entries'],
+        clear_cache_on_start=not cache_config['warm_start'],
+        store_max_entries=cache_config['store_max_entries'],
+        compaction_interval=cache_config['compaction_interval'],
+        namespace_budgets=cache_config['namespace_budgets'],
+        cache_version=cache_config['cache_version'],
+        version_tags=cache_config['version_tags'],
+        codec=CacheCodec(cache_config['compression'], cache_config['compression_min_bytes'],
+                         cache_config['compression_level'])
+    )
     crypto_manager = CryptoManager(config_manager)
-    Logger.info(f"CacheManager initialized with max size: {max_entries}")
+    Logger.info(f"CacheManager initialized with max size: {cache_config['max_entries']}")
+
+    # Large binary results (synthesized audio) are stored as content-addressed files.
+    BlobStore(directory=cache_config['blob_path'], max_bytes=cache_config['blob_max_bytes'])
+
+    # Initialize the model registry that owns all translation, TTS and STT models.
+    model_config = config_manager.get_model_registry_config()
+    ModelRegistry(ram_budget_bytes=model_config['ram_budget_bytes'], idle_timeout=model_config['idle_timeout'])
+
+    # Concurrent translation requests share generate calls through per-model micro-batches.
+    scheduler_config = config_manager.get_batch_scheduler_config()
+    BatchScheduler(max_wait_ms=scheduler_config['max_wait_ms'], max_batch_size=scheduler_config['max_batch_size'])
 
     # Initialize MongoDB manager.
     mongo_manager = MongoDBManager(crypto_manager)
     Logger.info("MongoDBManager initialized.")
 
+    # Book-wide operations run as background jobs persisted in MongoDB.
+    job_config = config_manager.get_job_config()
+    JobManager(mongo_manager.db[job_config['collection']], workers=job_config['workers'],
+               poll_interval=job_config['poll_interval'], lease_seconds=job_config['lease_seconds'])
+
+    # Share translation, TTS and STT results between all workers through MongoDB.
+    if cache_config['shared_tier'] == 'mongo':
+        cache_manager.attach_shared_tier(
+            MongoCacheStore(mongo_manager.db[cache_config['shared_collection']], ttl_seconds=cache_config['shared_ttl']),
+            max_item_bytes=cache_config['shared_max_item_bytes']
+        )
+
     # Configure Flask settings.
     max_content_length_mb = config_manager.get_config_value('REST', 'MAX_CONTENT_LENGTH_MB', int, default=10)
     app.config['MAX_CONTENT_LENGTH'] = max_content_length_mb * 1024 * 1024
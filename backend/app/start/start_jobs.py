@@ -0,0 +1,22 @@
+from backend.app.services.jobs import BookJobService
+from backend.app.utils.util_job_manager import JobManager
+from backend.app.utils.util_logger import Logger
+
+
+def start_jobs(config_manager, cache_manager, mongo_manager, crypto_manager):
+    """
+    Registers the background job handlers and starts the job workers. Jobs interrupted by the
+    previous shutdown are resumed.
+
+    Args:
+        config_manager (ConfigManager): Provides configuration settings.
+        cache_manager (CacheManager): Cache used by the job services.
+        mongo_manager (MongoDBManager): MongoDB manager holding the books.
+        crypto_manager (CryptoManager): Encrypts and decrypts the stored pages.
+    """
+    job_manager = JobManager()
+    job_config = config_manager.get_job_config()
+    BookJobService(config_manager, cache_manager, mongo_manager, crypto_manager,
+                   pages_per_step=job_config['pages_per_step']).register(job_manager)
+    job_manager.start()
+    Logger.info(f"[Jobs] Job workers started for job types: {', '.join(job_manager.get_job_types())}.")
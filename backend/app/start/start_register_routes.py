@@ -1,6 +1,7 @@
-from backend.app.routes.docker import HealthCheck
+from backend.app.routes.docker import HealthCheck, CacheStats
 from backend.app.routes.file import DownloadFile, GetBookInfo, UploadFile, DeleteFile, GetBookPage, GetBookTranslations, \
     GetBookLanguage, DeleteBook
+from backend.app.routes.jobs import SubmitJob, JobStatus
 from backend.app.routes.ocr import ReadFile
 from backend.app.routes.stt import SpeechToText
 from backend.app.routes.translation import TranslatePage, TranslateAllPages, TranslateFile, TranslateText, \
@@ -165,6 +166,21 @@ def register_routes(api, config_manager, cache_manager, mongo_manager, crypto_ma
     )
     Logger.info("Registered route: /stt -> SpeechToText")
 
+    # Background job endpoints
+    api.add_resource(
+        SubmitJob,
+        '/jobs',
+        resource_class_kwargs={'config_manager': config_manager}
+    )
+    Logger.info("Registered route: /jobs -> SubmitJob")
+
+    api.add_resource(
+        JobStatus,
+        '/jobs/<string:job_id>',
+        resource_class_kwargs={'config_manager': config_manager}
+    )
+    Logger.info("Registered route: /jobs/<job_id> -> JobStatus")
+
     # Docker Healthcheck Endpoint
     api.add_resource(
         HealthCheck,
@@ -173,6 +189,14 @@ def register_routes(api, config_manager, cache_manager, mongo_manager, crypto_ma
     )
     Logger.info("Registered route: /health -> HealthCheck")
 
+    # Cache Statistics Endpoint
+    api.add_resource(
+        CacheStats,
+        '/stats',
+        resource_class_kwargs={'config_manager': config_manager, 'cache_manager': cache_manager}
+    )
+    Logger.info("Registered route: /stats -> CacheStats")
+
     # User-related endpoints
     api.add_resource(
         LoginUser,
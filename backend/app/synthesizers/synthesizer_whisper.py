@@ -6,6 +6,29 @@ import whisper
 
 from backend.app.utils import preprocess_audio, ConfigManager
 from backend.app.utils.util_logger import Logger
+from backend.app.utils.util_model_registry import ModelRegistry
+
+
+def get_stt_model_key(model_name: str) -> str:
+    """Returns the ModelRegistry key of an STT model."""
+    return f"stt:{model_name.strip()}"
+
+
+def load_stt_model(model_name: str, device: str):
+    """
+    Loads a Whisper model on the given device.
+
+    Args:
+        model_name (str): The Whisper model name (e.g., "turbo").
+        device (str): Torch device (e.g., "cpu" or "cuda").
+
+    Returns:
+        whisper.Whisper: The loaded model.
+    """
+    Logger.info(f"Loading Whisper model '{model_name}' on {device}...")
+    model = whisper.load_model(model_name, device=device, download_root="/models")
+    Logger.info(f"Whisper model '{model_name}' loaded successfully on {device}.")
+    return model
 
 
 class STTSynthesizer:
@@ -21,29 +44,17 @@ class STTSynthesizer:
 
         Args:
             model_name (str): The Whisper model name to load (default: "turbo").
-            cache_manager: Optional CacheManager instance for caching the model.
+            cache_manager: Optional CacheManager instance (models are held by the ModelRegistry).
         """
-        self.model = None
         self.model_name = model_name
         self.cache_manager = cache_manager
         self.device = config_manger.get_torch_device()
         Logger.info(f"STTSynthesizer initialized with model '{model_name}' on {self.device}. Model will be loaded on first use.")
 
     def _load_model(self):
-        """Loads the Whisper model from cache or disk."""
-        if self.model is None:
-            cache_key = f"stt_model-{self.model_name}"
-            if self.cache_manager:
-                self.model = self.cache_manager.get(cache_key)
-                if self.model:
-                    Logger.info(f"STT model '{self.model_name}' loaded from cache.")
-
-            if self.model is None:
-                Logger.info(f"Loading Whisper model '{self.model_name}' on {self.device}...")
-                self.model = whisper.load_model(self.model_name, device=self.device, download_root="/models")  # 📌 GPU-Modus aktiv
-                Logger.info(f"Whisper model '{self.model_name}' loaded successfully on {self.device}.")
-                if self.cache_manager:
-                    self.cache_manager.set(cache_key, self.model)
+        """Returns a context manager yielding the Whisper model pinned in the ModelRegistry."""
+        return ModelRegistry().acquire(get_stt_model_key(self.model_name),
+                                       lambda: load_stt_model(self.model_name, self.device))
 
     def transcribe(self, audio_buffer: io.BytesIO) -> str:
         """
@@ -55,10 +66,6 @@ class STTSynthesizer:
         Returns:
             str: Transcribed text.
         """
-        # 📌 Sicherstellen, dass das Modell geladen wurde
-        if self.model is None:
-            self._load_model()
-
         # 📌 Temporäre WAV-Datei für Whisper erstellen
         temp_wav = "temp_audio.wav"
         try:
@@ -72,7 +79,8 @@ class STTSynthesizer:
             processed_audio = processed_audio.astype(np.float32)  # 🔥 Float32 für Whisper
 
             # 📌 Transkription mit Whisper
-            result = self.model.transcribe(processed_audio)
+            with self._load_model() as model:
+                result = model.transcribe(processed_audio)
 
             Logger.info("Audio transcription completed successfully.")
             return result["text"]
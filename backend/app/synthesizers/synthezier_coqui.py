@@ -1,4 +1,6 @@
-from typing import List, Union
+import hashlib
+import time
+from typing import Iterator, List, Union
 
 import torch
 from io import BytesIO
@@ -7,13 +9,46 @@ import soundfile as sf
 import numpy as np
 from debugpy.launcher import channel
 
+from backend.app.utils.util_blob_store import BlobStore
 from backend.app.utils.util_logger import Logger
+from backend.app.utils.util_model_registry import ModelRegistry
+from backend.app.utils.util_text_manager import iter_tts_sentences
 import wave
-from backend.app.utils.util_logger import Logger
+
+
+def get_tts_model_key(model_name: str) -> str:
+    """Returns the ModelRegistry key of a TTS model."""
+    return f"tts:{model_name.strip()}"
+
+
+def get_tts_segment_cache_key(model_name: str, speaker: str, language: str, segment: str) -> str:
+    """
+    Returns the cache key of the audio of one sentence (or piece of an oversized sentence).
+
+    The key shares the "tts-{model}-" prefix of page audio, so it belongs to the TTS cache namespace
+    and is invalidated with the model revision.
+    """
+    return f"tts-{model_name}-{speaker}-{language}-seg-{hashlib.md5(segment.encode()).hexdigest()}"
+
+
+def load_tts_model(model_name: str, device: str):
+    """
+    Loads a Coqui TTS model and moves it to the given device.
+
+    Args:
+        model_name (str): Full TTS model name.
+        device (str): Torch device (e.g., "cpu" or "cuda").
+
+    Returns:
+        TTS: The loaded model instance.
+    """
+    model = TTS(model_name)
+    model.to(torch.device(device))
+    return model
 
 class TTSSynthesizer:
     """
-    Synthesizes text into speech using the Coqui TTS library with in-memory caching support.
+    Synthesizes text into speech using the Coqui TTS library; models are shared through the ModelRegistry.
     """
     def __init__(self, config_manager, cache_manager):
         """
@@ -31,29 +66,19 @@ class TTSSynthesizer:
 
     def get_model(self, model_name: str):
         """
-        Loads a TTS model from RAM cache if available; otherwise, loads and caches it.
+        Returns a context manager that yields the TTS model from the ModelRegistry,
+        loading it on first use and pinning it while the block runs.
 
         Args:
             model_name (str): The name of the model to load.
 
         Returns:
-            TTS: The loaded model instance.
+            ContextManager[TTS]: Yields the loaded model instance.
         """
-        cached_model = self.cache_manager.load_cached_tts_model(model_name)
-        if cached_model:
-            if not self.dont_spam_model:
-                self.dont_spam_model = True
-                Logger.info(f"Using preloaded TTS model from RAM: {model_name}")
-            return cached_model
-
-        Logger.warning(f"No cached TTS model found for '{model_name}', loading fresh...")
-        model = TTS(model_name)
-        model.to(self.device)
-
-        # Store model in RAM cache.
-        self.cache_manager.cache_tts_model(model_name, model)
-        Logger.info(f"Model '{model_name}' successfully stored in RAM.")
-        return model
+        if not self.dont_spam_model:
+            self.dont_spam_model = True
+            Logger.info(f"Using TTS model from the model registry: {model_name}")
+        return ModelRegistry().acquire(get_tts_model_key(model_name), lambda: load_tts_model(model_name, self.device))
 
     def synthesize(self, text: str, model: str, speaker: str = None, language: str = None) -> BytesIO:
         """
@@ -77,31 +102,9 @@ class TTSSynthesizer:
 
             Logger.info("Audio synthesis running")
 
-            # Split the text into chunks of 252 characters
-            char_count = 0
-            audio_buffers = []
-            last_punctuation_mark = 0
-            i = 0
-            while len(text) > i:
-                char_count += 1
-                if text[i] in [".", "!", "?"]:
-                    last_punctuation_mark = char_count
-                if char_count >= 252:
-                    if last_punctuation_mark == 0:
-                        i += 1
-                        continue
-                    # Synthesize the text up to the last punctuation mark
-                    audio_buffers.append(self._tts_for_synthesize(text[:last_punctuation_mark], model, speaker, language))
-                    Logger.info(f" {i/len(text)}% of the text has been synthesized.")
-                    text = text[last_punctuation_mark:]
-                    char_count = 0
-                    i = 0
-                    last_punctuation_mark = 0
-                    continue
-                i += 1
-            # If the text is shorter than 252 characters, synthesize it directly
-            if len(audio_buffers) == 0:
-                audio_buffers.append(self._tts_for_synthesize(text, model, speaker, language))
+            audio_buffers = list(self.iter_segment_audio(text, model, speaker, language))
+            if not audio_buffers:
+                raise ValueError("No audio was synthesized for the given text.")
 
             Logger.debug(f"Synthesizing {len(audio_buffers)} audio chunks...")
 
@@ -123,30 +126,55 @@ class TTSSynthesizer:
             Logger.error(f"Error during synthesis: {str(e)}")
             raise
 
-    @staticmethod
-    def _chunk_text(text: str) -> List[str]:
+    def iter_segment_audio(self, text: str, model: str, speaker: str = None,
+                           language: str = None) -> Iterator[BytesIO]:
         """
-        Splits text into smaller segments for synthesis based on a character limit.
+        Synthesizes text sentence by sentence and yields the audio of each sentence as soon as it is generated.
+
+        Sentences longer than the model's character limit for the language are split (see
+        iter_tts_sentences). The audio of every sentence is cached on its own, so text sharing
+        sentences with earlier text (e.g. an edited page) only synthesizes the new or changed ones.
+        The Coqui API splits its input into sentences anyway, so this costs no extra model calls.
 
         Args:
-            text (str): The full text to split.
+            text (str): The text to synthesize.
+            model (str): The TTS model to use.
+            speaker (str, optional): The speaker voice to use, if applicable.
+            language (str, optional): The language to use.
+
+        Yields:
+            BytesIO: An in-memory WAV file per sentence.
+
+        Raises:
+            ValueError: If a segment fails to synthesize, so partial audio is never cached or stored.
+        """
+        for segment in iter_tts_sentences(text, language):
+            audio_buffer = self._get_or_synthesize_segment(segment, model, speaker, language)
+            if audio_buffer is None:
+                raise ValueError(f"Synthesis failed for segment: '{segment[:30]}...'")
+            yield audio_buffer
+
+    def _get_or_synthesize_segment(self, segment: str, model: str, speaker: str = None,
+                                   language: str = None) -> Union[BytesIO, None]:
+        """
+        Returns the cached audio of a sentence, or synthesizes it and caches it in the BlobStore.
 
         Returns:
-            List[str]: A list of text segments.
+            BytesIO or None: An in-memory WAV file of the segment, or None if the synthesis failed.
         """
-        char_limit = 250
-        segments = []
-        current_segment = ""
-        for word in text.split():
-            if len(current_segment) + len(word) + 1 > char_limit:
-                segments.append(current_segment.strip())
-                current_segment = word
-            else:
-                current_segment += " " + word
-        if current_segment.strip():
-            segments.append(current_segment.strip())
-        Logger.info(f"Text chunking complete: {len(segments)} segment(s) created.")
-        return segments
+        cache_key = get_tts_segment_cache_key(model, speaker, language, segment)
+        digest = self.cache_manager.get(cache_key) if self.cache_manager is not None else None
+        cached_audio = BlobStore().read(digest) if isinstance(digest, str) else None
+        if cached_audio:
+            Logger.debug(f"[CACHE HIT] Reusing segment audio for key: {cache_key}")
+            return BytesIO(cached_audio)
+
+        started = time.perf_counter()
+        audio_buffer = self._tts_for_synthesize(segment, model, speaker, language)
+        if audio_buffer is not None and self.cache_manager is not None:
+            self.cache_manager.set(cache_key, BlobStore().put(audio_buffer.getvalue()))
+            self.cache_manager.record_compute_time(cache_key, time.perf_counter() - started)
+        return audio_buffer
 
     def _tts_for_synthesize(self, text_sentence: str, model: str, speaker: str = None, language: str = None) -> Union[BytesIO, None]:
         """
@@ -162,8 +190,7 @@ class TTSSynthesizer:
             BytesIO or None: An in-memory WAV file containing the synthesized speech, or None on failure.
         """
         try:
-            tts = self.get_model(model)
-            with torch.no_grad():
+            with self.get_model(model) as tts, torch.no_grad():
                 audio_array = tts.tts(text=text_sentence, speaker=speaker, language=language)
             if len(audio_array) == 0:
                 Logger.error("TTS returned an empty audio array.")
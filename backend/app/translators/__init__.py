@@ -1,4 +1,6 @@
-### translators/__init__.py ###
+from .translator_engine import TranslatorEngine
 from .translator_opus import OpusMTTranslator
+from .translator_ctranslate2 import CTranslate2Translator
+from .translator_pool import TranslatorPool, create_translator
 
-__all__ = ["OpusMTTranslator"]
+__all__ = ["TranslatorEngine", "OpusMTTranslator", "CTranslate2Translator", "TranslatorPool", "create_translator"]
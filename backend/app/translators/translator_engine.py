@@ -0,0 +1,119 @@
+import threading
+from abc import ABC, abstractmethod
+from typing import List
+
+from backend.app.utils.util_model_registry import ModelRegistry
+
+# Number of segments passed to one generate call if no batch size is configured.
+DEFAULT_BATCH_SIZE = 16
+
+
+def get_translation_model_key(model_name: str, engine: str = "opus", quantization: str = "none") -> str:
+    """
+    Returns the ModelRegistry key of a translation model, e.g. "translation:opus:Helsinki-NLP/opus-mt-en-de".
+
+    The key contains the engine, and the quantization unless it is "none", so engines and quantized
+    variants of the same model are loaded separately instead of serving each other's model.
+    """
+    key = f"translation:{engine}:{model_name.strip()}"
+    return key if quantization == "none" else f"{key}:{quantization}"
+
+
+class TranslatorEngine(ABC):
+    """
+    Interface of a translation engine serving one model.
+
+    An engine loads its tokenizer and model through the ModelRegistry (as a (tokenizer, model)
+    tuple under the model's registry key), translates batches of segments and reports its
+    statistics. OpusMTTranslator runs the Hugging Face MarianMT model; optimized runtimes such
+    as CTranslate2 serve converted versions of the same checkpoints. The engine of each model is
+    selected with [TRANSLATE] ENGINES.
+    """
+    name = "engine"
+
+    def __init__(self, model_name: str, cache_manager, device: str):
+        """
+        Registers the engine's loader with the ModelRegistry without loading the model.
+
+        Args:
+            model_name (str): Full model name (e.g., "Helsinki-NLP/opus-mt-en-de").
+            cache_manager: Cache to store and reuse translations.
+            device (str): Device to run the model on ('cpu' or 'cuda').
+        """
+        self.model_name = model_name
+        self.cache_manager = cache_manager
+        self.registry_key = get_translation_model_key(model_name, self.name, getattr(self, "quantization", "none"))
+        self._stats_lock = threading.Lock()
+        self._stats = {"segments": 0, "batches": 0, "seconds": 0.0}
+        ModelRegistry().register(self.registry_key, self.load_model)
+
+    @abstractmethod
+    def load_model(self) -> tuple:
+        """
+        Loads the tokenizer and model; called by the ModelRegistry.
+
+        Returns:
+            tuple: (tokenizer, model)
+        """
+
+    @abstractmethod
+    def translate_batch(self, segments: List[str], batch_size: int = DEFAULT_BATCH_SIZE) -> List[str]:
+        """
+        Translates several segments.
+
+        Args:
+            segments (List[str]): The texts to translate.
+            batch_size (int): Maximum number of segments per inference call.
+
+        Returns:
+            List[str]: One cleaned translation per segment, in the original order.
+        """
+
+    def translate(self, text: str) -> list:
+        """
+        Translates a single text.
+
+        Returns:
+            list: A list with the translated string.
+        """
+        return self.translate_batch([text], 1)
+
+    def get_tokenizer(self):
+        """Returns the tokenizer of the engine's model, loading the model if needed."""
+        with ModelRegistry().acquire(self.registry_key) as (tokenizer, _):
+            return tokenizer
+
+    def load(self):
+        """Loads the model into the ModelRegistry now instead of on first use."""
+        ModelRegistry().preload(self.registry_key)
+
+    def unload(self) -> bool:
+        """
+        Unloads the model from the ModelRegistry if it is not in use.
+
+        Returns:
+            bool: True if the model was unloaded.
+        """
+        return ModelRegistry().unload(self.registry_key)
+
+    def _record_batch(self, segments: int, batches: int, seconds: float):
+        """Adds a translate_batch call to the engine statistics."""
+        with self._stats_lock:
+            self._stats["segments"] += segments
+            self._stats["batches"] += batches
+            self._stats["seconds"] += seconds
+
+    def get_stats(self) -> dict:
+        """
+        Returns:
+            dict: {"engine", "model", "loaded", "segments", "batches", "seconds", "segments_per_second"}.
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["segments_per_second"] = round(stats["segments"] / stats["seconds"], 1) if stats["seconds"] else None
+        stats["seconds"] = round(stats["seconds"], 3)
+        stats["engine"] = self.name
+        stats["model"] = self.model_name
+        stats["loaded"] = ModelRegistry().is_loaded(self.registry_key)
+        return stats
+
@@ -1,56 +1,98 @@
+import time
 import torch
+from typing import List
 from transformers import MarianMTModel, MarianTokenizer
 
+from backend.app.translators.translator_engine import TranslatorEngine, DEFAULT_BATCH_SIZE, get_translation_model_key
 from backend.app.utils import preprocess_text
 from backend.app.utils.util_logger import Logger
+from backend.app.utils.util_model_registry import ModelRegistry
 from backend.app.utils.util_text_manager import clean_translated_text
 
 
-class OpusMTTranslator:
+def load_opus_model(model_name: str, device: str, revision: str = "main", quantization: str = "none"):
+    """
+    Loads a MarianMT model and its tokenizer and moves the model to the given device.
+
+    With quantization "int8" the Linear layers are converted to int8 with torch dynamic
+    quantization, which speeds up CPU inference. Quantized models only run on the CPU, so
+    the option is ignored on other devices.
+
+    Args:
+        model_name (str): Full model name (e.g., "Helsinki-NLP/opus-mt-en-de").
+        device (str): Torch device (e.g., "cpu" or "cuda").
+        revision (str): Hugging Face revision (branch, tag or commit) to load.
+        quantization (str): "none" or "int8".
+
+    Returns:
+        tuple: (MarianTokenizer, MarianMTModel)
+
+    Raises:
+        ValueError: If the tokenizer cannot be loaded.
+    """
+    Logger.info(f"Loading model and tokenizer for '{model_name}' (revision '{revision}')...")
+    try:
+        tokenizer = MarianTokenizer.from_pretrained(model_name, revision=revision)
+    except Exception as e:
+        Logger.error(f"Error loading tokenizer for model '{model_name}': {str(e)}")
+        raise ValueError(f"Error loading tokenizer for model '{model_name}'") from e
+    model = MarianMTModel.from_pretrained(model_name, revision=revision)
+    model.to(torch.device(device))
+    if quantization == "int8":
+        if torch.device(device).type != "cpu":
+            Logger.warning(f"int8 quantization is only supported on the CPU; loading '{model_name}' unquantized on '{device}'.")
+        else:
+            model.eval()
+            model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            Logger.info(f"Quantized the Linear layers of '{model_name}' to int8.")
+    return tokenizer, model
+
+
+class OpusMTTranslator(TranslatorEngine):
     """
     OpusMTTranslator uses Helsinki-NLP's MarianMT models to translate text.
     This class handles text translation by loading the specified MarianMT model.
-    It utilizes caching to optimize performance and avoid redundant loading of models
-    and tokenizers.
+    Models and tokenizers are owned by the ModelRegistry, which loads them lazily and
+    avoids redundant loading.
     """
+    name = "opus"
 
-    def __init__(self, model_name: str, cache_manager, device: str):
+    def __init__(self, model_name: str, cache_manager, device: str, quantization: str = "none",
+                 revision: str = "main"):
         """
         Initializes the translator with the specified model, cache manager, and device.
 
+        The model and tokenizer are owned by the ModelRegistry and loaded lazily on first use.
+
         Args:
             model_name (str): Full model name (e.g., "Helsinki-NLP/opus-mt-en-de").
-            cache_manager: Cache to store and reuse models and tokenizers.
+            cache_manager: Cache to store and reuse translations.
             device (str): Device to load the model ('cpu' or 'cuda').
+            quantization (str): "none" or "int8", used if the model is not registered yet.
+            revision (str): Hugging Face revision, used if the model is not registered yet.
         """
-        model_key = f"model-{model_name}"
-        tokenizer_key = f"tokenizer-{model_name}"
-
-        if cache_manager.get(model_key) and cache_manager.get(tokenizer_key):
-            Logger.info(f"Model and tokenizer for '{model_name}' loaded from cache.")
-            self.model = cache_manager.get(model_key)
-            self.tokenizer = cache_manager.get(tokenizer_key)
-        else:
-            Logger.info(f"Loading model and tokenizer for '{model_name}'...")
-            try:
-                self.tokenizer = MarianTokenizer.from_pretrained(model_name)
-            except Exception as e:
-                Logger.error(f"Error loading tokenizer for model '{model_name}': {str(e)}")
-                raise ValueError(f"Error loading tokenizer for model '{model_name}'") from e
-            self.model = MarianMTModel.from_pretrained(model_name)
-            cache_manager.set(model_key, self.model)
-            cache_manager.set(tokenizer_key, self.tokenizer)
-
         self.device = torch.device(device)
-        self.model.to(self.device)
+        self.quantization = quantization
+        self.revision = revision
+        super().__init__(model_name, cache_manager, device)
+
+    def load_model(self) -> tuple:
+        """Loads the MarianMT tokenizer and model; called by the ModelRegistry."""
+        return load_opus_model(self.model_name, str(self.device), self.revision, self.quantization)
 
     @staticmethod
-    def load_tokenizer(model_name: str):
+    def load_tokenizer(model_name: str, device: str = "cpu", revision: str = "main", quantization: str = "none"):
         """
-        Loads and returns the MarianTokenizer for the given model name.
+        Returns the MarianTokenizer for the given model name from the ModelRegistry.
+
+        If the model is not registered yet, it is registered and loaded with the given revision and
+        quantization, so later translators reuse the model as configured.
 
         Args:
             model_name (str): The full model name.
+            device (str): Device used if the model has to be loaded.
+            revision (str): Hugging Face revision used if the model has to be loaded.
+            quantization (str): "none" or "int8", used if the model has to be loaded.
 
         Returns:
             MarianTokenizer: The loaded tokenizer.
@@ -60,7 +102,10 @@ class OpusMTTranslator:
         """
         Logger.debug(f"Loading tokenizer for model: {model_name}")
         try:
-            return MarianTokenizer.from_pretrained(model_name)
+            with ModelRegistry().acquire(get_translation_model_key(model_name, OpusMTTranslator.name, quantization),
+                                         lambda: load_opus_model(model_name, device, revision, quantization)
+                                         ) as (tokenizer, _):
+                return tokenizer
         except Exception as e:
             Logger.error(f"Failed to load tokenizer for model '{model_name}': {str(e)}")
             raise ValueError("Unsupported translation model") from e
@@ -79,16 +124,77 @@ class OpusMTTranslator:
         Logger.info("Preprocessing text before translation.")
         preprocessed_text = preprocess_text(text)
         Logger.info(f"Translating text (first 50 characters): {preprocessed_text[:preprocessed_text.__sizeof__()-1]}...")
-        inputs = self.tokenizer(preprocessed_text, return_tensors="pt", padding=True)
-        inputs = {key: value.to(self.device) for key, value in inputs.items()}
-        try:
-            with torch.no_grad():
-                translated = self.model.generate(**inputs)
-            result = self.tokenizer.batch_decode(translated, skip_special_tokens=True)
-            # Clean the translated text to remove extra punctuation etc.
-            cleaned_result = [clean_translated_text(r) for r in result]
-            Logger.info(f"Translating text (first 50 characters): {preprocessed_text[:preprocessed_text.__sizeof__()-1]}...")
-            return cleaned_result
-        except Exception as e:
-            Logger.error(f"Error during translation: {str(e)}")
-            return [text]
\ No newline at end of file
+        with ModelRegistry().acquire(self.registry_key) as (tokenizer, model):
+            inputs = tokenizer(preprocessed_text, return_tensors="pt", padding=True)
+            inputs = {key: value.to(self.device) for key, value in inputs.items()}
+            try:
+                with torch.no_grad():
+                    translated = model.generate(**inputs)
+                result = tokenizer.batch_decode(translated, skip_special_tokens=True)
+                # Clean the translated text to remove extra punctuation etc.
+                cleaned_result = [clean_translated_text(r) for r in result]
+                Logger.info(f"Translating text (first 50 characters): {preprocessed_text[:preprocessed_text.__sizeof__()-1]}...")
+                return cleaned_result
+            except Exception as e:
+                Logger.error(f"Error during translation: {str(e)}")
+                return [text]
+
+    def translate_batch(self, segments: List[str], batch_size: int = DEFAULT_BATCH_SIZE) -> List[str]:
+        """
+        Translates several segments with batched generate calls.
+
+        The segments are tokenized once, sorted by token length so each batch holds segments
+        of similar length (little padding), padded per batch and generated `batch_size` at a
+        time. Segments longer than the model's maximum input length get a batch of their own.
+        The results are returned in the original order.
+
+        Args:
+            segments (List[str]): The texts to translate.
+            batch_size (int): Maximum number of segments per generate call.
+
+        Returns:
+            List[str]: One cleaned translation per segment. Segments of a batch that fails to
+            generate are returned untranslated, like translate() does.
+        """
+        if not segments:
+            return []
+        batch_size = max(1, batch_size)
+        started = time.perf_counter()
+        preprocessed = [preprocess_text(segment) for segment in segments]
+        results = [None] * len(segments)
+
+        with ModelRegistry().acquire(self.registry_key) as (tokenizer, model):
+            encoded = tokenizer(preprocessed)
+            lengths = [len(ids) for ids in encoded["input_ids"]]
+            max_length = getattr(tokenizer, "model_max_length", None) or 512
+            order = sorted(range(len(segments)), key=lambda i: lengths[i])
+
+            batches, current = [], []
+            for index in order:
+                if lengths[index] > max_length:
+                    batches.append([index])
+                    continue
+                current.append(index)
+                if len(current) == batch_size:
+                    batches.append(current)
+                    current = []
+            if current:
+                batches.append(current)
+
+            Logger.info(f"Translating {len(segments)} segments in {len(batches)} batches (batch size {batch_size}).")
+            for batch in batches:
+                features = {key: [encoded[key][i] for i in batch] for key in ("input_ids", "attention_mask")}
+                try:
+                    inputs = tokenizer.pad(features, return_tensors="pt")
+                    inputs = {key: value.to(self.device) for key, value in inputs.items()}
+                    with torch.no_grad():
+                        translated = model.generate(**inputs)
+                    decoded = tokenizer.batch_decode(translated, skip_special_tokens=True)
+                    for index, text in zip(batch, decoded):
+                        results[index] = clean_translated_text(text)
+                except Exception as e:
+                    Logger.error(f"Error during batched translation: {str(e)}")
+                    for index in batch:
+                        results[index] = segments[index]
+        self._record_batch(len(segments), len(batches), time.perf_counter() - started)
+        return results
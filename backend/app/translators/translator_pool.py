@@ -0,0 +1,107 @@
+import threading
+from typing import Dict, List, Tuple
+
+from backend.app.translators import translator_ctranslate2
+from backend.app.translators.translator_ctranslate2 import CTranslate2Translator
+from backend.app.translators.translator_engine import TranslatorEngine
+from backend.app.translators.translator_opus import OpusMTTranslator
+from backend.app.utils.util_logger import Logger
+
+# Translation engines selectable per model with [TRANSLATE] ENGINES.
+ENGINES = {
+    OpusMTTranslator.name: OpusMTTranslator,
+    CTranslate2Translator.name: CTranslate2Translator
+}
+
+
+def create_translator(engine: str, model_name: str, cache_manager, device: str, **options) -> TranslatorEngine:
+    """
+    Creates the translation engine of a model.
+
+    Args:
+        engine (str): Engine name ("opus" or "ctranslate2").
+        model_name (str): Full model name (e.g., "Helsinki-NLP/opus-mt-en-de").
+        cache_manager: Cache passed to the engine.
+        device (str): Torch device the model runs on ('cpu' or 'cuda').
+        **options: Engine specific options (e.g. quantization, model_path, compute_type, revision).
+
+    Returns:
+        TranslatorEngine: The engine. Unknown engines and "ctranslate2" without the ctranslate2
+        package fall back to the "opus" engine.
+    """
+    if engine == CTranslate2Translator.name and translator_ctranslate2.ctranslate2 is None:
+        Logger.warning(f"ctranslate2 is not installed; using the 'opus' engine for '{model_name}'.")
+        engine, options = OpusMTTranslator.name, {"revision": options.get("revision", "main")}
+    if engine not in ENGINES:
+        Logger.warning(f"Unknown translation engine '{engine}' for '{model_name}'; using 'opus'.")
+        engine, options = OpusMTTranslator.name, {"revision": options.get("revision", "main")}
+    return ENGINES[engine](model_name, cache_manager, device, **options)
+
+
+class TranslatorPool:
+    """
+    Singleton holding one long-lived translation engine per model, device, engine and quantization.
+
+    Engines configured at startup are added by preload_models; for any other model the engine
+    of its configuration is created on first use. Engines are shared by all request threads, so
+    translating a text no longer constructs a translator (and re-registers its model) per
+    chunk. The tokenizer and the device-placed model an engine uses are owned by the
+    ModelRegistry, which loads them once.
+    """
+    _instance = None  # Singleton instance
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(TranslatorPool, cls).__new__(cls)
+            cls._instance._translators: Dict[Tuple[str, str, str, str], TranslatorEngine] = {}
+            cls._instance._lock = threading.Lock()
+        return cls._instance
+
+    def add(self, translator: TranslatorEngine):
+        """
+        Adds a configured engine, replacing the pooled engine of the same model, device, engine and quantization.
+
+        Args:
+            translator (TranslatorEngine): The engine to share.
+        """
+        key = (translator.model_name.strip(), str(translator.device), translator.name,
+               getattr(translator, "quantization", "none"))
+        with self._lock:
+            self._translators[key] = translator
+        Logger.info(f"[TRANSLATOR POOL] Using the '{translator.name}' engine for '{key[0]}' on '{key[1]}'.")
+
+    def get(self, model_name: str, cache_manager, device: str, engine_config: dict = None) -> TranslatorEngine:
+        """
+        Returns the engine of a model, creating it from its engine configuration on first use.
+
+        Args:
+            model_name (str): Full model name (e.g., "Helsinki-NLP/opus-mt-en-de").
+            cache_manager: Cache passed to a newly created translator.
+            device (str): Torch device the model runs on ('cpu' or 'cuda').
+            engine_config (dict, optional): {"engine": str, "options": dict} as returned by
+                ConfigManager.get_translation_engine_config; an unquantized "opus" engine by default.
+
+        Returns:
+            TranslatorEngine: The shared engine.
+        """
+        engine_config = engine_config or {"engine": OpusMTTranslator.name, "options": {}}
+        options = engine_config.get("options") or {}
+        key = (model_name.strip(), str(device), engine_config["engine"], options.get("quantization", "none"))
+        with self._lock:
+            translator = self._translators.get(key)
+            if translator is None:
+                translator = self._translators[key] = create_translator(engine_config["engine"], key[0],
+                                                                        cache_manager, device, **options)
+                Logger.info(f"[TRANSLATOR POOL] Created '{key[2]}' translator for '{key[0]}' on '{key[1]}' ({key[3]}).")
+            return translator
+
+    def get_stats(self) -> List[dict]:
+        """Returns the statistics of every pooled engine."""
+        with self._lock:
+            translators = list(self._translators.values())
+        return [translator.get_stats() for translator in translators]
+
+    def clear(self):
+        """Drops all pooled translators; their models stay in the ModelRegistry."""
+        with self._lock:
+            self._translators.clear()
@@ -1,5 +1,14 @@
 from .util_logger import Logger
+from .util_cache_store import CacheStore, SQLiteCacheStore, MongoCacheStore, MemoryCacheStore
+from .util_cache_namespaces import NamespacedCache, get_cache_namespace
 from .util_cache_mananger import CacheManager
+from .util_model_registry import ModelRegistry
+from .util_blob_store import BlobStore
+from .util_single_flight import SingleFlight
+from .util_batch_scheduler import BatchScheduler
+from .util_priority_gate import PriorityGate
+from .util_job_manager import JobManager, JobCancelled
+from .util_translation_memory import TranslationMemory
 from .util_config_manager import ConfigManager
 from .util_pdf_processor import PDFProcessor
 from .util_audio_manager import preprocess_audio, normalize_audio, bandpass_filter
@@ -9,6 +18,20 @@ from .util_crypt import CryptoManager
 
 __all__ = [
     "CacheManager",
+    "ModelRegistry",
+    "BlobStore",
+    "SingleFlight",
+    "BatchScheduler",
+    "PriorityGate",
+    "JobManager",
+    "JobCancelled",
+    "TranslationMemory",
+    "CacheStore",
+    "SQLiteCacheStore",
+    "MongoCacheStore",
+    "MemoryCacheStore",
+    "NamespacedCache",
+    "get_cache_namespace",
     "ConfigManager",
     "PDFProcessor",
     "preprocess_text",
@@ -0,0 +1,220 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List
+from backend.app.utils.util_logger import Logger  # Import the Logger class
+
+PRIORITY_INTERACTIVE = "interactive"  # A user waits for the result (single text, page or audio)
+PRIORITY_BULK = "bulk"  # Book-wide work (page_all, background jobs)
+PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_BULK)  # Highest priority first
+
+
+def new_wait_stats() -> dict:
+    """Returns empty queue wait statistics of one priority class."""
+    return {"requests": 0, "segments": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0}
+
+
+def record_wait(stats: dict, seconds: float, segments: int = 0):
+    """Adds the queue wait of one request to the statistics of its priority class."""
+    stats["requests"] += 1
+    stats["segments"] += segments
+    stats["wait_seconds"] += seconds
+    stats["max_wait_seconds"] = max(stats["max_wait_seconds"], seconds)
+
+
+def summarize_wait_stats(stats: dict) -> dict:
+    """Returns the statistics of one priority class with the average and maximum wait in milliseconds."""
+    return {
+        "requests": stats["requests"],
+        "segments": stats["segments"],
+        "avg_wait_ms": round(stats["wait_seconds"] / stats["requests"] * 1000, 2) if stats["requests"] else None,
+        "max_wait_ms": round(stats["max_wait_seconds"] * 1000, 2)
+    }
+
+
+class _Request:
+    """Segments submitted by one caller, waiting for their results."""
+
+    def __init__(self, segments: List, batch_fn: Callable, priority: str = PRIORITY_INTERACTIVE):
+        self.segments = segments
+        self.batch_fn = batch_fn
+        self.priority = priority
+        self.enqueued = time.monotonic()
+        self.done = threading.Event()
+        self.results = None
+        self.error = None
+
+
+class _Queue:
+    """Pending requests of one model, one deque per priority class, and the worker thread draining them."""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.pending = {priority: deque() for priority in PRIORITIES}
+        self.condition = threading.Condition()
+        self.worker = None
+
+
+class BatchScheduler:
+    """
+    Singleton gathering segments of concurrent requests into micro-batches per model.
+
+    Every model key gets a request queue and a worker thread. The worker takes the oldest
+    request, waits up to `max_wait_ms` for further requests of the same model, runs one
+    batch function over all gathered segments (up to `max_batch_size`) and hands each caller
+    the results of its own segments. Concurrent /translate/text, /translate/page and
+    /translate/page_all requests thereby share generate calls instead of running one each.
+
+    Requests have a priority class. Submissions are split into parts of at most `max_batch_size`
+    segments and every batch is filled from the interactive queue first, so a single page
+    submitted while a book is being translated runs at the next batch boundary instead of
+    after the whole book. The queue wait is measured per class.
+    """
+    _instance = None  # Singleton instance
+
+    def __new__(cls, max_wait_ms: float = 10, max_batch_size: int = 64):
+        if cls._instance is None:
+            cls._instance = super(BatchScheduler, cls).__new__(cls)
+            cls._instance._initialize(max_wait_ms, max_batch_size)
+        return cls._instance
+
+    def _initialize(self, max_wait_ms: float, max_batch_size: int):
+        """
+        Args:
+            max_wait_ms (float): Milliseconds the worker waits for further requests after the first one.
+            max_batch_size (int): Segments from which a micro-batch is run without waiting longer.
+        """
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.max_batch_size = max(1, max_batch_size)
+        self._queues: Dict[str, _Queue] = {}
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "batches": 0, "segments": 0}
+        self._wait_stats = {priority: new_wait_stats() for priority in PRIORITIES}
+        Logger.info(f"[BATCH SCHEDULER] Initialized (max wait: {max_wait_ms} ms, max batch size: {max_batch_size}).")
+
+    def submit(self, key: str, segments: List, batch_fn: Callable[[List], List],
+               priority: str = PRIORITY_INTERACTIVE) -> List:
+        """
+        Queues segments for the model `key` and blocks until they are processed.
+
+        Args:
+            key (str): Model key, e.g. "translation:opus:Helsinki-NLP/opus-mt-en-de".
+            segments (List): The caller's segments.
+            batch_fn (Callable): Processes a list of segments and returns one result per segment.
+                All requests of a key must pass equivalent functions; a micro-batch runs the
+                function of its oldest request.
+            priority (str): PRIORITY_INTERACTIVE or PRIORITY_BULK.
+
+        Returns:
+            List: One result per submitted segment, in the submitted order.
+
+        Raises:
+            ValueError: If the priority class is unknown.
+            Exception: Re-raises the exception of the micro-batch the segments were part of.
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority '{priority}'. Expected one of: {', '.join(PRIORITIES)}")
+        if not segments:
+            return []
+        segments = list(segments)
+        requests = [_Request(segments[start:start + self.max_batch_size], batch_fn, priority)
+                    for start in range(0, len(segments), self.max_batch_size)]
+        queue = self._get_queue(key)
+        with queue.condition:
+            queue.pending[priority].extend(requests)
+            queue.condition.notify()
+        results = []
+        for request in requests:
+            request.done.wait()
+            if request.error is not None:
+                raise request.error
+            results.extend(request.results)
+        return results
+
+    def _get_queue(self, key: str) -> _Queue:
+        """Returns the queue of a model key, starting its worker thread on first use."""
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue is None:
+                queue = self._queues[key] = _Queue(key)
+                queue.worker = threading.Thread(target=self._worker_loop, args=(queue,),
+                                                name=f"batch-scheduler-{key}", daemon=True)
+                queue.worker.start()
+            return queue
+
+    @staticmethod
+    def _first_pending(queue: _Queue):
+        """Returns the deque of the highest priority class with pending requests, or None."""
+        for priority in PRIORITIES:
+            if queue.pending[priority]:
+                return queue.pending[priority]
+        return None
+
+    def _next_batch(self, queue: _Queue) -> List[_Request]:
+        """Blocks until a request arrives and gathers the requests of one micro-batch, interactive ones first."""
+        with queue.condition:
+            while self._first_pending(queue) is None:
+                queue.condition.wait()
+            batch = [self._first_pending(queue).popleft()]
+            size = len(batch[0].segments)
+            deadline = time.monotonic() + self.max_wait
+            while size < self.max_batch_size:
+                pending = self._first_pending(queue)
+                if pending is None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not queue.condition.wait(remaining):
+                        break
+                    continue
+                if size + len(pending[0].segments) > self.max_batch_size:
+                    break
+                request = pending.popleft()
+                batch.append(request)
+                size += len(request.segments)
+        now = time.monotonic()
+        with self._lock:
+            for request in batch:
+                record_wait(self._wait_stats[request.priority], now - request.enqueued, len(request.segments))
+        return batch
+
+    def _worker_loop(self, queue: _Queue):
+        """Runs micro-batches of one model until the process exits."""
+        while True:
+            batch = self._next_batch(queue)
+            segments = [segment for request in batch for segment in request.segments]
+            try:
+                results = batch[0].batch_fn(segments)
+                if len(results) != len(segments):
+                    raise ValueError(f"Expected {len(segments)} results, got {len(results)}.")
+                offset = 0
+                for request in batch:
+                    request.results = results[offset:offset + len(request.segments)]
+                    offset += len(request.segments)
+            except Exception as e:
+                Logger.error(f"[BATCH SCHEDULER] Micro-batch of '{queue.key}' failed: {str(e)}")
+                for request in batch:
+                    request.error = e
+            finally:
+                with self._lock:
+                    self._stats["requests"] += len(batch)
+                    self._stats["batches"] += 1
+                    self._stats["segments"] += len(segments)
+                for request in batch:
+                    request.done.set()
+            if len(batch) > 1:
+                Logger.info(f"[BATCH SCHEDULER] Ran {len(segments)} segments of {len(batch)} requests "
+                            f"for '{queue.key}' in one batch.")
+
+    def get_stats(self) -> dict:
+        """
+        Returns:
+            dict: {"requests", "batches", "segments", "requests_per_batch", "max_wait_ms", "max_batch_size",
+                   "classes": {priority: {"requests", "segments", "avg_wait_ms", "max_wait_ms"}}}.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["classes"] = {priority: summarize_wait_stats(wait_stats)
+                                for priority, wait_stats in self._wait_stats.items()}
+        stats["requests_per_batch"] = round(stats["requests"] / stats["batches"], 2) if stats["batches"] else None
+        stats["max_wait_ms"] = self.max_wait * 1000
+        stats["max_batch_size"] = self.max_batch_size
+        return stats
@@ -0,0 +1,158 @@
+import hashlib
+import os
+import tempfile
+import threading
+from typing import Union
+from backend.app.utils.util_logger import Logger  # Import the Logger class
+
+
+class BlobStore:
+    """
+    Singleton content-addressed store for large binary results such as synthesized audio.
+
+    Each blob is written once to `<directory>/<sha256[:2]>/<sha256>` and identified by its
+    SHA-256 digest, so caches only keep the 64 character digest and identical results are
+    stored once. Files can be served directly from disk (sendfile) instead of being copied
+    into memory. When the directory grows beyond `max_bytes`, the least recently used blobs
+    (by modification time, refreshed on every access) are deleted.
+    """
+    _instance = None  # Singleton instance
+
+    def __new__(cls, directory: str = "./blobs", max_bytes: int = 1024 * 1024 * 1024):
+        if cls._instance is None:
+            cls._instance = super(BlobStore, cls).__new__(cls)
+            cls._instance._initialize(directory, max_bytes)
+        return cls._instance
+
+    def _initialize(self, directory: str, max_bytes: int):
+        """
+        Args:
+            directory (str): Directory holding the blobs.
+            max_bytes (int): Size of all blobs after which garbage collection starts (0 disables it).
+        """
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._removed = 0
+        os.makedirs(self.directory, exist_ok=True)
+        self._total_bytes = sum(os.path.getsize(path) for path, _ in self._iter_blobs())
+        Logger.info(f"[BLOB STORE] Blob store at {self.directory} holds {self._total_bytes} bytes "
+                    f"(limit: {max_bytes} bytes).")
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def _iter_blobs(self):
+        """Yields (path, mtime) of every stored blob."""
+        for entry in os.scandir(self.directory):
+            if not entry.is_dir():
+                continue
+            for blob in os.scandir(entry.path):
+                if blob.is_file() and not blob.name.endswith(".tmp"):
+                    yield blob.path, blob.stat().st_mtime
+
+    def put(self, data: bytes) -> str:
+        """
+        Stores `data` under its SHA-256 digest; storing the same content again is a no-op.
+
+        Args:
+            data (bytes): The binary content.
+
+        Returns:
+            str: The hex digest identifying the blob.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if os.path.exists(path):
+            self._touch(path)
+            return digest
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first so readers never see a partially written blob.
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            with self._lock:
+                # Only count the blob if this call created it; a concurrent put of the same content may have won.
+                created = not os.path.exists(path)
+                os.replace(tmp_path, path)
+                if created:
+                    self._total_bytes += len(data)
+                over_budget = self.max_bytes and self._total_bytes > self.max_bytes
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        if over_budget:
+            self.gc(keep=digest)
+        return digest
+
+    def path(self, digest: str) -> Union[str, None]:
+        """
+        Returns the file path of a blob and marks it as recently used, or None if it does not exist.
+        """
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            return None
+        self._touch(path)
+        return path
+
+    def read(self, digest: str) -> Union[bytes, None]:
+        """Returns the content of a blob, or None if it does not exist."""
+        path = self.path(digest)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as blob_file:
+                return blob_file.read()
+        except FileNotFoundError:
+            return None  # Removed by a concurrent garbage collection
+
+    @staticmethod
+    def _touch(path: str):
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+    def gc(self, keep: str = None) -> int:
+        """
+        Deletes the least recently used blobs until the store fits `max_bytes`.
+
+        Args:
+            keep (str, optional): Digest that must not be deleted (e.g. the blob just written).
+
+        Returns:
+            int: Number of deleted blobs.
+        """
+        with self._lock:
+            blobs = sorted(self._iter_blobs(), key=lambda blob: blob[1])
+            total = sum(os.path.getsize(path) for path, _ in blobs)
+            removed = 0
+            for path, _ in blobs:
+                if not self.max_bytes or total <= self.max_bytes:
+                    break
+                if keep and os.path.basename(path) == keep:
+                    continue
+                try:
+                    size = os.path.getsize(path)
+                    os.remove(path)  # Open file handles (e.g. running downloads) stay valid
+                except FileNotFoundError:
+                    continue
+                total -= size
+                removed += 1
+            self._total_bytes = total
+            self._removed += removed
+        if removed:
+            Logger.info(f"[BLOB STORE] Garbage collection removed {removed} blob(s); {total} bytes remain.")
+        return removed
+
+    def get_stats(self) -> dict:
+        """
+        Returns:
+            dict: {"bytes", "max_bytes", "removed"}
+        """
+        with self._lock:
+            return {"bytes": self._total_bytes, "max_bytes": self.max_bytes, "removed": self._removed}
@@ -0,0 +1,153 @@
+import pickle
+import threading
+import time
+import zlib
+from backend.app.utils.util_logger import Logger  # Import the Logger class
+
+try:
+    import zstandard
+except ImportError:  # zstd is optional; zlib is always available
+    zstandard = None
+
+# Values serialized to fewer bytes than this are stored as they are.
+DEFAULT_MIN_BYTES = 1024
+
+# A compressed value is only kept if it saves at least this share of the original size.
+_MIN_SAVING = 0.1
+
+
+class CompressedValue:
+    """
+    A compressed cache value as it is held in RAM and pickled into the persistent stores.
+
+    Attributes:
+        codec (str): Name of the codec that produced `data` ("zstd" or "zlib").
+        data (bytes): The compressed payload.
+        is_bytes (bool): True if the original value was raw bytes, False if it was pickled first.
+    """
+    __slots__ = ("codec", "data", "is_bytes")
+
+    def __init__(self, codec: str, data: bytes, is_bytes: bool):
+        self.codec = codec
+        self.data = data
+        self.is_bytes = is_bytes
+
+    def __sizeof__(self):
+        # Lets estimate_size / sys.getsizeof account the compressed payload against the RAM budget.
+        return object.__sizeof__(self) + len(self.data)
+
+    def __getstate__(self):
+        return self.codec, self.data, self.is_bytes
+
+    def __setstate__(self, state):
+        self.codec, self.data, self.is_bytes = state
+
+
+class CacheCodec:
+    """
+    Transparent compression of cached values.
+
+    Text results (translations, transcriptions) are pickled and compressed with the
+    best-ratio codec, raw bytes (e.g. audio) with a fast level because they compress less.
+    Values below `min_bytes` or that do not shrink by at least 10% are kept uncompressed.
+    zstd is used if the `zstandard` package is installed, otherwise zlib.
+    """
+
+    def __init__(self, codec: str = "auto", min_bytes: int = DEFAULT_MIN_BYTES, level: int = 3):
+        """
+        Args:
+            codec (str): "auto" (zstd if available, else zlib), "zstd", "zlib" or "none".
+            min_bytes (int): Serialized size from which values are compressed.
+            level (int): Compression level for text values; raw bytes always use level 1.
+        """
+        if codec == "auto":
+            codec = "zstd" if zstandard is not None else "zlib"
+        if codec == "zstd" and zstandard is None:
+            Logger.warning("[CACHE CODEC] zstandard is not installed; falling back to zlib.")
+            codec = "zlib"
+        if codec not in ("zstd", "zlib", "none"):
+            raise ValueError(f"Unsupported cache codec: {codec}")
+        self.codec = codec
+        self.min_bytes = min_bytes
+        self.level = level
+        self._lock = threading.Lock()
+        self._stats = {"compressed": 0, "skipped": 0, "bytes_in": 0, "bytes_out": 0,
+                       "encode_seconds": 0.0, "decode_seconds": 0.0}
+        Logger.info(f"[CACHE CODEC] Using codec '{codec}' for values from {min_bytes} bytes.")
+
+    def _compress(self, codec: str, data: bytes, level: int) -> bytes:
+        if codec == "zstd":
+            return zstandard.ZstdCompressor(level=level).compress(data)
+        return zlib.compress(data, level)
+
+    @staticmethod
+    def _decompress(codec: str, data: bytes) -> bytes:
+        if codec == "zstd":
+            if zstandard is None:
+                raise ValueError("Value was compressed with zstd, but zstandard is not installed.")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return zlib.decompress(data)
+
+    def encode(self, value):
+        """
+        Compresses a value if it is large enough and compressible.
+
+        Args:
+            value: The value to cache.
+
+        Returns:
+            The original value or a CompressedValue.
+        """
+        if self.codec == "none" or value is None or isinstance(value, (CompressedValue, int, float)):
+            return value
+
+        started = time.perf_counter()
+        is_bytes = isinstance(value, (bytes, bytearray))
+        try:
+            data = bytes(value) if is_bytes else pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return value  # Non-pickleable values (e.g. models) stay as they are
+        if len(data) < self.min_bytes:
+            with self._lock:
+                self._stats["skipped"] += 1
+            return value
+
+        compressed = self._compress(self.codec, data, 1 if is_bytes else self.level)
+        elapsed = time.perf_counter() - started
+        keep = len(compressed) <= len(data) * (1 - _MIN_SAVING)
+        with self._lock:
+            self._stats["encode_seconds"] += elapsed
+            if keep:
+                self._stats["compressed"] += 1
+                self._stats["bytes_in"] += len(data)
+                self._stats["bytes_out"] += len(compressed)
+            else:
+                self._stats["skipped"] += 1
+        return CompressedValue(self.codec, compressed, is_bytes) if keep else value
+
+    def decode(self, value):
+        """
+        Reverses encode(); values that are not compressed are returned unchanged.
+        """
+        if not isinstance(value, CompressedValue):
+            return value
+        started = time.perf_counter()
+        data = self._decompress(value.codec, value.data)
+        result = data if value.is_bytes else pickle.loads(data)
+        with self._lock:
+            self._stats["decode_seconds"] += time.perf_counter() - started
+        return result
+
+    def get_stats(self) -> dict:
+        """
+        Returns:
+            dict: {"codec", "compressed", "skipped", "bytes_in", "bytes_out", "ratio", "encode_seconds",
+                   "decode_seconds"} where ratio is bytes_in / bytes_out of the compressed values.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["codec"] = self.codec
+        stats["ratio"] = round(stats["bytes_in"] / stats["bytes_out"], 2) if stats["bytes_out"] else None
+        stats["encode_seconds"] = round(stats["encode_seconds"], 4)
+        stats["decode_seconds"] = round(stats["decode_seconds"], 4)
+        return stats
@@ -1,120 +1,257 @@
-import os
 import pickle
-from cachetools import LRUCache
+import threading
+from backend.app.utils.util_cache_codec import CacheCodec
+from backend.app.utils.util_cache_namespaces import NamespacedCache
+from backend.app.utils.util_cache_stats import CacheStatistics
+from backend.app.utils.util_cache_store import SQLiteCacheStore
 from backend.app.utils.util_logger import Logger  # Import the Logger class
 
+# Keys with these prefixes hold model objects and are never written to the persistent store.
+_NON_PERSISTENT_PREFIXES = ("model-", "tokenizer-", "tts_model-", "stt_model-")
+
+# Persisted values are pickled as (_ENTRY_MARKER, version, value) so stale entries can be detected.
+_ENTRY_MARKER = "textify-cache-entry"
+
 class CacheManager:
     _instance = None  # Singleton instance
 
-    def __new__(cls, cache_file="cache.pkl", maxsize=1000, clear_cache_on_start=False):
+    def __new__(cls, cache_file="cache.db", maxsize=1000, clear_cache_on_start=False, store=None,
+                store_max_entries=None, compaction_interval=300, namespace_budgets=None, shared_tier=None,
+                shared_max_item_bytes=0, cache_version="", version_tags=None, codec=None):
         if cls._instance is None:
             cls._instance = super(CacheManager, cls).__new__(cls)
-            cls._instance._initialize(cache_file, maxsize, clear_cache_on_start)
+            cls._instance._initialize(cache_file, maxsize, clear_cache_on_start, store,
+                                      store_max_entries, compaction_interval, namespace_budgets,
+                                      shared_tier, shared_max_item_bytes, cache_version, version_tags, codec)
         return cls._instance
 
-    def _initialize(self, cache_file, maxsize, clear_cache_on_start):
+    def _initialize(self, cache_file, maxsize, clear_cache_on_start, store, store_max_entries, compaction_interval,
+                    namespace_budgets, shared_tier, shared_max_item_bytes, cache_version, version_tags, codec):
         """
-        Initialize the persistent cache and in-memory caches for models.
+        Initialize the persistent cache and the in-memory cache. Models are held by the ModelRegistry.
+        Lookups go through the in-memory cache, the shared tier (if any) and the local persistent store.
         Args:
             cache_file (str): File path for persistent cache storage.
-            maxsize (int): Maximum number of items for the LRU cache.
-            clear_cache_on_start (bool): If True, clear the cache file on startup.
+            maxsize (int): Maximum number of items per namespace of the LRU cache.
+            clear_cache_on_start (bool): If True, clear the cache file on startup; otherwise reload it (warm start).
+            store (CacheStore, optional): Persistent back end; defaults to a SQLiteCacheStore at `cache_file`.
+            store_max_entries (int, optional): Entries kept by the store after compaction (defaults to `maxsize`).
+            compaction_interval (float): Seconds between background compactions of the default store.
+            namespace_budgets (dict, optional): RAM budget in bytes per namespace ("translation", "tts", "stt").
+            shared_tier (CacheStore, optional): Cache tier shared by all workers, e.g. a MongoCacheStore.
+            shared_max_item_bytes (int): Serialized entries larger than this are not written to the shared tier (0 = no limit).
+            cache_version (str): Version of all persisted entries; changing it invalidates them.
+            version_tags (dict, optional): Key prefix -> version tag (e.g. "Helsinki-NLP/opus-mt-en-de-" ->
+                "Helsinki-NLP/opus-mt-en-de@main"). Entries persisted under another tag are dropped.
+            codec (CacheCodec, optional): Compresses large values in RAM and on disk; defaults to CacheCodec().
         """
-        self.cache = LRUCache(maxsize=maxsize)
-        self.tts_in_memory_cache = {}  # In-memory cache for TTS models
-        self.stt_in_memory_cache = {}  # In-memory cache for STT models
+        self.cache = NamespacedCache(max_entries=maxsize, namespace_budgets=namespace_budgets)
+        self._lock = threading.RLock()  # Guards the in-memory cache under threaded servers
+        self.stats = CacheStatistics()
+        self.codec = codec if codec is not None else CacheCodec()
+        self.cache_version = cache_version
+        # Longest prefixes first so that the most specific tag wins.
+        self.version_tags = sorted((version_tags or {}).items(), key=lambda item: len(item[0]), reverse=True)
+        self.shared_tier = None
+        self.shared_max_item_bytes = 0
+        if shared_tier is not None:
+            self.attach_shared_tier(shared_tier, shared_max_item_bytes)
         self.cache_file = cache_file
+        self.store = store if store is not None else SQLiteCacheStore(
+            cache_file, max_entries=store_max_entries or maxsize, compaction_interval=compaction_interval
+        )
 
-        if clear_cache_on_start and os.path.exists(self.cache_file):
-            os.remove(self.cache_file)
-            Logger.info(f"[CACHE] Cleared persistent cache file {self.cache_file} on startup.")
+        if clear_cache_on_start:
+            self.store.clear()
+            Logger.info(f"[CACHE] Cleared persistent cache {self.cache_file} on startup.")
         else:
             self._load_cache()
 
+    def attach_shared_tier(self, shared_tier, max_item_bytes=0):
+        """
+        Put a cache tier shared by all workers between the in-memory cache and the local store.
+        Args:
+            shared_tier (CacheStore): The shared store, e.g. a MongoCacheStore.
+            max_item_bytes (int): Serialized entries larger than this stay process-local (0 = no limit).
+        """
+        self.shared_tier = shared_tier
+        self.shared_max_item_bytes = max_item_bytes
+        Logger.info(f"[CACHE] Shared cache tier attached: {type(shared_tier).__name__}.")
+
+    def get_version(self, key):
+        """Return the version an entry for `key` is persisted with."""
+        for prefix, tag in self.version_tags:
+            if key.startswith(prefix):
+                return f"{self.cache_version}:{tag}"
+        return f"{self.cache_version}:"
+
+    def _serialize(self, key, value):
+        return pickle.dumps((_ENTRY_MARKER, self.get_version(key), value), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _deserialize(self, key, payload):
+        """
+        Unpickle a persisted entry.
+        Returns:
+            tuple: (True, value) for a current entry, (False, None) for an entry written by another version.
+        """
+        entry = pickle.loads(payload)
+        if not (isinstance(entry, tuple) and len(entry) == 3 and entry[0] == _ENTRY_MARKER):
+            return False, None  # Written before entries were versioned
+        if entry[1] != self.get_version(key):
+            return False, None
+        return True, entry[2]
+
     def is_available(self):
         """Check if the persistent cache is available."""
         return self.cache is not None
 
+    def get_footprint(self):
+        """Return entries, bytes and byte budget of the in-memory cache per namespace."""
+        with self._lock:
+            return self.cache.get_footprint()
+
+    def get_stats(self):
+        """
+        Return hits, misses, compute time saved, entries, bytes and evictions per namespace.
+        """
+        return self.stats.snapshot(self.get_footprint())
+
+    def get_compression_stats(self):
+        """Return the compression ratio and CPU time of the cache codec."""
+        return self.codec.get_stats()
+
+    def record_compute_time(self, key, seconds):
+        """
+        Record how long computing the value of `key` took, so later hits count as saved compute time.
+        """
+        self.stats.record_compute_time(key, seconds)
+
     # General Persistent Cache Methods
-    def get(self, key):
-        """Retrieve a value from the persistent cache."""
-        return self.cache.get(key)
+    def get(self, key, record_stats=True):
+        """
+        Retrieve a value from the in-memory cache, falling back to the persistent store
+        for entries that were evicted from RAM.
+        Args:
+            key (str): Cache key.
+            record_stats (bool): Count the lookup as hit or miss. Disabled for re-checks of the same request.
+        """
+        value = self._lookup(key)
+        if record_stats:
+            if value is None:
+                self.stats.record_miss(key)
+            else:
+                self.stats.record_hit(key)
+        try:
+            return self.codec.decode(value)
+        except Exception as e:
+            Logger.error(f"[CACHE ERROR] Failed to decompress '{key}': {e}")
+            return None
+
+    def _lookup(self, key):
+        with self._lock:
+            value = self.cache.get(key)
+        if value is not None or key.startswith(_NON_PERSISTENT_PREFIXES):
+            return value
+        if self.shared_tier is not None:
+            value = self._read(self.shared_tier, key, "shared tier")
+            if value is not None:
+                Logger.debug(f"[CACHE] Shared tier hit for '{key}'.")
+        if value is None:
+            value = self._read(self.store, key, "persistent store", delete_stale=True)
+        if value is None:
+            return None
+        with self._lock:
+            self.cache[key] = value
+        return value
+
+    def _read(self, store, key, tier_name, delete_stale=False):
+        """Read and unpickle a single entry from a store, treating failures and stale entries as a miss."""
+        try:
+            payload = store.get(key)
+            if payload is None:
+                return None
+            current, value = self._deserialize(key, payload)
+            if not current:
+                Logger.debug(f"[CACHE] Ignoring stale entry '{key}' in {tier_name}.")
+                if delete_stale:
+                    store.delete(key)
+                return None
+            return value
+        except Exception as e:
+            Logger.error(f"[CACHE ERROR] Failed to read '{key}' from {tier_name}: {e}")
+            return None
 
     def set(self, key, value):
-        """Store a key-value pair in the persistent cache and persist it."""
-        self.cache[key] = value
-        self._save_cache()
+        """
+        Store a key-value pair in the in-memory cache and persist only this entry.
+        Large values are compressed once here and kept compressed in RAM and in the stores.
+        """
+        if not key.startswith(_NON_PERSISTENT_PREFIXES):
+            value = self.codec.encode(value)
+        with self._lock:
+            self.cache[key] = value
+        self._persist(key, value)
 
     def _load_cache(self):
-        """Load only pickleable items from the persistent cache file."""
-        if not os.path.exists(self.cache_file):
-            return
+        """
+        Warm start: load the most recently written entries from the persistent store into RAM.
+        Unreadable entries and entries persisted by another cache version or model revision are deleted.
+        """
         try:
-            with open(self.cache_file, "rb") as f:
-                self.cache.update(pickle.load(f))
+            entries = self.store.load(self.cache.maxsize)
         except Exception as e:
             Logger.error(f"[CACHE ERROR] Failed to load cache: {e}")
+            return
+        dropped = 0
+        for key, payload in entries:
+            try:
+                current, value = self._deserialize(key, payload)
+            except Exception as e:
+                Logger.warning(f"[CACHE] Dropping unreadable persisted item '{key}': {e}")
+                current = False
+            if not current:
+                self.store.delete(key)
+                dropped += 1
+                continue
+            with self._lock:
+                self.cache[key] = value
+        Logger.info(f"[CACHE] Loaded {len(self.cache)} entries from persistent cache {self.cache_file} "
+                    f"({dropped} stale entries dropped).")
 
-    def _save_cache(self):
-        """Persist only pickleable cache items to the cache file."""
+    def _persist(self, key, value):
+        """Write a single pickleable entry to the persistent store and the shared tier."""
+        if key.startswith(_NON_PERSISTENT_PREFIXES):
+            return  # Skip model objects
         try:
-            cache_to_save = {}
-            for key, value in self.cache.items():
-                if key.startswith("tts_model-") or key.startswith("stt_model-"):
-                    continue  # Skip model objects
-                try:
-                    pickle.dumps(value)
-                    cache_to_save[key] = value
-                except Exception:
-                    Logger.warning(f"[CACHE] Skipping non-pickleable item: '{key}'")
-            with open(self.cache_file, "wb") as f:
-                pickle.dump(cache_to_save, f)
+            payload = self._serialize(key, value)
+        except Exception:
+            Logger.warning(f"[CACHE] Skipping non-pickleable item: '{key}'")
+            return
+        try:
+            self.store.put(key, payload)
         except Exception as e:
-            Logger.error(f"[CACHE ERROR] Failed to save cache: {e}")
-
-    # In-Memory Cache Methods for TTS models
-    def load_cached_tts_model(self, model_name: str):
-        """Retrieve the TTS model exclusively from the in-memory cache."""
-        cache_key = f"tts_model-{model_name}"
-        model = self.tts_in_memory_cache.get(cache_key)
-        if model is not None:
-            Logger.info(f"[CACHE] TTS model '{model_name}' retrieved from RAM cache.")
-        else:
-            Logger.info(f"[CACHE] No cached TTS model found for '{model_name}'.")
-        return model
-
-    def cache_tts_model(self, model_name: str, tts_model):
-        """Store the TTS model exclusively in the in-memory cache."""
-        cache_key = f"tts_model-{model_name}"
-        if cache_key in self.tts_in_memory_cache:
-            Logger.info(f"[CACHE] TTS model '{model_name}' is already cached in RAM.")
+            Logger.error(f"[CACHE ERROR] Failed to save cache entry '{key}': {e}")
+
+        if self.shared_tier is None:
             return
-        self.tts_in_memory_cache[cache_key] = tts_model
-        Logger.info(f"[CACHE] TTS model '{model_name}' successfully stored in RAM.")
-
-    # In-Memory Cache Methods for STT models
-    def load_cached_stt_model(self, model_name: str):
-        """Retrieve the STT model exclusively from the in-memory cache."""
-        cache_key = f"stt_model-{model_name}"
-        model = self.stt_in_memory_cache.get(cache_key)
-        if model is not None:
-            Logger.info(f"[CACHE] STT model '{model_name}' retrieved from RAM cache.")
-        else:
-            Logger.info(f"[CACHE] No cached STT model found for '{model_name}'.")
-        return model
-
-    def cache_stt_model(self, model_name: str, stt_model):
-        """Store the STT model exclusively in the in-memory cache."""
-        cache_key = f"stt_model-{model_name}"
-        if cache_key in self.stt_in_memory_cache:
-            Logger.info(f"[CACHE] STT model '{model_name}' is already cached in RAM.")
+        if self.shared_max_item_bytes and len(payload) > self.shared_max_item_bytes:
+            Logger.debug(f"[CACHE] '{key}' ({len(payload)} bytes) exceeds the shared tier item limit; kept local.")
             return
-        self.stt_in_memory_cache[cache_key] = stt_model
-        Logger.info(f"[CACHE] STT model '{model_name}' successfully stored in RAM.")
-
-    def clear_cache(self):
-        """Clear both the persistent cache and the in-memory model caches."""
-        self.cache.clear()
-        self.tts_in_memory_cache.clear()
-        self.stt_in_memory_cache.clear()
+        try:
+            self.shared_tier.put(key, payload)
+        except Exception as e:
+            Logger.error(f"[CACHE ERROR] Failed to write '{key}' to shared tier: {e}")
+
+    def clear_cache(self, include_shared=False):
+        """
+        Clear both the persistent cache and the in-memory cache.
+        Args:
+            include_shared (bool): Also clear the shared tier, which affects every other worker.
+        """
+        with self._lock:
+            self.cache.clear()
+        self.store.clear()
+        self.stats.reset()
+        if include_shared and self.shared_tier is not None:
+            self.shared_tier.clear()
         Logger.info("[CACHE] All caches have been cleared.")
\ No newline at end of file
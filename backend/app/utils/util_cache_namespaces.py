@@ -0,0 +1,199 @@
+import math
+import sys
+from cachetools import LRUCache
+from backend.app.utils.util_logger import Logger  # Import the Logger class
+
+# Cache key namespaces, resolved from the key prefix (see get_cache_namespace).
+NAMESPACE_TRANSLATION = "translation"
+NAMESPACE_TTS = "tts"
+NAMESPACE_STT = "stt"
+NAMESPACE_MODELS = "models"
+
+_MODEL_PREFIXES = ("model-", "tokenizer-", "tts_model-", "stt_model-")
+
+
+def get_cache_namespace(key: str) -> str:
+    """
+    Maps a cache key to its namespace.
+
+    Args:
+        key (str): Cache key, e.g. "tts-{model}-{speaker}-{language}-{md5}".
+
+    Returns:
+        str: One of "tts", "stt", "models" or "translation" (all remaining keys).
+    """
+    if key.startswith("tts-"):
+        return NAMESPACE_TTS
+    if key.startswith("stt-"):
+        return NAMESPACE_STT
+    if key.startswith(_MODEL_PREFIXES):
+        return NAMESPACE_MODELS
+    return NAMESPACE_TRANSLATION
+
+
+def estimate_size(value, _seen=None) -> int:
+    """
+    Estimates the number of bytes a cached value keeps alive.
+
+    Buffers are counted by length, containers recursively, and torch modules by the tensors
+    of their state dict, which besides the parameters holds buffers and the packed weights of
+    dynamically quantized layers. Everything else falls back to sys.getsizeof.
+
+    Args:
+        value: The cached value.
+
+    Returns:
+        int: Estimated size in bytes.
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return sys.getsizeof(value)
+
+    _seen = _seen if _seen is not None else set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size(k, _seen) + estimate_size(v, _seen) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_size(item, _seen) for item in value)
+    if hasattr(value, "state_dict") and callable(value.state_dict):
+        try:
+            return _tensor_bytes(value.state_dict().values(), set())
+        except Exception:
+            pass
+    if hasattr(value, "parameters") and callable(value.parameters):
+        try:
+            return sum(p.numel() * p.element_size() for p in value.parameters())
+        except Exception:
+            pass
+    return sys.getsizeof(value)
+
+
+def _tensor_bytes(values, seen: set) -> int:
+    """
+    Sums the storage of the tensors in a state dict; packed parameters are nested in tuples,
+    and tensors sharing their data (e.g. tied embeddings) are counted once.
+    """
+    total = 0
+    for item in values:
+        if isinstance(item, (list, tuple)):
+            total += _tensor_bytes(item, seen)
+        elif hasattr(item, "numel") and hasattr(item, "element_size"):
+            key = (item.data_ptr(), item.numel())
+            if key not in seen:
+                seen.add(key)
+                total += item.numel() * item.element_size()
+    return total
+
+
+class SizedLRUCache(LRUCache):
+    """
+    LRU cache bounded both by a byte budget and by a number of entries.
+
+    When a value is inserted, least recently used entries are evicted until the new value
+    fits into the byte budget, so one large entry displaces many small ones. Values larger
+    than the whole budget are rejected, and a value already cached under their key is removed,
+    so it is not returned in place of the rejected one.
+    """
+
+    def __init__(self, max_bytes: int, max_entries: int, getsizeof=estimate_size):
+        """
+        Args:
+            max_bytes (int): Byte budget; 0 or None means unbounded.
+            max_entries (int): Maximum number of entries.
+            getsizeof (callable): Function returning the size of a value in bytes.
+        """
+        super().__init__(maxsize=max_bytes or math.inf, getsizeof=getsizeof)
+        self.max_entries = max_entries
+        self.evictions = 0
+
+    def __setitem__(self, key, value):
+        if self.getsizeof(value) > self.maxsize:
+            self.pop(key, None)
+            raise ValueError("value too large")
+        if key not in self:
+            while len(self) >= self.max_entries:
+                self.popitem()
+        super().__setitem__(key, value)
+
+    def popitem(self):
+        self.evictions += 1
+        return super().popitem()
+
+
+class NamespacedCache:
+    """
+    In-memory cache split into one SizedLRUCache per key namespace, so large TTS audio
+    cannot push small translation strings out of RAM and each namespace has its own budget.
+    """
+
+    def __init__(self, max_entries: int, namespace_budgets: dict = None):
+        """
+        Args:
+            max_entries (int): Maximum number of entries per namespace.
+            namespace_budgets (dict, optional): Byte budget per namespace name; namespaces
+                without a budget are only bounded by `max_entries`.
+        """
+        self.maxsize = max_entries
+        self.namespace_budgets = dict(namespace_budgets or {})
+        self._caches = {}
+
+    def _cache_for(self, key) -> SizedLRUCache:
+        namespace = get_cache_namespace(key)
+        cache = self._caches.get(namespace)
+        if cache is None:
+            cache = SizedLRUCache(self.namespace_budgets.get(namespace, 0), self.maxsize)
+            self._caches[namespace] = cache
+        return cache
+
+    def get(self, key, default=None):
+        return self._cache_for(key).get(key, default)
+
+    def __getitem__(self, key):
+        return self._cache_for(key)[key]
+
+    def __setitem__(self, key, value):
+        cache = self._cache_for(key)
+        try:
+            cache[key] = value
+        except ValueError:
+            # cachetools raises ValueError when a single value exceeds the whole budget.
+            Logger.warning(f"[CACHE] Value for '{key}' exceeds the byte budget of its namespace; not kept in RAM.")
+
+    def __delitem__(self, key):
+        del self._cache_for(key)[key]
+
+    def __contains__(self, key):
+        return key in self._cache_for(key)
+
+    def __len__(self):
+        return sum(len(cache) for cache in self._caches.values())
+
+    def items(self):
+        for cache in self._caches.values():
+            yield from cache.items()
+
+    def clear(self):
+        self._caches = {}
+
+    def get_footprint(self) -> dict:
+        """
+        Reports entries, bytes and budget per namespace.
+
+        Returns:
+            dict: {namespace: {"entries": int, "bytes": int, "budget_bytes": int, "evictions": int}}
+        """
+        return {
+            namespace: {
+                "entries": len(cache),
+                "bytes": int(cache.currsize),
+                "budget_bytes": int(self.namespace_budgets.get(namespace, 0)),
+                "evictions": cache.evictions
+            }
+            for namespace, cache in self._caches.items()
+        }
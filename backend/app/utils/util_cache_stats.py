@@ -0,0 +1,69 @@
+import threading
+from collections import defaultdict
+from cachetools import LRUCache
+from backend.app.utils.util_cache_namespaces import get_cache_namespace
+
+
+class CacheStatistics:
+    """
+    Thread-safe hit/miss counters and saved compute time per cache namespace.
+
+    The compute time of a key is recorded when its value is produced; every later hit on
+    that key adds the recorded time to the namespace's "compute_seconds_saved".
+    """
+
+    def __init__(self, max_tracked_keys: int = 10000):
+        """
+        Args:
+            max_tracked_keys (int): Number of keys whose compute time is remembered.
+        """
+        self._lock = threading.Lock()
+        self._counters = defaultdict(lambda: {"hits": 0, "misses": 0, "compute_seconds": 0.0,
+                                              "compute_seconds_saved": 0.0})
+        self._compute_times = LRUCache(maxsize=max_tracked_keys)
+
+    def record_hit(self, key: str):
+        with self._lock:
+            counters = self._counters[get_cache_namespace(key)]
+            counters["hits"] += 1
+            counters["compute_seconds_saved"] += self._compute_times.get(key, 0.0)
+
+    def record_miss(self, key: str):
+        with self._lock:
+            self._counters[get_cache_namespace(key)]["misses"] += 1
+
+    def record_compute_time(self, key: str, seconds: float):
+        with self._lock:
+            self._compute_times[key] = seconds
+            self._counters[get_cache_namespace(key)]["compute_seconds"] += seconds
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._compute_times.clear()
+
+    def snapshot(self, footprint: dict = None) -> dict:
+        """
+        Combines the counters with the in-memory footprint of each namespace.
+
+        Args:
+            footprint (dict, optional): Output of NamespacedCache.get_footprint().
+
+        Returns:
+            dict: {namespace: {"hits", "misses", "hit_ratio", "compute_seconds", "compute_seconds_saved",
+                   "entries", "bytes", "budget_bytes", "evictions"}}
+        """
+        footprint = footprint or {}
+        with self._lock:
+            namespaces = set(self._counters) | set(footprint)
+            result = {}
+            for namespace in sorted(namespaces):
+                counters = dict(self._counters.get(namespace, {"hits": 0, "misses": 0, "compute_seconds": 0.0,
+                                                                "compute_seconds_saved": 0.0}))
+                lookups = counters["hits"] + counters["misses"]
+                counters["hit_ratio"] = round(counters["hits"] / lookups, 4) if lookups else None
+                counters["compute_seconds"] = round(counters["compute_seconds"], 3)
+                counters["compute_seconds_saved"] = round(counters["compute_seconds_saved"], 3)
+                counters.update(footprint.get(namespace, {"entries": 0, "bytes": 0, "budget_bytes": 0, "evictions": 0}))
+                result[namespace] = counters
+        return result
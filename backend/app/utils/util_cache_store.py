@@ -0,0 +1,283 @@
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Tuple, Union
+from pymongo.errors import OperationFailure
+from backend.app.utils.util_logger import Logger  # Import the Logger class
+
+
+class CacheStore:
+    """
+    Interface for persistent cache back ends used by CacheManager.
+
+    A store only deals with already serialized payloads (bytes) keyed by cache key.
+    Serialization and the decision which entries are persisted stay in CacheManager,
+    so any store implementing these methods can be plugged in behind get/set.
+    """
+
+    def load(self, limit: int) -> List[Tuple[str, bytes]]:
+        """Returns up to `limit` of the most recently written entries, oldest first."""
+        raise NotImplementedError
+
+    def get(self, key: str) -> Union[bytes, None]:
+        """Returns the payload stored for `key` or None."""
+        raise NotImplementedError
+
+    def put(self, key: str, payload: bytes):
+        """Writes or replaces a single entry."""
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        """Removes a single entry."""
+        raise NotImplementedError
+
+    def clear(self):
+        """Removes all entries."""
+        raise NotImplementedError
+
+    def compact(self):
+        """Reclaims space taken by stale entries."""
+        pass
+
+    def close(self):
+        """Releases all resources held by the store."""
+        pass
+
+
+class SQLiteCacheStore(CacheStore):
+    """
+    Persistent cache store backed by a single SQLite table keyed by cache key.
+
+    Every write touches only the affected row (O(1) instead of rewriting the whole cache),
+    the write-ahead log keeps the file consistent if the process dies mid-write, and a
+    background thread periodically trims the table to `max_entries` and vacuums freed pages.
+    """
+
+    def __init__(self, db_path: str = "cache.db", max_entries: int = 10000, compaction_interval: float = 300):
+        """
+        Opens (or creates) the SQLite cache database.
+
+        Args:
+            db_path (str): File path of the SQLite database.
+            max_entries (int): Maximum number of rows kept after compaction.
+            compaction_interval (float): Seconds between background compactions (0 disables the thread).
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._connection = self._open()
+
+        self._compaction_thread = None
+        if compaction_interval and compaction_interval > 0:
+            self._compaction_thread = threading.Thread(
+                target=self._compaction_loop, args=(compaction_interval,), name="cache-store-compaction", daemon=True
+            )
+            self._compaction_thread.start()
+        Logger.info(f"[CACHE STORE] SQLite cache store opened at {self.db_path} (max entries: {self.max_entries}).")
+
+    def _open(self) -> sqlite3.Connection:
+        """
+        Opens the database and recovers from a corrupted file by moving it aside.
+
+        Returns:
+            sqlite3.Connection: The open connection.
+        """
+        try:
+            connection = self._connect()
+            result = connection.execute("PRAGMA quick_check").fetchone()
+            if result is None or result[0] != "ok":
+                connection.close()
+                raise sqlite3.DatabaseError(f"quick_check returned {result}")
+            return connection
+        except sqlite3.DatabaseError as e:
+            corrupt_path = f"{self.db_path}.corrupt-{int(time.time())}"
+            Logger.error(f"[CACHE STORE] Cache database {self.db_path} is corrupted ({e}). Moving it to {corrupt_path}.")
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(self.db_path + suffix):
+                    os.replace(self.db_path + suffix, corrupt_path + suffix)
+            return self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Creates the connection, pragmas and schema."""
+        connection = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        # auto_vacuum has to be set before the first table is created to take effect.
+        connection.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, updated_at REAL NOT NULL)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_cache_entries_updated_at ON cache_entries(updated_at)")
+        return connection
+
+    def load(self, limit: int) -> List[Tuple[str, bytes]]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT key, value FROM cache_entries ORDER BY updated_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        rows.reverse()
+        return rows
+
+    def get(self, key: str) -> Union[bytes, None]:
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM cache_entries WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, payload: bytes):
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, updated_at) VALUES (?, ?, ?)",
+                (key, sqlite3.Binary(payload), time.time())
+            )
+
+    def delete(self, key: str):
+        with self._lock:
+            self._connection.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM cache_entries")
+            self._connection.execute("PRAGMA incremental_vacuum")
+        Logger.info(f"[CACHE STORE] Cleared all entries from {self.db_path}.")
+
+    def compact(self):
+        """
+        Deletes everything but the `max_entries` most recently written rows, returns the freed
+        pages to the file system and truncates the write-ahead log.
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM cache_entries WHERE key NOT IN "
+                "(SELECT key FROM cache_entries ORDER BY updated_at DESC LIMIT ?)",
+                (self.max_entries,)
+            )
+            self._connection.execute("PRAGMA incremental_vacuum")
+            self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        if cursor.rowcount:
+            Logger.info(f"[CACHE STORE] Compaction removed {cursor.rowcount} stale entries from {self.db_path}.")
+
+    def _compaction_loop(self, interval: float):
+        """Runs compact() every `interval` seconds until the store is closed."""
+        while not self._stop_event.wait(interval):
+            try:
+                self.compact()
+            except Exception as e:
+                Logger.error(f"[CACHE STORE ERROR] Compaction failed: {e}")
+
+    def close(self):
+        self._stop_event.set()
+        if self._compaction_thread is not None:
+            self._compaction_thread.join(timeout=5)
+        with self._lock:
+            self._connection.close()
+        Logger.info(f"[CACHE STORE] SQLite cache store at {self.db_path} closed.")
+
+
+class MongoCacheStore(CacheStore):
+    """
+    Shared cache tier backed by a MongoDB collection, readable by every worker and node.
+
+    Each entry is one document {_id: key, value: payload, updated_at: date}. A TTL index on
+    `updated_at` lets MongoDB expire entries on its own; reads additionally ignore documents
+    older than the TTL because the TTL monitor only runs about once a minute.
+    """
+
+    def __init__(self, collection, ttl_seconds: float = 86400):
+        """
+        Args:
+            collection: pymongo collection holding the shared entries.
+            ttl_seconds (float): Lifetime of an entry after its last write (0 disables expiry).
+        """
+        self.collection = collection
+        self.ttl_seconds = ttl_seconds
+        if ttl_seconds and ttl_seconds > 0:
+            self._ensure_ttl_index()
+        Logger.info(f"[CACHE STORE] Shared Mongo cache tier using collection '{collection.name}' (TTL: {ttl_seconds}s).")
+
+    def _ensure_ttl_index(self):
+        """Creates the TTL index or updates its expiry if the index exists with another value."""
+        try:
+            self.collection.create_index("updated_at", expireAfterSeconds=int(self.ttl_seconds))
+        except OperationFailure:
+            self.collection.database.command({
+                "collMod": self.collection.name,
+                "index": {"keyPattern": {"updated_at": 1}, "expireAfterSeconds": int(self.ttl_seconds)}
+            })
+
+    def _fresh_query(self, query: dict) -> dict:
+        if self.ttl_seconds and self.ttl_seconds > 0:
+            query["updated_at"] = {"$gt": datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds)}
+        return query
+
+    def load(self, limit: int) -> List[Tuple[str, bytes]]:
+        documents = self.collection.find(self._fresh_query({})).sort("updated_at", -1).limit(limit)
+        rows = [(document["_id"], bytes(document["value"])) for document in documents]
+        rows.reverse()
+        return rows
+
+    def get(self, key: str) -> Union[bytes, None]:
+        document = self.collection.find_one(self._fresh_query({"_id": key}), {"value": 1})
+        return bytes(document["value"]) if document else None
+
+    def put(self, key: str, payload: bytes):
+        self.collection.replace_one(
+            {"_id": key}, {"_id": key, "value": payload, "updated_at": datetime.now(timezone.utc)}, upsert=True
+        )
+
+    def delete(self, key: str):
+        self.collection.delete_one({"_id": key})
+
+    def clear(self):
+        self.collection.delete_many({})
+        Logger.info(f"[CACHE STORE] Cleared all entries from shared collection '{self.collection.name}'.")
+
+
+class MemoryCacheStore(CacheStore):
+    """
+    In-process stand-in for a shared cache tier. Several CacheManager instances handed the
+    same MemoryCacheStore behave like workers sharing one MongoCacheStore.
+    """
+
+    def __init__(self, ttl_seconds: float = 0):
+        """
+        Args:
+            ttl_seconds (float): Lifetime of an entry after its last write (0 disables expiry).
+        """
+        self.ttl_seconds = ttl_seconds
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _is_fresh(self, updated_at: float) -> bool:
+        return not self.ttl_seconds or time.time() - updated_at < self.ttl_seconds
+
+    def load(self, limit: int) -> List[Tuple[str, bytes]]:
+        with self._lock:
+            rows = sorted(
+                ((updated_at, key, payload) for key, (payload, updated_at) in self._entries.items()
+                 if self._is_fresh(updated_at)),
+                key=lambda row: row[0]
+            )
+        return [(key, payload) for _, key, payload in rows[-limit:]] if limit > 0 else []
+
+    def get(self, key: str) -> Union[bytes, None]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not self._is_fresh(entry[1]):
+                return None
+            return entry[0]
+
+    def put(self, key: str, payload: bytes):
+        with self._lock:
+            self._entries[key] = (payload, time.time())
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -1,4 +1,5 @@
 import configparser
+import importlib.util
 import json
 import os
 import torch
@@ -109,11 +110,16 @@ class ConfigManager:
     def get_torch_device(self) -> str:
         """
         Returns the appropriate torch device based on CUDA availability and config settings.
+        The device is determined once and cached like the configuration values.
         """
+        if 'DEVICE.torch_device' in self._config_cache:
+            return self._config_cache['DEVICE.torch_device']
         gpu_device = self.get_config_value('DEVICE', 'TORCH_GPU_DEVICE', str)
         cpu_device = self.get_config_value('DEVICE', 'TORCH_CPU_DEVICE', str)
-        device = gpu_device if torch.cuda.is_available() else cpu_device
-        Logger.info(f"Torch device selected: {device} ({'GPU' if torch.cuda.is_available() else 'CPU'})")
+        cuda_available = torch.cuda.is_available()
+        device = gpu_device if cuda_available else cpu_device
+        self._config_cache['DEVICE.torch_device'] = device
+        Logger.info(f"Torch device selected: {device} ({'GPU' if cuda_available else 'CPU'})")
         return device
 
     def get_rest_config(self) -> dict:
@@ -146,6 +152,157 @@ class ConfigManager:
         Logger.info("MongoDB configuration retrieved.")
         return config
 
+    def get_cache_config(self) -> dict:
+        """
+        Returns cache configuration as a dictionary.
+        """
+        max_entries = self.get_config_value('CACHE', 'MAX_ENTRIES', int)
+        config = {
+            'max_entries': max_entries,
+            'store_path': self.get_config_value('CACHE', 'STORE_PATH', str, default='./cache.db'),
+            'store_max_entries': self.get_config_value('CACHE', 'STORE_MAX_ENTRIES', int, default=max_entries),
+            'compaction_interval': self.get_config_value('CACHE', 'COMPACTION_INTERVAL_S', float, default=300),
+            'namespace_budgets': {
+                namespace: int(float(budget_mb) * 1024 * 1024)
+                for namespace, budget_mb in self.get_config_value('CACHE', 'NAMESPACE_BUDGETS_MB', dict, default='{}').items()
+            },
+            'shared_tier': self.get_config_value('CACHE', 'SHARED_TIER', str, default='none').strip().lower(),
+            'shared_collection': self.get_config_value('CACHE', 'SHARED_COLLECTION', str, default='cache_entries').strip(),
+            'shared_ttl': self.get_config_value('CACHE', 'SHARED_TTL_S', float, default=86400),
+            'shared_max_item_bytes': int(self.get_config_value('CACHE', 'SHARED_MAX_ITEM_MB', float, default=8) * 1024 * 1024),
+            'blob_path': self.get_config_value('CACHE', 'BLOB_PATH', str, default='./blobs').strip(),
+            'blob_max_bytes': int(self.get_config_value('CACHE', 'BLOB_MAX_MB', float, default=2048) * 1024 * 1024),
+            'warm_start': self.get_config_value('CACHE', 'WARM_START', str, default='True').strip().lower() in ('true', '1', 'yes'),
+            'cache_version': self.get_config_value('CACHE', 'VERSION', str, default='1').strip(),
+            'version_tags': self.get_cache_version_tags(),
+            'compression': self.get_config_value('CACHE', 'COMPRESSION', str, default='auto').strip().lower(),
+            'compression_min_bytes': self.get_config_value('CACHE', 'COMPRESSION_MIN_BYTES', int, default=1024),
+            'compression_level': self.get_config_value('CACHE', 'COMPRESSION_LEVEL', int, default=3)
+        }
+        Logger.info("Cache configuration retrieved.")
+        return config
+
+    def get_model_revision(self, model_name: str) -> str:
+        """
+        Returns the configured revision of a model from [MODELS] REVISIONS (default "main").
+        """
+        revisions = self.get_config_value('MODELS', 'REVISIONS', dict, default='{}')
+        return str(revisions.get(model_name.strip(), 'main'))
+
+    def get_translation_quantization(self, model_name: str) -> str:
+        """
+        Returns the quantization mode of a translation model: "int8" (dynamic int8 quantization of the
+        Linear layers, CPU only) or "none". [TRANSLATE] QUANTIZATION_MODELS overrides QUANTIZATION per model.
+        """
+        default = self.get_config_value('TRANSLATE', 'QUANTIZATION', str, default='none').strip().lower()
+        overrides = self.get_config_value('TRANSLATE', 'QUANTIZATION_MODELS', dict, default='{}')
+        mode = str(overrides.get(model_name.strip(), default)).strip().lower()
+        if mode not in ('none', 'int8'):
+            Logger.warning(f"Unsupported quantization '{mode}' for model '{model_name}'. Using 'none'.")
+            return 'none'
+        return mode
+
+    def get_translation_engine_config(self, model_name: str) -> dict:
+        """
+        Returns the engine of a translation model from [TRANSLATE] ENGINES ("opus" by default) and the
+        options it is created with: {"engine": str, "options": dict}.
+
+        A model configured for "ctranslate2" uses "opus" if the ctranslate2 package is not installed or
+        its converted model directory does not exist, so the engine returned is the one that runs.
+        The engine of a model is resolved once and cached like the configuration values.
+        """
+        name = model_name.strip()
+        cache_key = f'TRANSLATE.engine_config.{name}'
+        if cache_key not in self._config_cache:
+            self._config_cache[cache_key] = self._resolve_translation_engine_config(name)
+        return self._config_cache[cache_key]
+
+    def _resolve_translation_engine_config(self, name: str) -> dict:
+        """Resolves the engine of a translation model for get_translation_engine_config."""
+        engine = str(self.get_config_value('TRANSLATE', 'ENGINES', dict, default='{}').get(name, 'opus')).strip().lower()
+        revision = self.get_model_revision(name)
+        if engine == 'ctranslate2':
+            model_paths = self.get_config_value('TRANSLATE', 'CTRANSLATE2_MODELS', dict, default='{}')
+            model_path = str(model_paths.get(name, '')).strip()
+            if importlib.util.find_spec('ctranslate2') is None:
+                Logger.warning(f"ctranslate2 is not installed; using the 'opus' engine for '{name}'.")
+                engine = 'opus'
+            elif not model_path or not os.path.isdir(model_path):
+                Logger.warning(f"No converted CTranslate2 model at '{model_path}' for '{name}'; using the 'opus' engine.")
+                engine = 'opus'
+            else:
+                options = {
+                    'model_path': model_path,
+                    'compute_type': self.get_config_value('TRANSLATE', 'CTRANSLATE2_COMPUTE_TYPE', str, default='default').strip(),
+                    'revision': revision
+                }
+                return {'engine': engine, 'options': options}
+        if engine != 'opus':
+            Logger.warning(f"Unsupported translation engine '{engine}' for model '{name}'. Using 'opus'.")
+            engine = 'opus'
+        options = {'quantization': self.get_translation_quantization(name), 'revision': revision}
+        return {'engine': engine, 'options': options}
+
+    def get_cache_version_tags(self) -> dict:
+        """
+        Maps the cache key prefix of every configured model to "<model>@<revision>", so cached results
+        are invalidated when a model is swapped or its revision changes. Translation models on another
+        engine or quantized are tagged "<model>@<revision>:ctranslate2-<compute type>" or "<model>@<revision>:int8",
+        following the engine that actually runs (see get_translation_engine_config).
+        """
+        tags = {}
+        for model_name in self.get_translation_models():
+            tag = f"{model_name}@{self.get_model_revision(model_name)}"
+            engine_config = self.get_translation_engine_config(model_name)
+            if engine_config['engine'] == 'ctranslate2':
+                tag = f"{tag}:ctranslate2-{engine_config['options']['compute_type']}"
+            elif engine_config['options']['quantization'] != 'none':
+                tag = f"{tag}:{engine_config['options']['quantization']}"
+            tags[f"{model_name}-"] = tag
+            tags[f"tm-{model_name}-"] = tag
+        for model_name in self.get_tts_models():
+            tags[f"tts-{model_name}-"] = f"{model_name}@{self.get_model_revision(model_name)}"
+        stt_model = self.get_stt_models().strip()
+        tags["stt-"] = f"{stt_model}@{self.get_model_revision(stt_model)}"
+        return tags
+
+    def get_model_registry_config(self) -> dict:
+        """
+        Returns ModelRegistry configuration as a dictionary.
+        """
+        config = {
+            'preload': self.get_config_value('MODELS', 'PRELOAD', str, default='True').strip().lower() in ('true', '1', 'yes'),
+            'ram_budget_bytes': int(self.get_config_value('MODELS', 'RAM_BUDGET_MB', float, default=0) * 1024 * 1024),
+            'idle_timeout': self.get_config_value('MODELS', 'IDLE_TIMEOUT_S', float, default=0)
+        }
+        Logger.info("Model registry configuration retrieved.")
+        return config
+
+    def get_batch_scheduler_config(self) -> dict:
+        """
+        Returns BatchScheduler configuration as a dictionary.
+        """
+        config = {
+            'max_wait_ms': self.get_config_value('TRANSLATE', 'BATCH_MAX_WAIT_MS', float, default=10),
+            'max_batch_size': self.get_config_value('TRANSLATE', 'BATCH_MAX_SEGMENTS', int, default=64)
+        }
+        Logger.info("Batch scheduler configuration retrieved.")
+        return config
+
+    def get_job_config(self) -> dict:
+        """
+        Returns JobManager configuration as a dictionary.
+        """
+        config = {
+            'collection': self.get_config_value('JOBS', 'COLLECTION', str, default='jobs').strip(),
+            'workers': self.get_config_value('JOBS', 'WORKERS', int, default=1),
+            'poll_interval': self.get_config_value('JOBS', 'POLL_INTERVAL_S', float, default=2),
+            'lease_seconds': self.get_config_value('JOBS', 'LEASE_S', float, default=60),
+            'pages_per_step': self.get_config_value('JOBS', 'PAGES_PER_STEP', int, default=8)
+        }
+        Logger.info("Job configuration retrieved.")
+        return config
+
     def get_private_key_path(self) -> str:
         """
         Retrieves the path to the private keys file from the configuration.
@@ -0,0 +1,302 @@
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Iterable, List, Tuple, Union
+from pymongo import ReturnDocument
+from backend.app.utils.util_logger import Logger  # Import the Logger class
+
+JOB_STATES = ("queued", "running", "done", "failed", "cancelled")
+
+
+class JobCancelled(Exception):
+    """Raised inside a job handler when the job was cancelled while running."""
+
+
+class JobContext:
+    """
+    Progress and cancellation handle passed to a job handler.
+
+    Work is split into units (e.g. page numbers). Completed units are persisted with the job, so a
+    job resumed after a restart only processes the units that were not completed before.
+    Updates are only written while the job is still owned by the worker that claimed it.
+    """
+
+    def __init__(self, collection, job: dict):
+        self.collection = collection
+        self.job_id = job["_id"]
+        self.owner = job.get("owner")
+        self.completed = set(job.get("completed_units") or [])
+
+    def run(self, units: Iterable, fn: Callable[[List], None], step: int = 1) -> int:
+        """
+        Processes the units that are not completed yet in chunks of `step` units.
+
+        Before every chunk the job is checked for cancellation; after every chunk the chunk is
+        recorded as completed and the progress is updated.
+
+        Args:
+            units (Iterable): All units of the job, in processing order.
+            fn (Callable): Processes one chunk (a list of units).
+            step (int): Units per chunk.
+
+        Returns:
+            int: Number of units processed by this run.
+
+        Raises:
+            JobCancelled: If the job was cancelled.
+        """
+        units = list(units)
+        pending = [unit for unit in units if unit not in self.completed]
+        self._update({"$set": {"progress.total": len(units), "progress.done": len(units) - len(pending)}})
+        step = max(1, step)
+        for start in range(0, len(pending), step):
+            self.check_cancelled()
+            chunk = pending[start:start + step]
+            fn(chunk)
+            self.completed.update(chunk)
+            self._update({"$addToSet": {"completed_units": {"$each": chunk}},
+                          "$set": {"progress.done": len(units) - len(pending) + start + len(chunk)}})
+        return len(pending)
+
+    def check_cancelled(self):
+        """
+        Raises JobCancelled if cancellation of the job was requested, or if another worker took the
+        job over after the lease of this worker expired.
+        """
+        job = self.collection.find_one({"_id": self.job_id}, {"cancel_requested": 1, "owner": 1})
+        if job is None or job.get("cancel_requested") or job.get("owner") != self.owner:
+            raise JobCancelled(self.job_id)
+
+    def _update(self, update: dict):
+        update.setdefault("$set", {})["updated_at"] = time.time()
+        self.collection.update_one({"_id": self.job_id, "owner": self.owner}, update)
+
+
+class JobManager:
+    """
+    Singleton running long operations (book translation, TTS rendering, OCR re-runs) as background jobs.
+
+    Jobs are persisted in a MongoDB collection as documents
+    {_id, type, user, params, status, progress: {done, total}, completed_units, result, error, ...}.
+    Worker threads claim queued jobs atomically and run the handler registered for the job type.
+    A running job is owned by the claiming process (`owner`) and holds a lease (`lease_expires_at`)
+    that a heartbeat thread renews. Running jobs whose lease expired, because their process stopped,
+    are queued again, and their handlers skip the units completed before; jobs of live processes,
+    e.g. other workers of the same deployment, are left alone.
+    """
+    _instance = None  # Singleton instance
+
+    def __new__(cls, collection=None, workers: int = 1, poll_interval: float = 2.0, lease_seconds: float = 60.0):
+        if cls._instance is None:
+            cls._instance = super(JobManager, cls).__new__(cls)
+            cls._instance._initialize(collection, workers, poll_interval, lease_seconds)
+        return cls._instance
+
+    def _initialize(self, collection, workers: int, poll_interval: float, lease_seconds: float):
+        """
+        Args:
+            collection: pymongo collection holding the jobs.
+            workers (int): Number of worker threads running jobs.
+            poll_interval (float): Seconds an idle worker waits before looking for jobs submitted
+                by other processes.
+            lease_seconds (float): Seconds a running job stays owned by this process without a
+                heartbeat; the lease is renewed every third of this time.
+        """
+        self.collection = collection
+        self.workers = max(1, workers)
+        self.poll_interval = max(0.01, poll_interval)
+        self.lease_seconds = max(0.03, lease_seconds)
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._handlers: Dict[str, Tuple[Callable, Tuple[str, ...]]] = {}
+        self._threads: List[threading.Thread] = []
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        Logger.info(f"[JOBS] JobManager initialized ({self.workers} worker(s), poll interval: {poll_interval}s).")
+
+    def register_handler(self, job_type: str, handler: Callable[[dict, JobContext], dict],
+                         required_params: Tuple[str, ...] = ()):
+        """
+        Registers the function running jobs of a type.
+
+        Args:
+            job_type (str): Job type, e.g. "translate_book".
+            handler (Callable): Called with the job document and a JobContext; returns the job result.
+            required_params (Tuple[str, ...]): Parameters a submitted job of this type must contain.
+        """
+        self._handlers[job_type] = (handler, tuple(required_params))
+        Logger.info(f"[JOBS] Registered handler for job type '{job_type}'.")
+
+    def get_job_types(self) -> List[str]:
+        """Returns the registered job types."""
+        return sorted(self._handlers)
+
+    def submit(self, job_type: str, params: dict, user: str = None) -> str:
+        """
+        Persists a new job and wakes up a worker.
+
+        Args:
+            job_type (str): Registered job type.
+            params (dict): Parameters passed to the handler.
+            user (str): Owner of the job.
+
+        Returns:
+            str: The job id.
+
+        Raises:
+            ValueError: If the job type is unknown or required parameters are missing.
+        """
+        if job_type not in self._handlers:
+            raise ValueError(f"Unsupported job type '{job_type}'. Available: {', '.join(self.get_job_types())}")
+        missing = [name for name in self._handlers[job_type][1] if params.get(name) in (None, "")]
+        if missing:
+            raise ValueError(f"Missing required parameters for '{job_type}': {', '.join(missing)}")
+
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        self.collection.insert_one({
+            "_id": job_id, "type": job_type, "user": user, "params": params, "status": "queued",
+            "progress": {"done": 0, "total": 0}, "completed_units": [], "result": None, "error": None,
+            "cancel_requested": False, "attempts": 0, "created_at": now, "updated_at": now
+        })
+        Logger.info(f"[JOBS] Submitted job {job_id} of type '{job_type}'.")
+        self._wakeup.set()
+        return job_id
+
+    def get(self, job_id: str) -> Union[dict, None]:
+        """
+        Returns the status of a job.
+
+        Args:
+            job_id (str): The job id.
+
+        Returns:
+            dict | None: The job without its list of completed units, or None if it does not exist.
+        """
+        return self.collection.find_one({"_id": job_id}, {"completed_units": 0})
+
+    def cancel(self, job_id: str) -> Union[dict, None]:
+        """
+        Cancels a job. A queued job is cancelled right away; a running job stops before its next chunk of work.
+
+        Args:
+            job_id (str): The job id.
+
+        Returns:
+            dict | None: The updated job, or None if it does not exist.
+        """
+        now = time.time()
+        self.collection.update_one({"_id": job_id, "status": "queued"},
+                                   {"$set": {"status": "cancelled", "cancel_requested": True, "updated_at": now}})
+        self.collection.update_one({"_id": job_id, "status": "running"},
+                                   {"$set": {"cancel_requested": True, "updated_at": now}})
+        job = self.get(job_id)
+        if job:
+            Logger.info(f"[JOBS] Cancellation requested for job {job_id} (status: {job['status']}).")
+        return job
+
+    def start(self):
+        """
+        Starts the worker threads and the heartbeat thread renewing the leases of their jobs.
+        """
+        if self._threads:
+            return
+        self._stopping.clear()
+        heartbeat = threading.Thread(target=self._heartbeat, name="job-heartbeat", daemon=True)
+        heartbeat.start()
+        self._threads.append(heartbeat)
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"job-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = None):
+        """
+        Stops the worker threads after their current job.
+
+        Args:
+            timeout (float): Seconds to wait for each worker thread.
+        """
+        self._stopping.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def get_stats(self) -> dict:
+        """Returns the number of jobs per state."""
+        if self.collection is None:
+            return {}
+        return {state: self.collection.count_documents({"status": state}) for state in JOB_STATES}
+
+    def _run(self):
+        """Worker loop: runs queued jobs until the manager is stopped."""
+        while not self._stopping.is_set():
+            try:
+                job = self._claim()
+            except Exception as e:
+                Logger.error(f"[JOBS] Claiming a job failed: {str(e)}")
+                job = None
+            if job is None:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+                continue
+            self._execute(job)
+
+    def _heartbeat(self):
+        """Renews the leases of the jobs run by this process until the manager is stopped."""
+        while not self._stopping.wait(self.lease_seconds / 3):
+            try:
+                self.collection.update_many({"status": "running", "owner": self.worker_id},
+                                            {"$set": {"lease_expires_at": time.time() + self.lease_seconds}})
+            except Exception as e:
+                Logger.error(f"[JOBS] Renewing job leases failed: {str(e)}")
+
+    def _requeue_expired(self):
+        """Queues the running jobs again whose lease expired, because the process running them stopped."""
+        now = time.time()
+        resumed = self.collection.update_many(
+            {"status": "running",
+             "$or": [{"lease_expires_at": {"$lt": now}}, {"lease_expires_at": {"$exists": False}}]},
+            {"$set": {"status": "queued", "updated_at": now}, "$unset": {"owner": "", "lease_expires_at": ""}}
+        )
+        if resumed.modified_count:
+            Logger.info(f"[JOBS] Resuming {resumed.modified_count} interrupted job(s).")
+
+    def _claim(self) -> Union[dict, None]:
+        """Atomically marks the oldest queued job as running by this process and returns it."""
+        self._requeue_expired()
+        now = time.time()
+        return self.collection.find_one_and_update(
+            {"status": "queued"},
+            {"$set": {"status": "running", "owner": self.worker_id, "lease_expires_at": now + self.lease_seconds,
+                      "started_at": now, "updated_at": now},
+             "$inc": {"attempts": 1}},
+            sort=[("created_at", 1)],
+            return_document=ReturnDocument.AFTER
+        )
+
+    def _execute(self, job: dict):
+        """Runs the handler of a claimed job and stores its outcome."""
+        job_id = job["_id"]
+        started = time.perf_counter()
+        Logger.info(f"[JOBS] Running job {job_id} of type '{job['type']}' (attempt {job.get('attempts', 1)}).")
+        try:
+            if job["type"] not in self._handlers:
+                raise ValueError(f"No handler registered for job type '{job['type']}'")
+            handler = self._handlers[job["type"]][0]
+            result = handler(job, JobContext(self.collection, job))
+            outcome = {"status": "done", "result": result}
+            Logger.info(f"[JOBS] Job {job_id} finished in {time.perf_counter() - started:.1f}s.")
+        except JobCancelled:
+            outcome = {"status": "cancelled"}
+            Logger.info(f"[JOBS] Job {job_id} cancelled.")
+        except Exception as e:
+            outcome = {"status": "failed", "error": str(e)}
+            Logger.error(f"[JOBS] Job {job_id} failed: {str(e)}")
+        outcome["updated_at"] = outcome["finished_at"] = time.time()
+        stored = self.collection.update_one({"_id": job_id, "owner": self.worker_id},
+                                            {"$set": outcome, "$unset": {"lease_expires_at": ""}})
+        if not stored.matched_count:
+            Logger.warning(f"[JOBS] Job {job_id} was taken over by another worker; its outcome is discarded.")
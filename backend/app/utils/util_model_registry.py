@@ -0,0 +1,265 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict
+from backend.app.utils.util_cache_namespaces import estimate_size
+from backend.app.utils.util_logger import Logger  # Import the Logger class
+
+
+class _ModelEntry:
+    """Bookkeeping for a single registered model."""
+
+    def __init__(self, key: str, loader: Callable):
+        self.key = key
+        self.loader = loader
+        self.model = None
+        self.size_bytes = 0
+        self.refcount = 0
+        self.last_used = 0.0
+        self.loads = 0
+        self.acquires = 0
+        self.unloads = 0
+        self.load_seconds = 0.0
+        self.load_lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self.model is not None
+
+
+class ModelRegistry:
+    """
+    Singleton owning every loaded translation, TTS and STT model.
+
+    Models are registered with a loader and loaded lazily on first use. Each loaded model is
+    accounted with its parameter memory; when the configured RAM budget is exceeded, the least
+    recently used idle models are unloaded. Models used by in-flight requests (acquired and not
+    yet released) are pinned and never unloaded. A background thread unloads models that have
+    been idle longer than `idle_timeout` seconds.
+    """
+    _instance = None  # Singleton instance
+
+    def __new__(cls, ram_budget_bytes: int = 0, idle_timeout: float = 0):
+        if cls._instance is None:
+            cls._instance = super(ModelRegistry, cls).__new__(cls)
+            cls._instance._initialize(ram_budget_bytes, idle_timeout)
+        return cls._instance
+
+    def _initialize(self, ram_budget_bytes: int, idle_timeout: float):
+        """
+        Args:
+            ram_budget_bytes (int): Total bytes all loaded models may occupy (0 disables the budget).
+            idle_timeout (float): Seconds after which an unused model is unloaded (0 disables idle unloading).
+        """
+        self.ram_budget_bytes = ram_budget_bytes
+        self.idle_timeout = idle_timeout
+        self._entries: Dict[str, _ModelEntry] = {}
+        self._lock = threading.RLock()
+        self._stop_event = threading.Event()
+
+        self._reaper_thread = None
+        if idle_timeout and idle_timeout > 0:
+            self._reaper_thread = threading.Thread(target=self._reaper_loop, name="model-registry-reaper", daemon=True)
+            self._reaper_thread.start()
+        Logger.info(f"[MODELS] ModelRegistry initialized (RAM budget: {ram_budget_bytes} bytes, idle timeout: {idle_timeout}s).")
+
+    def register(self, key: str, loader: Callable):
+        """
+        Registers a loader for a model without loading it.
+
+        Args:
+            key (str): Registry key, e.g. "translation:opus:Helsinki-NLP/opus-mt-en-de".
+            loader (Callable): Function without arguments that returns the loaded model.
+        """
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = _ModelEntry(key, loader)
+                Logger.info(f"[MODELS] Registered model '{key}'.")
+
+    def preload(self, key: str, loader: Callable = None):
+        """
+        Loads a model eagerly (e.g. at startup) without pinning it.
+        """
+        with self.acquire(key, loader):
+            pass
+
+    @contextmanager
+    def acquire(self, key: str, loader: Callable = None):
+        """
+        Context manager that loads the model if necessary and pins it while the block runs.
+
+        Args:
+            key (str): Registry key of the model.
+            loader (Callable, optional): Loader used to register the model if it is unknown.
+
+        Yields:
+            The loaded model object.
+
+        Raises:
+            KeyError: If the model is neither registered nor a loader is given.
+        """
+        entry = self._pin(key, loader)
+        try:
+            yield self._ensure_loaded(entry)
+        finally:
+            with self._lock:
+                entry.refcount -= 1
+                entry.last_used = time.monotonic()
+
+    def _pin(self, key: str, loader: Callable) -> _ModelEntry:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if loader is None:
+                    raise KeyError(f"Model '{key}' is not registered.")
+                entry = self._entries[key] = _ModelEntry(key, loader)
+            entry.refcount += 1
+            entry.acquires += 1
+            entry.last_used = time.monotonic()
+            return entry
+
+    def _ensure_loaded(self, entry: _ModelEntry):
+        """Loads a pinned entry once, even if several threads request it at the same time."""
+        if entry.loaded:
+            return entry.model
+        with entry.load_lock:
+            if entry.loaded:
+                return entry.model
+            Logger.info(f"[MODELS] Loading model '{entry.key}'...")
+            started = time.perf_counter()
+            model = entry.loader()
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                entry.model = model
+                entry.size_bytes = estimate_size(model)
+                entry.loads += 1
+                entry.load_seconds = elapsed
+            Logger.info(f"[MODELS] Model '{entry.key}' loaded in {elapsed:.1f}s "
+                        f"({entry.size_bytes / (1024 * 1024):.1f} MB).")
+        self._enforce_budget(keep=entry.key)
+        return entry.model
+
+    def _enforce_budget(self, keep: str = None):
+        """Unloads least recently used unpinned models until the loaded models fit the RAM budget."""
+        if not self.ram_budget_bytes:
+            return
+        with self._lock:
+            while self.get_loaded_bytes() > self.ram_budget_bytes:
+                candidates = [
+                    e for e in self._entries.values()
+                    if e.loaded and e.refcount == 0 and e.key != keep
+                ]
+                if not candidates:
+                    Logger.warning(f"[MODELS] RAM budget of {self.ram_budget_bytes} bytes exceeded, "
+                                   f"but all other loaded models are in use.")
+                    return
+                self._unload_entry(min(candidates, key=lambda e: e.last_used))
+
+    def _unload_entry(self, entry: _ModelEntry):
+        """Drops the reference to a model so its memory can be reclaimed. Caller holds the lock."""
+        entry.model = None
+        freed = entry.size_bytes
+        entry.size_bytes = 0
+        entry.unloads += 1
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
+        Logger.info(f"[MODELS] Unloaded model '{entry.key}' ({freed / (1024 * 1024):.1f} MB freed).")
+
+    def unload(self, key: str) -> bool:
+        """
+        Unloads a model if it is loaded and not in use.
+
+        Returns:
+            bool: True if the model was unloaded.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry.loaded or entry.refcount > 0:
+                return False
+            self._unload_entry(entry)
+            return True
+
+    def unload_idle(self, max_idle: float):
+        """Unloads all unpinned models that have not been used for `max_idle` seconds."""
+        now = time.monotonic()
+        with self._lock:
+            for entry in self._entries.values():
+                if entry.loaded and entry.refcount == 0 and now - entry.last_used >= max_idle:
+                    self._unload_entry(entry)
+
+    def _reaper_loop(self):
+        """Unloads idle models every quarter of the idle timeout (at least every second) until stop() is called."""
+        interval = max(1.0, self.idle_timeout / 4)
+        while not self._stop_event.wait(interval):
+            try:
+                self.unload_idle(self.idle_timeout)
+            except Exception as e:
+                Logger.error(f"[MODELS] Idle unloading failed: {e}")
+
+    def stop(self):
+        """Stops the idle reaper thread; loaded models stay loaded."""
+        self._stop_event.set()
+        if self._reaper_thread is not None:
+            self._reaper_thread.join(timeout=5)
+
+    def is_loaded(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry.loaded
+
+    def get_loaded_bytes(self) -> int:
+        with self._lock:
+            return sum(e.size_bytes for e in self._entries.values() if e.loaded)
+
+    def get_stats(self) -> dict:
+        """
+        Returns per-model accounting information.
+
+        Returns:
+            dict: {key: {"loaded", "bytes", "in_flight", "loads", "acquires", "unloads", "load_seconds",
+                   "idle_seconds"}}
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                e.key: {
+                    "loaded": e.loaded,
+                    "bytes": e.size_bytes,
+                    "in_flight": e.refcount,
+                    "loads": e.loads,
+                    "acquires": e.acquires,
+                    "unloads": e.unloads,
+                    "load_seconds": round(e.load_seconds, 3),
+                    "idle_seconds": round(now - e.last_used, 1) if e.last_used else None
+                }
+                for e in self._entries.values()
+            }
+
+    def get_namespace_stats(self) -> dict:
+        """
+        Aggregates the registry in the shape of a cache namespace: acquires of an already loaded model
+        count as hits, loads as misses and unloads as evictions.
+
+        Returns:
+            dict: {"hits", "misses", "hit_ratio", "compute_seconds_saved", "entries", "bytes", "budget_bytes",
+                   "evictions"}
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+            hits = sum(e.acquires - e.loads for e in entries)
+            misses = sum(e.loads for e in entries)
+            lookups = hits + misses
+            return {
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": round(hits / lookups, 4) if lookups else None,
+                "compute_seconds_saved": round(sum((e.acquires - e.loads) * e.load_seconds for e in entries), 3),
+                "entries": sum(1 for e in entries if e.loaded),
+                "bytes": sum(e.size_bytes for e in entries if e.loaded),
+                "budget_bytes": self.ram_budget_bytes,
+                "evictions": sum(e.unloads for e in entries)
+            }
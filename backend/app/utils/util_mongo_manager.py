@@ -1,8 +1,8 @@
 import io
 import json
 import gridfs
-from pymongo import MongoClient, errors
-from typing import Any, Dict, List, Union
+from pymongo import MongoClient, UpdateOne, errors
+from typing import Any, Dict, List, Tuple, Union
 from backend.app.utils.util_config_manager import ConfigManager
 from backend.app.utils import Logger
 from backend.app.utils.util_crypt import CryptoManager
@@ -89,6 +89,23 @@ class MongoDBManager:
         )
         return result
 
+    def bulk_update_documents(
+            self,
+            collection_name: str,
+            updates: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+            upsert: bool = False
+    ) -> Any:
+        if not updates:
+            return None
+        collection = self.get_collection(collection_name)
+        result = collection.bulk_write([UpdateOne(query, update, upsert=upsert) for query, update in updates],
+                                       ordered=False)
+        Logger.info(
+            f"Bulk updated {len(updates)} document(s) in '{collection_name}'. Matched: {result.matched_count}, "
+            f"Modified: {result.modified_count}, Upserted: {result.upserted_count}."
+        )
+        return result
+
     def delete_documents(self, collection_name: str, query: Dict[str, Any], use_gridfs: bool = False) -> None:
         if use_gridfs:
             fs = gridfs.GridFS(self.db, collection=collection_name)
@@ -158,6 +175,11 @@ class MongoDBManager:
         doc = self._retrieve_single_document(user_files_collection, query)
         if not doc or "text" not in doc or "source" not in doc["text"]:
             raise ValueError(f"No valid document found for user={user}, page={page}, title={title}.")
+        return self.decrypt_page_document(user, doc)
+
+    def decrypt_page_document(self, user: str, doc: Dict[str, Any]) -> Union[dict, list]:
+        if not doc or "text" not in doc or "source" not in doc["text"]:
+            raise ValueError(f"No source text in document for user={user}, page={doc.get('page') if doc else None}.")
         decrypted_bytes = self.crypto_manager.decrypt_file(user, doc["text"]["source"])
         return json.loads(decrypted_bytes.decode("utf-8"))
 
@@ -1,5 +1,5 @@
 import fitz
-from typing import List
+from typing import Iterator, List
 from backend.app.utils.util_logger import Logger  # Import the Logger class
 
 class PDFProcessor:
@@ -37,3 +37,27 @@ class PDFProcessor:
         except Exception as e:
             Logger.error(f"Unexpected error during PDF extraction: {str(e)}")
             raise RuntimeError(f"Unexpected error during PDF extraction: {str(e)}")
+
+    @staticmethod
+    def iter_text_from_pdf(file_content: bytes) -> Iterator[str]:
+        """
+        Yields the text of a PDF file page by page, so only the current page is held in memory.
+
+        Args:
+            file_content (bytes): The binary content of the PDF file.
+
+        Yields:
+            str: The text extracted from the next PDF page.
+
+        Raises:
+            RuntimeError: If the PDF cannot be opened.
+        """
+        try:
+            pdf_document = fitz.open("pdf", file_content)
+        except Exception as e:
+            Logger.error(f"Failed to process PDF: {str(e)}")
+            raise RuntimeError(f"Failed to process PDF: {str(e)}")
+        with pdf_document:
+            Logger.info(f"Streaming text of {pdf_document.page_count} page(s) from PDF.")
+            for page in pdf_document:
+                yield page.get_text()
@@ -0,0 +1,74 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict
+from backend.app.utils.util_batch_scheduler import PRIORITIES, PRIORITY_INTERACTIVE, new_wait_stats, record_wait, \
+    summarize_wait_stats
+from backend.app.utils.util_logger import Logger  # Import the Logger class
+
+
+class PriorityGate:
+    """
+    Singleton granting exclusive use of a model to one caller at a time, interactive callers first.
+
+    Models that are not run through the BatchScheduler (TTS synthesis) are held per call. When the
+    model is released, waiting interactive callers are admitted before waiting bulk callers, so a
+    /tts/page request waits for at most the current page of a book-wide render. The wait for the
+    model is measured per priority class.
+    """
+    _instance = None  # Singleton instance
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(PriorityGate, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self._condition = threading.Condition()
+        self._holders = set()
+        self._waiting: Dict[str, Dict[str, int]] = {}
+        self._wait_stats = {priority: new_wait_stats() for priority in PRIORITIES}
+        Logger.info("[PRIORITY GATE] Initialized.")
+
+    @contextmanager
+    def hold(self, key: str, priority: str = PRIORITY_INTERACTIVE):
+        """
+        Blocks until the model `key` is free and no caller of a higher priority class waits for it,
+        then holds the model for the duration of the with-block.
+
+        Args:
+            key (str): Model key, e.g. "tts:tts_models/multilingual/multi-dataset/xtts_v2".
+            priority (str): PRIORITY_INTERACTIVE or PRIORITY_BULK.
+
+        Raises:
+            ValueError: If the priority class is unknown.
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority '{priority}'. Expected one of: {', '.join(PRIORITIES)}")
+        started = time.monotonic()
+        higher = PRIORITIES[:PRIORITIES.index(priority)]
+        with self._condition:
+            waiting = self._waiting.setdefault(key, dict.fromkeys(PRIORITIES, 0))
+            waiting[priority] += 1
+            try:
+                while key in self._holders or any(waiting[other] for other in higher):
+                    self._condition.wait()
+            finally:
+                waiting[priority] -= 1
+            self._holders.add(key)
+            record_wait(self._wait_stats[priority], time.monotonic() - started)
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._holders.discard(key)
+                self._condition.notify_all()
+
+    def get_stats(self) -> dict:
+        """
+        Returns:
+            dict: {priority: {"requests", "segments", "avg_wait_ms", "max_wait_ms"}} for every priority class.
+        """
+        with self._condition:
+            return {priority: summarize_wait_stats(stats) for priority, stats in self._wait_stats.items()}
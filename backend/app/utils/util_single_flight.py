@@ -0,0 +1,80 @@
+import threading
+from typing import Callable
+from backend.app.utils.util_logger import Logger  # Import the Logger class
+
+
+class _Call:
+    """A computation in flight that later callers can wait for."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Singleton that coalesces concurrent computations with the same key.
+
+    The first caller for a key runs the computation; callers arriving while it runs block
+    until it finishes and receive the same result (or the same exception) instead of
+    running the computation again. Keys are the regular cache keys, e.g. "{model}-{md5}",
+    "tts-{model}-{speaker}-{language}-{md5}" or "stt-{md5}".
+    """
+    _instance = None  # Singleton instance
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SingleFlight, cls).__new__(cls)
+            cls._instance._calls = {}
+            cls._instance._lock = threading.Lock()
+        return cls._instance
+
+    def do(self, key: str, fn: Callable):
+        """
+        Runs `fn` once for all concurrent callers with the same key.
+
+        Args:
+            key (str): Key identifying the computation.
+            fn (Callable): Function without arguments computing the result.
+
+        Returns:
+            The result of `fn`, shared between all concurrent callers.
+
+        Raises:
+            Exception: Re-raises the exception raised by `fn` in every waiting caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+            else:
+                call.waiters += 1
+                leader = False
+
+        if not leader:
+            Logger.info(f"[SINGLE FLIGHT] Waiting for in-flight computation of '{key}'.")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+            if call.waiters:
+                Logger.info(f"[SINGLE FLIGHT] Shared result of '{key}' with {call.waiters} waiting request(s).")
+
+    def in_flight(self) -> int:
+        """Returns the number of computations currently running."""
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,102 @@
+import json
+import struct
+from typing import Iterator
+
+from flask import Response, stream_with_context
+from backend.app.utils.util_logger import Logger  # Import the Logger class
+
+
+def ndjson_response(items: Iterator[dict]) -> Response:
+    """
+    Streams the dictionaries of a generator as newline-delimited JSON (application/x-ndjson).
+
+    The first item is produced before the response starts, so errors raised while validating
+    the request (e.g. an unsupported model) reach the caller as exceptions and can be returned
+    with the usual status codes. Errors raised later are sent as a final {"error": ...} line;
+    a successful stream ends with {"done": true}.
+
+    Args:
+        items (Iterator[dict]): Generator yielding the JSON-serializable parts of the response.
+
+    Returns:
+        Response: A chunked Flask response writing each item as soon as it is produced.
+    """
+    first = next(items, None)
+
+    def generate():
+        if first is None:
+            yield json.dumps({"done": True}) + "\n"
+            return
+        yield json.dumps(first) + "\n"
+        try:
+            for item in items:
+                yield json.dumps(item) + "\n"
+        except Exception as e:
+            Logger.error(f"[STREAM] Streaming response failed: {str(e)}")
+            yield json.dumps({"error": str(e)}) + "\n"
+            return
+        yield json.dumps({"done": True}) + "\n"
+
+    response = Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"  # Keep reverse proxies from buffering the stream
+    return response
+
+
+# Size of the RIFF and data chunks of a streamed WAV file, whose length is unknown when the header is sent.
+WAV_STREAM_SIZE = 0xFFFFFFFF
+
+
+def wav_stream_header(channels: int, sample_width: int, framerate: int) -> bytes:
+    """
+    Builds the header of a PCM WAV file of unknown length, to be followed by the raw frames.
+
+    The RIFF and data chunk sizes are set to their maximum, which players and browsers treat as
+    "read until the end of the stream".
+
+    Args:
+        channels (int): Number of audio channels.
+        sample_width (int): Bytes per sample (2 for 16-bit PCM).
+        framerate (int): Samples per second.
+
+    Returns:
+        bytes: The 44-byte WAV header.
+    """
+    block_align = channels * sample_width
+    return (b"RIFF" + struct.pack("<I", WAV_STREAM_SIZE) + b"WAVE"
+            + b"fmt " + struct.pack("<IHHIIHH", 16, 1, channels, framerate, framerate * block_align, block_align,
+                                    sample_width * 8)
+            + b"data" + struct.pack("<I", WAV_STREAM_SIZE))
+
+
+def audio_response(chunks: Iterator[bytes], mimetype: str = "audio/wav") -> Response:
+    """
+    Streams the audio chunks of a generator as a chunked response.
+
+    As with ndjson_response, the first chunk is produced before the response starts, so request
+    errors reach the caller as exceptions. Errors raised later cannot be reported in the audio;
+    they are logged and end the stream.
+
+    Args:
+        chunks (Iterator[bytes]): Generator yielding the audio, e.g. a WAV header followed by PCM frames.
+        mimetype (str): Mimetype of the audio.
+
+    Returns:
+        Response: A chunked Flask response writing each chunk as soon as it is produced.
+    """
+    first = next(chunks, None)
+
+    def generate():
+        if first is None:
+            return
+        yield first
+        try:
+            for chunk in chunks:
+                yield chunk
+        except Exception as e:
+            Logger.error(f"[STREAM] Streaming audio failed: {str(e)}")
+
+    response = Response(stream_with_context(generate()), mimetype=mimetype)
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"  # Keep reverse proxies from buffering the stream
+    return response
@@ -1,6 +1,6 @@
 import re
 import unicodedata
-from typing import Union, List
+from typing import Callable, Iterable, Iterator, Union, List
 from itertools import chain
 from backend.app.utils.util_logger import Logger
 
@@ -30,15 +30,51 @@ def preprocess_text(text: Union[str, List[str]]) -> str:
     Logger.info("Preprocessing: Completed normalization and punctuation cleanup.")
     return text
 
-def split_text_into_chunks(tokenizer, text: str, max_tokens: int = 250) -> List[str]:
+def split_into_sentences(text: str) -> List[str]:
+    """
+    Splits text into sentences on sentence-ending punctuation followed by whitespace.
+
+    Args:
+        text (str): Preprocessed text.
+
+    Returns:
+        List[str]: The non-empty sentences in order.
+    """
+    return [sentence for sentence in re.split(r'(?<=[.!?])\s+', text) if sentence.strip()]
+
+def count_tokens(tokenizer, sentences: List[str]) -> List[int]:
+    """
+    Counts the tokens of all sentences with one batched tokenizer call.
+
+    Hugging Face tokenizers, fast or slow (such as the SentencePiece-based MarianTokenizer), encode the
+    whole batch through the public tokenizer call, which applies the same normalization and language
+    code handling as `tokenize`. Objects that only provide `tokenize` count one sentence at a time.
+
+    Args:
+        tokenizer: A Hugging Face tokenizer.
+        sentences (List[str]): The sentences to count.
+
+    Returns:
+        List[int]: The number of tokens of every sentence (without special tokens).
+    """
+    if not sentences:
+        return []
+    if callable(tokenizer):
+        encoding = tokenizer(sentences, add_special_tokens=False)
+        return [len(ids) for ids in encoding["input_ids"]]
+    return [len(tokenizer.tokenize(sentence)) for sentence in sentences]
+
+def split_text_into_chunks(tokenizer, text: str, max_tokens: int = 250, preprocessed: bool = False) -> List[str]:
     """
     Splits the preprocessed text into chunks that do not exceed the specified token limit.
-    The splitting is done in a sentence-aware manner so that sentences are not arbitrarily cut.
+    The splitting is done in a sentence-aware manner so that sentences are not arbitrarily cut;
+    sentences are packed greedily, their tokens counted with one batched call (see count_tokens).
 
     Args:
-        tokenizer: A tokenizer with 'tokenize' and 'convert_tokens_to_string' methods.
+        tokenizer: A Hugging Face tokenizer, or any object with a 'tokenize' method.
         text (str): The input text to be split.
-        max_tokens (int): Maximum number of tokens per chunk (default is 150).
+        max_tokens (int): Maximum number of tokens per chunk (default is 250).
+        preprocessed (bool): True if the text already went through preprocess_text.
 
     Returns:
         List[str]: A list of text chunks.
@@ -48,18 +84,17 @@ def split_text_into_chunks(tokenizer, text: str, max_tokens: int = 250) -> List[
         raise ValueError("Input text cannot be empty.")
 
     # Preprocess the text first
-    text = preprocess_text(text)
+    if not preprocessed:
+        text = preprocess_text(text)
 
     # Split text into sentences (split on punctuation followed by whitespace)
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = split_into_sentences(text)
     Logger.info(f"Split text into {len(sentences)} sentences.")
     chunks = []
     current_chunk = []
     current_token_count = 0
 
-    for sentence in sentences:
-        tokens = tokenizer.tokenize(sentence)
-        num_tokens = len(tokens)
+    for sentence, num_tokens in zip(sentences, count_tokens(tokenizer, sentences)):
         # If a sentence exceeds the token limit, add it as its own chunk.
         if num_tokens > max_tokens:
             if current_chunk:
@@ -83,6 +118,128 @@ def split_text_into_chunks(tokenizer, text: str, max_tokens: int = 250) -> List[
     Logger.info(f"Text split into {len(chunks)} chunks (max {max_tokens} tokens each).")
     return chunks
 
+# Character limits per segment of the XTTS models by language; longer segments get truncated by the model.
+TTS_CHAR_LIMITS = {
+    "en": 250, "de": 253, "fr": 273, "es": 239, "it": 213, "pt": 203, "pl": 224, "tr": 226, "ru": 182,
+    "nl": 251, "cs": 186, "ar": 166, "zh": 82, "ja": 71, "hu": 224, "ko": 95, "hi": 150
+}
+TTS_DEFAULT_CHAR_LIMIT = 250
+
+# Abbreviations whose trailing dot does not end a sentence, by language.
+TTS_ABBREVIATIONS = {
+    "en": {"mr.", "mrs.", "ms.", "dr.", "prof.", "st.", "vs.", "e.g.", "i.e.", "no.", "fig.", "approx."},
+    "de": {"z.b.", "bzw.", "ca.", "dr.", "prof.", "nr.", "vgl.", "d.h.", "u.a.", "evtl.", "abb.", "str."},
+    "fr": {"m.", "mme.", "mlle.", "dr.", "p.ex.", "cf.", "env.", "av.", "no."}
+}
+
+# Sentence ends: terminal punctuation (with closing quotes or brackets) followed by whitespace, or
+# CJK, Devanagari and Arabic terminators, which are not followed by a space.
+_SENTENCE_END = re.compile(r'[.!?…]+["\'”’»)\]]*\s+|[。！？।؟]+\s*')
+_CLAUSE_END = re.compile(r'(?<=[,;:，、；：])\s*')
+
+def _get_language_code(language: str = None) -> str:
+    """Returns the two-letter base code of a language such as "en", "eng" or "zh-cn"."""
+    return (language or "").lower().replace("_", "-").split("-")[0][:2]
+
+def iter_sentences(text: str, language: str = None) -> Iterator[str]:
+    """
+    Yields the sentences of a text in one pass, without splitting after known abbreviations of the language.
+
+    Args:
+        text (str): The text to split.
+        language (str, optional): Language code of the text (e.g., "en", "de").
+
+    Yields:
+        str: The non-empty sentences in order, including the trailing text after the last terminator.
+    """
+    abbreviations = TTS_ABBREVIATIONS.get(_get_language_code(language), set())
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        if abbreviations and text[match.start()] == ".":
+            word_start = max(text.rfind(" ", start, match.start()), start - 1) + 1
+            if text[word_start:match.start() + 1].lower() in abbreviations:
+                continue
+        sentence = text[start:match.end()].strip()
+        if sentence:
+            yield sentence
+        start = match.end()
+    rest = text[start:].strip()
+    if rest:
+        yield rest
+
+def _pack(pieces: Iterable[str], limit: int, split_oversized: Callable[[str, int], Iterable[str]]) -> Iterator[str]:
+    """Greedily joins pieces with spaces into segments of at most `limit` characters."""
+    current = []
+    length = 0
+    for piece in pieces:
+        if not piece:
+            continue
+        if len(piece) > limit:
+            if current:
+                yield " ".join(current)
+                current, length = [], 0
+            yield from split_oversized(piece, limit)
+            continue
+        added = len(piece) + (1 if current else 0)
+        if current and length + added > limit:
+            yield " ".join(current)
+            current, length = [piece], len(piece)
+        else:
+            current.append(piece)
+            length += added
+    if current:
+        yield " ".join(current)
+
+def _split_words(text: str, limit: int) -> Iterator[str]:
+    """Splits an oversized clause at word boundaries; words longer than the limit are cut."""
+    return _pack(text.split(), limit, lambda word, size: (word[i:i + size] for i in range(0, len(word), size)))
+
+def _split_clauses(text: str, limit: int) -> Iterator[str]:
+    """Splits an oversized sentence after clause punctuation (commas, semicolons, colons)."""
+    return _pack(_CLAUSE_END.split(text), limit, _split_words)
+
+def segment_text_for_tts(text: str, language: str = None, char_limit: int = None) -> Iterator[str]:
+    """
+    Splits text into segments for speech synthesis in a single pass.
+
+    Sentences are packed greedily into segments within the model's character limit for the
+    language. Sentences longer than the limit are split after clause punctuation, then at word
+    boundaries. No text is dropped.
+
+    Args:
+        text (str): The text to synthesize.
+        language (str, optional): Language code of the text; selects the character limit and abbreviations.
+        char_limit (int, optional): Maximum characters per segment; defaults to the limit of the language.
+
+    Yields:
+        str: The segments in order.
+    """
+    limit = char_limit or TTS_CHAR_LIMITS.get(_get_language_code(language), TTS_DEFAULT_CHAR_LIMIT)
+    return _pack(iter_tts_sentences(text, language, limit), limit, _split_clauses)
+
+def iter_tts_sentences(text: str, language: str = None, char_limit: int = None) -> Iterator[str]:
+    """
+    Yields the sentences of a text for speech synthesis, splitting sentences longer than the model's
+    character limit after clause punctuation, then at word boundaries.
+
+    Unlike segment_text_for_tts, sentences are not packed together, so each piece only depends on
+    its own sentence and stays the same when other sentences of the text change.
+
+    Args:
+        text (str): The text to synthesize.
+        language (str, optional): Language code of the text; selects the character limit and abbreviations.
+        char_limit (int, optional): Maximum characters per piece; defaults to the limit of the language.
+
+    Yields:
+        str: The sentences, or pieces of oversized sentences, in order.
+    """
+    limit = char_limit or TTS_CHAR_LIMITS.get(_get_language_code(language), TTS_DEFAULT_CHAR_LIMIT)
+    for sentence in iter_sentences(text, language):
+        if len(sentence) <= limit:
+            yield sentence
+        else:
+            yield from _split_clauses(sentence, limit)
+
 def flatten_list(nested_list: List) -> List[str]:
     """
     Flattens a nested list into a single list of strings.
@@ -0,0 +1,65 @@
+import hashlib
+import unicodedata
+from typing import Callable, List
+from backend.app.utils.util_logger import Logger  # Import the Logger class
+
+
+def get_translation_memory_key(model: str, sentence: str) -> str:
+    """
+    Returns the cache key of a single sentence translation: "tm-{model}-{md5 of the normalized sentence}".
+    """
+    normalized = ' '.join(unicodedata.normalize('NFKC', sentence).split())
+    return f"tm-{model}-{hashlib.md5(normalized.encode()).hexdigest()}"
+
+
+class TranslationMemory:
+    """
+    Sentence-level translation memory on top of the CacheManager.
+
+    Sentence translations are cached under (model, normalized sentence), so retranslating
+    an edited text or a book with repeated boilerplate only sends changed or unseen sentences
+    to the model. Sentences occurring several times in one request are translated once.
+    """
+
+    def __init__(self, cache_manager):
+        """
+        Args:
+            cache_manager: CacheManager holding the sentence translations.
+        """
+        self.cache_manager = cache_manager
+
+    def translate(self, model: str, sentences: List[str], translate_fn: Callable[[List[str]], List[str]]) -> List[str]:
+        """
+        Translates sentences, serving known sentences from the memory.
+
+        Args:
+            model (str): Full translation model name.
+            sentences (List[str]): Sentences in document order.
+            translate_fn (Callable): Translates a list of unseen sentences and returns one translation per sentence.
+
+        Returns:
+            List[str]: One translation per input sentence, in the same order.
+        """
+        keys = [get_translation_memory_key(model, sentence) for sentence in sentences]
+        translations = {}
+        missing = {}  # key -> sentence, unique and in first-occurrence order
+        for key, sentence in zip(keys, sentences):
+            if key in translations or key in missing:
+                continue
+            cached = self.cache_manager.get(key)
+            if cached is not None:
+                translations[key] = cached
+            else:
+                missing[key] = sentence
+
+        Logger.info(f"[TRANSLATION MEMORY] {len(sentences)} sentences, {len(translations)} known, "
+                    f"{len(missing)} to translate.")
+        if missing:
+            new_translations = translate_fn(list(missing.values()))
+            if len(new_translations) != len(missing):
+                raise ValueError(f"Expected {len(missing)} translations, got {len(new_translations)}.")
+            for key, translation in zip(missing, new_translations):
+                translations[key] = translation
+                self.cache_manager.set(key, translation)
+
+        return [translations[key] for key in keys]
@@ -0,0 +1,106 @@
+"""
+Compares the per-sentence chunker with the batched chunker of util_text_manager.split_text_into_chunks.
+
+The book-length input is built from the English sentences of benchmarks/fixtures/corpus_en_de.tsv,
+repeated until it reaches `--sentences` sentences (the default of 20000 is about a 300-page book).
+For both chunkers the benchmark measures the seconds per split (best of `--repeats`) and checks
+that they produce the same chunks. The batched chunker counts with one tokenizer call for fast and
+slow tokenizers, including the MarianTokenizer. Run from the repository root, e.g.:
+
+    python -m backend.benchmarks.benchmark_text_chunker --model Helsinki-NLP/opus-mt-en-de
+"""
+import argparse
+import csv
+import json
+import os
+import time
+from itertools import cycle, islice
+from typing import List
+
+from transformers import AutoTokenizer
+
+from backend.app.utils.util_text_manager import preprocess_text, split_into_sentences, split_text_into_chunks
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "corpus_en_de.tsv")
+
+
+def build_book(sentences: int, path: str = FIXTURE_PATH) -> str:
+    """
+    Returns a text of `sentences` sentences taken round-robin from the English column of the fixture corpus.
+    """
+    with open(path, encoding="utf-8", newline="") as f:
+        corpus = [row["en"] for row in csv.DictReader(f, delimiter="\t")]
+    return " ".join(islice(cycle(corpus), sentences))
+
+
+def split_per_sentence(tokenizer, text: str, max_tokens: int) -> List[str]:
+    """
+    The chunker before batching: one `tokenize` call per sentence, with the same greedy packing.
+    """
+    sentences = split_into_sentences(preprocess_text(text))
+    chunks, current_chunk, current_token_count = [], [], 0
+    for sentence in sentences:
+        num_tokens = len(tokenizer.tokenize(sentence))
+        if num_tokens > max_tokens:
+            if current_chunk:
+                chunks.append(" ".join(current_chunk))
+                current_chunk, current_token_count = [], 0
+            chunks.append(sentence)
+            continue
+        if current_token_count + num_tokens > max_tokens:
+            chunks.append(" ".join(current_chunk))
+            current_chunk, current_token_count = [sentence], num_tokens
+        else:
+            current_chunk.append(sentence)
+            current_token_count += num_tokens
+    if current_chunk:
+        chunks.append(" ".join(current_chunk))
+    return chunks
+
+
+def best_of(repeats: int, fn):
+    """Runs `fn` `repeats` times and returns (best seconds, last result)."""
+    timings, result = [], None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the per-sentence against the batched text chunker.")
+    parser.add_argument("--model", default="Helsinki-NLP/opus-mt-en-de", help="Model providing the tokenizer.")
+    parser.add_argument("--sentences", type=int, default=20000)
+    parser.add_argument("--max-tokens", type=int, default=150)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+    args = parser.parse_args()
+
+    tokenizer = AutoTokenizer.from_pretrained(args.model)
+    text = build_book(args.sentences)
+
+    per_sentence_seconds, per_sentence_chunks = best_of(
+        args.repeats, lambda: split_per_sentence(tokenizer, text, args.max_tokens))
+    batched_seconds, batched_chunks = best_of(
+        args.repeats, lambda: split_text_into_chunks(tokenizer, text, args.max_tokens))
+
+    result = {
+        "model": args.model,
+        "sentences": args.sentences,
+        "characters": len(text),
+        "chunks": len(batched_chunks),
+        "per_sentence_seconds": round(per_sentence_seconds, 3),
+        "batched_seconds": round(batched_seconds, 3),
+        "speedup": round(per_sentence_seconds / batched_seconds, 1) if batched_seconds else None,
+        "identical_chunks": per_sentence_chunks == batched_chunks
+    }
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    for key, value in result.items():
+        print(f"{key}\t{value}")
+
+
+if __name__ == "__main__":
+    main()
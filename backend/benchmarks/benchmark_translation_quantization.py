@@ -0,0 +1,121 @@
+"""
+Compares fp32 and int8 dynamically-quantized CPU inference of the MarianMT translation models.
+
+For every model and quantization mode the benchmark measures
+  - latency: milliseconds per single-sentence translation (p50 / p95),
+  - throughput: sentences per second with batched translation ([TRANSLATE] BATCH_SIZE),
+  - quality: BLEU and chrF of the batched output against the fixture references
+    (requires the optional `sacrebleu` package).
+
+The fixture corpus in benchmarks/fixtures/corpus_en_de.tsv holds aligned English and German
+sentences and is used in both directions. Run from the repository root, e.g.:
+
+    python -m backend.benchmarks.benchmark_translation_quantization --models Helsinki-NLP/opus-mt-en-de Helsinki-NLP/opus-mt-de-en
+
+Use the results to set [TRANSLATE] QUANTIZATION / QUANTIZATION_MODELS per language pair.
+"""
+import argparse
+import csv
+import json
+import os
+import statistics
+import time
+from unittest.mock import MagicMock
+
+import torch
+
+from backend.app.translators.translator_opus import OpusMTTranslator, load_opus_model
+from backend.app.utils.util_model_registry import ModelRegistry
+
+try:
+    import sacrebleu
+except ImportError:  # Quality metrics are optional
+    sacrebleu = None
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "corpus_en_de.tsv")
+MODES = ("none", "int8")
+
+
+def load_corpus(model_name: str, path: str = FIXTURE_PATH):
+    """
+    Returns (sources, references) for the language pair of an opus-mt model, e.g. "...opus-mt-en-de".
+    """
+    source_lang, target_lang = model_name.rsplit("opus-mt-", 1)[1].split("-")[:2]
+    with open(path, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f, delimiter="\t"))
+    if source_lang not in rows[0] or target_lang not in rows[0]:
+        raise ValueError(f"The fixture corpus has no '{source_lang}'/'{target_lang}' columns for '{model_name}'.")
+    return [row[source_lang] for row in rows], [row[target_lang] for row in rows]
+
+
+def benchmark_model(model_name: str, mode: str, batch_size: int, repeats: int) -> dict:
+    """
+    Loads a model in the given quantization mode and measures latency, throughput and quality on CPU.
+    """
+    sources, references = load_corpus(model_name)
+    translator = OpusMTTranslator(model_name, MagicMock(), "cpu", quantization=mode)
+
+    started = time.perf_counter()
+    ModelRegistry().preload(translator.registry_key, lambda: load_opus_model(model_name, "cpu", quantization=mode))
+    load_seconds = time.perf_counter() - started
+
+    translator.translate_batch(sources[:2], batch_size)  # Warm-up
+
+    latencies = []
+    for _ in range(repeats):
+        for sentence in sources:
+            started = time.perf_counter()
+            translator.translate_batch([sentence], 1)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    for _ in range(repeats):
+        hypotheses = translator.translate_batch(sources, batch_size)
+    batched_seconds = time.perf_counter() - started
+
+    result = {
+        "model": model_name,
+        "quantization": mode,
+        "load_seconds": round(load_seconds, 2),
+        "latency_p50_ms": round(statistics.median(latencies), 1),
+        "latency_p95_ms": round(statistics.quantiles(latencies, n=20)[18], 1),
+        "sentences_per_second": round(len(sources) * repeats / batched_seconds, 1),
+        "bleu": None,
+        "chrf": None
+    }
+    if sacrebleu is not None:
+        result["bleu"] = round(sacrebleu.corpus_bleu(hypotheses, [references]).score, 1)
+        result["chrf"] = round(sacrebleu.corpus_chrf(hypotheses, [references]).score, 1)
+
+    ModelRegistry().unload(translator.registry_key)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fp32 against int8 quantized MarianMT inference on CPU.")
+    parser.add_argument("--models", nargs="+", default=["Helsinki-NLP/opus-mt-en-de", "Helsinki-NLP/opus-mt-de-en"])
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=0, help="torch intra-op threads (0 keeps the default).")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    if sacrebleu is None:
+        print("sacrebleu is not installed; BLEU and chrF are skipped.")
+
+    results = [benchmark_model(model, mode, args.batch_size, args.repeats) for model in args.models for mode in MODES]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    header = ("model", "quantization", "load_seconds", "latency_p50_ms", "latency_p95_ms",
+              "sentences_per_second", "bleu", "chrf")
+    print("\t".join(header))
+    for result in results:
+        print("\t".join(str(result[column]) for column in header))
+
+
+if __name__ == "__main__":
+    main()
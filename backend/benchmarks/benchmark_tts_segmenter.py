@@ -0,0 +1,84 @@
+"""
+Compares the character loop TTSSynthesizer.synthesize used to split text with
+util_text_manager.segment_text_for_tts.
+
+The book-length input is built from the English sentences of benchmarks/fixtures/corpus_en_de.tsv
+(see benchmark_text_chunker.build_book). For both segmenters the benchmark measures the seconds per
+split (best of `--repeats`), the number of segments, the longest segment and the characters that never
+reach the model. Run from the repository root, e.g.:
+
+    python -m backend.benchmarks.benchmark_tts_segmenter --sentences 5000
+"""
+import argparse
+import json
+from typing import List
+
+from backend.app.utils.util_text_manager import TTS_CHAR_LIMITS, segment_text_for_tts
+from backend.benchmarks.benchmark_text_chunker import best_of, build_book
+
+
+def split_legacy(text: str) -> List[str]:
+    """
+    The loop TTSSynthesizer.synthesize used before, collecting the text of each synthesis call.
+    It rescans the remaining text after every segment and drops the text after the last segment
+    once at least one segment was produced.
+    """
+    char_count, segments, last_punctuation_mark, i = 0, [], 0, 0
+    while len(text) > i:
+        char_count += 1
+        if text[i] in [".", "!", "?"]:
+            last_punctuation_mark = char_count
+        if char_count >= 252:
+            if last_punctuation_mark == 0:
+                i += 1
+                continue
+            segments.append(text[:last_punctuation_mark])
+            text = text[last_punctuation_mark:]
+            char_count, i, last_punctuation_mark = 0, 0, 0
+            continue
+        i += 1
+    if len(segments) == 0:
+        segments.append(text)
+    return segments
+
+
+def dropped_characters(text: str, segments: List[str]) -> int:
+    """Returns the number of non-whitespace characters of `text` missing from the segments."""
+    return len("".join(text.split())) - len("".join("".join(segments).split()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the legacy TTS split loop against the segmenter.")
+    parser.add_argument("--sentences", type=int, default=5000)
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+    args = parser.parse_args()
+
+    text = build_book(args.sentences)
+    legacy_seconds, legacy_segments = best_of(args.repeats, lambda: split_legacy(text))
+    segmenter_seconds, segments = best_of(args.repeats, lambda: list(segment_text_for_tts(text, args.language)))
+
+    result = {
+        "sentences": args.sentences,
+        "characters": len(text),
+        "char_limit": TTS_CHAR_LIMITS.get(args.language),
+        "legacy_seconds": round(legacy_seconds, 3),
+        "segmenter_seconds": round(segmenter_seconds, 3),
+        "speedup": round(legacy_seconds / segmenter_seconds, 1) if segmenter_seconds else None,
+        "legacy_segments": len(legacy_segments),
+        "segments": len(segments),
+        "legacy_longest_segment": max(map(len, legacy_segments)),
+        "longest_segment": max(map(len, segments)),
+        "legacy_dropped_characters": dropped_characters(text, legacy_segments),
+        "dropped_characters": dropped_characters(text, segments)
+    }
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    for key, value in result.items():
+        print(f"{key}\t{value}")
+
+
+if __name__ == "__main__":
+    main()
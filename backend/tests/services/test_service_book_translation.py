@@ -0,0 +1,137 @@
+import json
+import logging
+import pytest
+from unittest.mock import MagicMock, patch
+from backend.app.services.translation import BookTranslationService
+from backend.app.services.translation.service_book_translation import get_dedup_ratio, iter_text_items, \
+    translate_text_items
+from backend.app.utils.util_batch_scheduler import PRIORITY_BULK, PRIORITY_INTERACTIVE
+
+# Configure logging to capture DEBUG (and above) messages.
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+
+def _page(page, words, translations=None):
+    """Builds a stored page document whose 'source' is the page's OCR data (unencrypted for the test)."""
+    source = [{"Block": {"Data": [{"text": words, "size": 0.14}], "Block_Geometry": {}}}]
+    return {"user": "alice", "title": "Book", "page": page, "text": {"source": source},
+            "translations": translations or {}}
+
+
+@pytest.fixture
+def mongo_manager():
+    """
+    Fixture for a MongoDBManager stand-in holding three pages, one of which is already translated.
+    """
+    manager = MagicMock()
+    manager.find_documents.return_value = [
+        _page(1, ["Hello", "world."]),
+        _page(2, ["Good", "morning."], translations={"de": {"Ciphertext": "..."}}),
+        _page(3, ["Goodbye."])
+    ]
+    manager.decrypt_page_document.side_effect = lambda user, doc: json.loads(json.dumps(doc["text"]["source"]))
+    return manager
+
+
+def test_translate_book_batches_pages_and_bulk_writes(mongo_manager):
+    """
+    Test that all untranslated pages are translated in one batch and written with one bulk write.
+    """
+    logger.debug("Running test_translate_book_batches_pages_and_bulk_writes.")
+    config_manager = MagicMock()
+    config_manager.get_mongo_config.return_value = {"user_text_collection": "user_texts"}
+    config_manager.get_config_value.return_value = 2
+    crypto_manager = MagicMock()
+    crypto_manager.encrypt_string.side_effect = lambda user, text: {"Ciphertext": text}
+
+    service = BookTranslationService(config_manager, MagicMock(), mongo_manager, crypto_manager)
+    with patch.object(service.translation_service, "translate_segments",
+                      side_effect=lambda model, segments, priority: [segment.upper() for segment in segments]) as translate:
+        result = service.translate_book("alice", "Book", "Helsinki-NLP/opus-mt-en-de", "de")
+
+    assert result == {"pages": 3, "translated": 2, "skipped": 1, "segments": 2, "unique_segments": 2,
+                      "dedup_ratio": 0.0}
+    translate.assert_called_once_with("Helsinki-NLP/opus-mt-en-de", ["Hello world.", "Goodbye."], PRIORITY_BULK)
+
+    mongo_manager.bulk_update_documents.assert_called_once()
+    collection, updates = mongo_manager.bulk_update_documents.call_args.args
+    assert collection == "user_texts"
+    assert [query["page"] for query, _ in updates] == [1, 3]
+    stored = json.loads(updates[0][1]["$set"]["translations.de"]["Ciphertext"])
+    assert stored[0]["Block"]["Data"][0]["text"] == ["HELLO", "WORLD."]
+
+
+def test_translate_book_skips_pages_without_text_items(mongo_manager):
+    """
+    Test that pages without translatable text items are skipped instead of getting a translation document.
+    """
+    logger.debug("Running test_translate_book_skips_pages_without_text_items.")
+    mongo_manager.find_documents.return_value = [_page(1, ["Hello."]), _page(2, [""]), _page(3, [" "])]
+    config_manager = MagicMock()
+    config_manager.get_mongo_config.return_value = {"user_text_collection": "user_texts"}
+    config_manager.get_config_value.return_value = 2
+    crypto_manager = MagicMock()
+
+    service = BookTranslationService(config_manager, MagicMock(), mongo_manager, crypto_manager)
+    with patch.object(service.translation_service, "translate_segments",
+                      side_effect=lambda model, segments, priority: [segment.upper() for segment in segments]):
+        result = service.translate_book("alice", "Book", "Helsinki-NLP/opus-mt-en-de", "de")
+
+    assert result["translated"] == 1 and result["skipped"] == 2
+    assert crypto_manager.encrypt_string.call_count == 1, "Expected only the page with text to be encrypted."
+    _, updates = mongo_manager.bulk_update_documents.call_args.args
+    assert [query["page"] for query, _ in updates] == [1]
+
+
+def test_translate_text_items_translates_page_in_one_call():
+    """
+    Test that all text groups of a page are translated with one call and written back in place.
+    """
+    logger.debug("Running test_translate_text_items_translates_page_in_one_call.")
+    page = [
+        {"Block": {"Data": [{"text": ["Voter", "turnout"], "size": 0.14}, {"text": [""], "size": 0.1}]}},
+        {"Block": {"Data": [{"text": ["was", "high."], "size": 0.15}]}},
+        {"Block": "invalid"}
+    ]
+    translation_service = MagicMock()
+    translation_service.translate_segments.side_effect = lambda model, segments, priority: [s.upper() for s in segments]
+
+    counts = translate_text_items(translation_service, "Helsinki-NLP/opus-mt-en-de", list(iter_text_items(page)))
+    assert counts == {"segments": 2, "unique": 2}
+    translation_service.translate_segments.assert_called_once_with("Helsinki-NLP/opus-mt-en-de",
+                                                                   ["Voter turnout", "was high."], PRIORITY_INTERACTIVE)
+    assert page[0]["Block"]["Data"][0]["text"] == ["VOTER", "TURNOUT"]
+    assert page[0]["Block"]["Data"][1]["text"] == [""]
+    assert page[1]["Block"]["Data"][0]["text"] == ["WAS", "HIGH."]
+
+
+
+def test_translate_text_items_translates_repeated_segments_once():
+    """
+    Test that running headers repeated across pages are translated once and page numbers are not translated.
+    """
+    logger.debug("Running test_translate_text_items_translates_repeated_segments_once.")
+    pages = [[{"Block": {"Data": [{"text": ["Chapter", "One"]}, {"text": [f"Page {page}."]}, {"text": [str(page)]}]}}]
+             for page in (1, 2, 3)]
+    translation_service = MagicMock()
+    translation_service.translate_segments.side_effect = lambda model, segments, priority: [s.upper() for s in segments]
+    memo = {}
+
+    counts = translate_text_items(translation_service, "Helsinki-NLP/opus-mt-en-de",
+                                  [item for page in pages[:2] for item in iter_text_items(page)], memo)
+    assert counts == {"segments": 6, "unique": 3}
+    translation_service.translate_segments.assert_called_once_with("Helsinki-NLP/opus-mt-en-de",
+                                                                   ["Chapter One", "Page 1.", "Page 2."],
+                                                                   PRIORITY_INTERACTIVE)
+    assert [item["text"] for item in iter_text_items(pages[1])] == [["CHAPTER", "ONE"], ["PAGE", "2."], ["2"]]
+
+    counts = translate_text_items(translation_service, "Helsinki-NLP/opus-mt-en-de", list(iter_text_items(pages[2])), memo)
+    assert counts == {"segments": 3, "unique": 1}, "Expected the header to come from the memo."
+    assert translation_service.translate_segments.call_args.args[1] == ["Page 3."]
+    assert get_dedup_ratio(9, 4) == 0.556
+
+
+if __name__ == '__main__':
+    # Run tests if this file is executed directly.
+    pytest.main()
@@ -1,6 +1,8 @@
 import pytest
 import logging
-from backend.app.services import TranslationService
+from unittest.mock import MagicMock, patch
+from backend.app.services.translation import TranslationService
+from backend.app.translators import TranslatorPool
 from backend.app.utils import CacheManager
 
 # Configure logging to capture DEBUG (and above) messages.
@@ -30,6 +32,10 @@ def mock_config_manager():
             logger.debug("MockConfigManager: get_torch_device returns 'cpu'.")
             return 'cpu'
 
+        def get_translation_engine_config(self, model_name):
+            logger.debug(f"MockConfigManager: get_translation_engine_config returns 'opus' for {model_name}.")
+            return {'engine': 'opus', 'options': {'quantization': 'none', 'revision': 'main'}}
+
         def get_config_value(self, section, key, value_type, default=None):
             try:
                 value = self.mock_config[section][key]
@@ -135,6 +141,85 @@ def test_translate_text_cache_miss(mock_config_manager, mock_cache_manager):
     logger.debug("Cache miss handled; new translation computed and cache updated.")
 
 
+def test_stream_text_yields_chunks_and_caches_result(mock_config_manager, mock_cache_manager):
+    """
+    Test that stream_text yields every chunk as it is translated and caches the joined translation.
+    """
+    logger.debug("Running test_stream_text_yields_chunks_and_caches_result.")
+    mock_cache_manager.clear_cache()
+    service = TranslationService(mock_config_manager, mock_cache_manager)
+    translated = []
+
+    def translate_chunk(model, chunk):
+        translated.append(chunk)
+        return [chunk.upper()]
+
+    with patch.object(service, "_load_tokenizer"), \
+         patch("backend.app.services.translation.service_translation.split_text_into_chunks",
+               return_value=["First part.", "Second part."]), \
+         patch.object(service, "translate_and_chunk_text", side_effect=translate_chunk):
+        stream = service.stream_text("Helsinki-NLP/opus-mt-en-de", "First part. Second part.")
+        first = next(stream)
+        assert translated == ["First part."], "Expected the first chunk before the second is translated."
+        items = [first] + list(stream)
+
+    assert items == [
+        {"index": 0, "total": 2, "translation": ["FIRST PART."]},
+        {"index": 1, "total": 2, "translation": ["SECOND PART."]}
+    ]
+    cached = list(service.stream_text("Helsinki-NLP/opus-mt-en-de", "First part. Second part."))
+    assert cached == [{"index": 0, "total": 1, "translation": ["FIRST PART. SECOND PART."]}]
+
+
+def test_translation_memory_is_off_by_default(mock_config_manager, mock_cache_manager):
+    """
+    Test that texts are translated in token-bounded chunks unless the translation memory is enabled,
+    and that empty texts are rejected on both paths.
+    """
+    logger.debug("Running test_translation_memory_is_off_by_default.")
+    mock_cache_manager.clear_cache()
+    service = TranslationService(mock_config_manager, mock_cache_manager)
+    model = "Helsinki-NLP/opus-mt-en-de"
+
+    with patch.object(service, "_load_tokenizer"), \
+         patch("backend.app.services.translation.service_translation.TranslationMemory") as memory, \
+         patch("backend.app.services.translation.service_translation.split_text_into_chunks",
+               return_value=["First part. Second part."]) as split, \
+         patch.object(service, "translate_segments", side_effect=lambda model, chunks: [c.upper() for c in chunks]):
+        assert service.translate_and_chunk_text(model, "First part. Second part.") == ["FIRST PART. SECOND PART."]
+        split.assert_called_once()
+        memory.assert_not_called()
+
+        mock_config_manager.mock_config["TRANSLATE"]["TRANSLATION_MEMORY"] = "True"
+        memory.return_value.translate.return_value = ["ERSTER TEIL."]
+        assert service.translate_and_chunk_text(model, "First part.") == ["ERSTER TEIL."]
+        memory.assert_called_once()
+        with pytest.raises(ValueError, match="empty"):
+            service.translate_and_chunk_text(model, "   ")
+
+
+def test_translator_uses_configured_engine(mock_config_manager, mock_cache_manager):
+    """
+    Test that the service gets its translator from the pool with the model's configured engine and quantization.
+    """
+    logger.debug("Running test_translator_uses_configured_engine.")
+    TranslatorPool._instance = None
+    service = TranslationService(mock_config_manager, mock_cache_manager)
+    model = "Helsinki-NLP/opus-mt-en-de"
+    engine_config = {'engine': 'opus', 'options': {'quantization': 'int8', 'revision': 'v2'}}
+    engine = MagicMock()
+    engine.return_value.translate.return_value = ["Hallo"]
+
+    with patch.object(mock_config_manager, "get_translation_engine_config", return_value=engine_config), \
+         patch("backend.app.translators.translator_pool.ENGINES", {"opus": engine}):
+        assert service.translate_text(model, "Hello") == ["Hallo"]
+        assert service.translate_text(model, "Hello") == ["Hallo"]
+
+    engine.assert_called_once()
+    assert engine.call_args.kwargs == {'quantization': 'int8', 'revision': 'v2'}
+    TranslatorPool._instance = None
+
+
 if __name__ == '__main__':
     # Run tests if this file is executed directly.
     import pytest
@@ -0,0 +1,92 @@
+import logging
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from backend.app.utils import ModelRegistry
+from backend.app.translators.translator_ctranslate2 import CTranslate2Translator
+from backend.app.translators.translator_engine import get_translation_model_key
+
+# Configure logging to capture DEBUG and above messages.
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+
+class FakeTokenizer:
+    """Tokenizer stand-in splitting on whitespace; token ids are the tokens themselves."""
+
+    def encode(self, text):
+        return text.split() + ["</s>"]
+
+    def convert_ids_to_tokens(self, ids):
+        return list(ids)
+
+    def convert_tokens_to_ids(self, tokens):
+        return list(tokens)
+
+    def decode(self, ids, skip_special_tokens=True):
+        return " ".join(token for token in ids if not (skip_special_tokens and token == "</s>"))
+
+
+class FakeTranslator:
+    """ctranslate2.Translator stand-in returning the reversed tokens of every input."""
+
+    def __init__(self):
+        self.calls = []
+
+    def translate_batch(self, tokens, max_batch_size, batch_type):
+        self.calls.append((len(tokens), max_batch_size))
+        return [SimpleNamespace(hypotheses=[list(reversed(source[:-1]))]) for source in tokens]
+
+
+def test_ctranslate2_engine_translates_through_the_registry():
+    """
+    Tests that the CTranslate2 engine tokenizes with the Marian tokenizer, runs one translate_batch
+    call and reports its statistics.
+    """
+    logger.debug("Running test_ctranslate2_engine_translates_through_the_registry.")
+    ModelRegistry._instance = None
+    translator = FakeTranslator()
+    ModelRegistry().preload(get_translation_model_key("Helsinki-NLP/opus-mt-en-de", "ctranslate2"),
+                            lambda: (FakeTokenizer(), translator))
+    engine = CTranslate2Translator("Helsinki-NLP/opus-mt-en-de", MagicMock(), "cpu", model_path="/models/en-de")
+
+    result = engine.translate_batch(["good morning", "hello  world"], batch_size=8)
+    stats = engine.get_stats()
+    ModelRegistry._instance = None
+
+    assert result == ["morning good", "world hello"]
+    assert translator.calls == [(2, 8)]
+    assert stats["engine"] == "ctranslate2"
+    assert stats["segments"] == 2 and stats["batches"] == 1
+
+
+def test_engines_of_the_same_model_use_separate_registry_entries():
+    """
+    Tests that an opus and a CTranslate2 engine of the same model each get the model their own loader returns.
+    """
+    logger.debug("Running test_engines_of_the_same_model_use_separate_registry_entries.")
+    ModelRegistry._instance = None
+    from backend.app.translators.translator_opus import OpusMTTranslator
+    opus_model, ct2_model = (FakeTokenizer(), MagicMock()), (FakeTokenizer(), FakeTranslator())
+    with patch("backend.app.translators.translator_opus.load_opus_model", return_value=opus_model), \
+         patch("backend.app.translators.translator_ctranslate2.load_ctranslate2_model", return_value=ct2_model):
+        opus = OpusMTTranslator("Helsinki-NLP/opus-mt-en-de", MagicMock(), "cpu")
+        engine = CTranslate2Translator("Helsinki-NLP/opus-mt-en-de", MagicMock(), "cpu", model_path="/models/en-de")
+        engine.load()
+        opus.load()
+
+        with ModelRegistry().acquire(engine.registry_key) as loaded:
+            assert loaded is ct2_model
+        with ModelRegistry().acquire(opus.registry_key) as loaded:
+            assert loaded is opus_model
+    ModelRegistry._instance = None
+
+    assert opus.registry_key == "translation:opus:Helsinki-NLP/opus-mt-en-de"
+    assert engine.registry_key == "translation:ctranslate2:Helsinki-NLP/opus-mt-en-de"
+    assert get_translation_model_key("Helsinki-NLP/opus-mt-en-de", "opus", "int8") == \
+        "translation:opus:Helsinki-NLP/opus-mt-en-de:int8"
+
+
+if __name__ == '__main__':
+    # Run the tests if this file is executed directly.
+    pytest.main()
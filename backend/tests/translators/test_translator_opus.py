@@ -1,8 +1,9 @@
 import logging
 import pytest
+import torch
 from unittest.mock import patch, MagicMock
-from backend.app.utils import CacheManager
-from backend.app.translators.translator_opus import OpusMTTranslator
+from backend.app.utils import CacheManager, ModelRegistry
+from backend.app.translators.translator_opus import OpusMTTranslator, get_translation_model_key, load_opus_model
 
 # Configure logging to capture DEBUG and above messages.
 logging.basicConfig(level=logging.DEBUG)
@@ -55,6 +56,93 @@ def test_translate_text_opus(mock_cache_manager):
         logger.debug("Test translation result verified successfully.")
 
 
+class EchoTokenizer:
+    """
+    Tokenizer stand-in mapping words to ids; together with EchoModel a 'translation' returns the input.
+    """
+    model_max_length = 512
+
+    def __init__(self):
+        self.vocab = {"<pad>": 0}
+        self.pad_calls = []
+
+    def __call__(self, texts):
+        input_ids = [[self.vocab.setdefault(word, len(self.vocab)) for word in text.split()] for text in texts]
+        return {"input_ids": input_ids, "attention_mask": [[1] * len(ids) for ids in input_ids]}
+
+    def pad(self, features, return_tensors="pt"):
+        self.pad_calls.append([len(ids) for ids in features["input_ids"]])
+        width = max(len(ids) for ids in features["input_ids"])
+        return {key: torch.tensor([values + [0] * (width - len(values)) for values in features[key]])
+                for key in ("input_ids", "attention_mask")}
+
+    def batch_decode(self, sequences, skip_special_tokens=True):
+        words = {index: word for word, index in self.vocab.items()}
+        return [" ".join(words[int(i)] for i in sequence if int(i) != 0) for sequence in sequences]
+
+
+class EchoModel:
+    """Model stand-in whose generate() returns its input ids."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def generate(self, input_ids, attention_mask):
+        self.batch_sizes.append(len(input_ids))
+        return input_ids
+
+
+def test_translate_batch_buckets_and_restores_order():
+    """
+    Tests that translate_batch groups segments of similar length into batches and keeps the input order.
+    """
+    logger.debug("Starting test_translate_batch_buckets_and_restores_order.")
+    ModelRegistry._instance = None
+    tokenizer, model = EchoTokenizer(), EchoModel()
+    ModelRegistry().preload(get_translation_model_key("Helsinki-NLP/opus-mt-en-de"), lambda: (tokenizer, model))
+    translator = OpusMTTranslator("Helsinki-NLP/opus-mt-en-de", MagicMock(), 'cpu')
+
+    segments = ["a b c d e f", "a", "a b c", "a b", "a b c d e"]
+    result = translator.translate_batch(segments, batch_size=2)
+    ModelRegistry._instance = None
+
+    assert result == segments, "Expected the echoed segments in their original order."
+    assert model.batch_sizes == [2, 2, 1]
+    assert tokenizer.pad_calls == [[1, 2], [3, 5], [6]], "Expected batches of similar length."
+
+
+def test_load_tokenizer_loads_unregistered_model_as_configured():
+    """
+    Tests that load_tokenizer loads a model it registers with the given revision and quantization.
+    """
+    logger.debug("Starting test_load_tokenizer_loads_unregistered_model_as_configured.")
+    ModelRegistry._instance = None
+    tokenizer = EchoTokenizer()
+    with patch("backend.app.translators.translator_opus.load_opus_model",
+               return_value=(tokenizer, EchoModel())) as mock_load:
+        result = OpusMTTranslator.load_tokenizer("Helsinki-NLP/opus-mt-en-de", "cpu", "v2", "int8")
+    ModelRegistry._instance = None
+
+    assert result is tokenizer
+    mock_load.assert_called_once_with("Helsinki-NLP/opus-mt-en-de", "cpu", "v2", "int8")
+
+
+def test_load_opus_model_int8_quantizes_linear_layers():
+    """
+    Tests that quantization "int8" replaces the Linear layers with int8 dynamic Linear layers on CPU.
+    """
+    logger.debug("Starting test_load_opus_model_int8_quantizes_linear_layers.")
+    with patch("backend.app.translators.translator_opus.MarianMTModel") as mock_model, \
+         patch("backend.app.translators.translator_opus.MarianTokenizer"):
+        mock_model.from_pretrained.side_effect = lambda *args, **kwargs: torch.nn.Sequential(torch.nn.Linear(4, 4))
+
+        _, quantized = load_opus_model("Helsinki-NLP/opus-mt-en-de", "cpu", quantization="int8")
+        _, unquantized = load_opus_model("Helsinki-NLP/opus-mt-en-de", "cpu")
+
+    assert isinstance(quantized[0], torch.ao.nn.quantized.dynamic.Linear), "Expected an int8 dynamic Linear layer."
+    assert type(unquantized[0]) is torch.nn.Linear
+
+
 if __name__ == '__main__':
     # Run the tests if this file is executed directly.
     import pytest
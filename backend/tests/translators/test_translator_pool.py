@@ -0,0 +1,95 @@
+import logging
+import threading
+import pytest
+from unittest.mock import patch, MagicMock
+from backend.app.translators.translator_pool import TranslatorPool, create_translator
+
+# Configure logging to capture DEBUG and above messages.
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+
+def test_pool_creates_one_translator_per_model():
+    """
+    Tests that concurrent callers share one translator per model and device.
+    """
+    logger.debug("Running test_pool_creates_one_translator_per_model.")
+    TranslatorPool._instance = None
+    mock_translator = MagicMock(side_effect=lambda *args, **kwargs: MagicMock())
+    with patch("backend.app.translators.translator_pool.ENGINES", {"opus": mock_translator}):
+        pool = TranslatorPool()
+        translators = []
+        threads = [threading.Thread(target=lambda: translators.append(
+            pool.get("Helsinki-NLP/opus-mt-en-de", MagicMock(), "cpu"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+        other = pool.get("Helsinki-NLP/opus-mt-de-en", MagicMock(), "cpu")
+
+    assert mock_translator.call_count == 2, "Expected one construction per model."
+    assert all(translator is translators[0] for translator in translators)
+    assert other is not translators[0]
+    TranslatorPool._instance = None
+
+
+def test_pool_keeps_quantized_and_unquantized_translators_apart():
+    """
+    Tests that the pool creates translators from the engine configuration and keys them by quantization.
+    """
+    logger.debug("Running test_pool_keeps_quantized_and_unquantized_translators_apart.")
+    TranslatorPool._instance = None
+    mock_translator = MagicMock(side_effect=lambda *args, **kwargs: MagicMock())
+    int8_config = {"engine": "opus", "options": {"quantization": "int8", "revision": "v2"}}
+    with patch("backend.app.translators.translator_pool.ENGINES", {"opus": mock_translator}):
+        pool = TranslatorPool()
+        unquantized = pool.get("Helsinki-NLP/opus-mt-en-de", MagicMock(), "cpu")
+        quantized = pool.get("Helsinki-NLP/opus-mt-en-de", MagicMock(), "cpu", int8_config)
+
+    assert quantized is not unquantized
+    assert pool.get("Helsinki-NLP/opus-mt-en-de", MagicMock(), "cpu", int8_config) is quantized
+    assert mock_translator.call_args_list[1].kwargs == {"quantization": "int8", "revision": "v2"}
+    TranslatorPool._instance = None
+
+
+def test_create_translator_falls_back_to_opus():
+    """
+    Tests that "ctranslate2" without the ctranslate2 package and unknown engines fall back to the opus engine.
+    """
+    logger.debug("Running test_create_translator_falls_back_to_opus.")
+    with patch("backend.app.translators.translator_ctranslate2.ctranslate2", None), \
+         patch("backend.app.translators.translator_pool.ENGINES",
+               {"opus": MagicMock(name="opus"), "ctranslate2": MagicMock(name="ctranslate2")}) as engines:
+        create_translator("ctranslate2", "Helsinki-NLP/opus-mt-en-de", MagicMock(), "cpu",
+                          model_path="/models/en-de", compute_type="int8", revision="v2")
+        create_translator("onnx", "Helsinki-NLP/opus-mt-de-en", MagicMock(), "cpu")
+
+    assert engines["ctranslate2"].call_count == 0
+    assert engines["opus"].call_count == 2
+    assert engines["opus"].call_args_list[0].kwargs == {"revision": "v2"}
+
+
+def test_pool_keeps_engines_of_the_same_model_apart():
+    """
+    Tests that the pool keys translators by engine, so an opus and a CTranslate2 engine of one model do not collide.
+    """
+    logger.debug("Running test_pool_keeps_engines_of_the_same_model_apart.")
+    TranslatorPool._instance = None
+    engines = {"opus": MagicMock(side_effect=lambda *args, **kwargs: MagicMock()),
+               "ctranslate2": MagicMock(side_effect=lambda *args, **kwargs: MagicMock())}
+    ct2_config = {"engine": "ctranslate2", "options": {"model_path": "/models/en-de", "compute_type": "int8"}}
+    with patch("backend.app.translators.translator_ctranslate2.ctranslate2", MagicMock()), \
+         patch("backend.app.translators.translator_pool.ENGINES", engines):
+        pool = TranslatorPool()
+        opus = pool.get("Helsinki-NLP/opus-mt-en-de", MagicMock(), "cpu")
+        ct2 = pool.get("Helsinki-NLP/opus-mt-en-de", MagicMock(), "cpu", ct2_config)
+        assert pool.get("Helsinki-NLP/opus-mt-en-de", MagicMock(), "cpu", ct2_config) is ct2
+
+    assert ct2 is not opus
+    assert engines["opus"].call_count == 1 and engines["ctranslate2"].call_count == 1
+    TranslatorPool._instance = None
+
+
+if __name__ == '__main__':
+    # Run the tests if this file is executed directly.
+    pytest.main()
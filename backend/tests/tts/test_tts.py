@@ -1,9 +1,23 @@
+import itertools
 import pytest
+import wave
 from unittest.mock import MagicMock
 import torch
-from backend.app.services.service_tts import TTSService
+from backend.app.services.tts import TTSService
 from io import BytesIO
 
+
+def _wav(frames: bytes, framerate: int = 22050) -> BytesIO:
+    """Returns an in-memory 16-bit mono WAV file holding the given frames."""
+    buffer = BytesIO()
+    with wave.open(buffer, "wb") as wave_file:
+        wave_file.setnchannels(1)
+        wave_file.setsampwidth(2)
+        wave_file.setframerate(framerate)
+        wave_file.writeframes(frames)
+    buffer.seek(0)
+    return buffer
+
 class TestTTSService:
     """Unit tests for the TTSService class using only the xtts_v2 model."""
 
@@ -141,6 +155,129 @@ class TestTTSService:
         # Expect two cache set calls (one per language).
         assert self.cache_manager.set.call_count == 2, "Both language outputs should be cached separately."
 
+    def test_tts_service_streams_segments_as_they_are_synthesized(self, monkeypatch, tmp_path):
+        """Tests that streamed audio starts with a WAV header and sends each segment before the next is synthesized."""
+        from backend.app.utils.util_blob_store import BlobStore
+        monkeypatch.setattr(BlobStore, "_instance", None)
+        BlobStore(str(tmp_path))
+        synthesized = []
+
+        def iter_segment_audio(text, model, speaker, language):
+            for frames in (b"\x01\x00" * 4, b"\x02\x00" * 2):
+                synthesized.append(frames)
+                yield _wav(frames)
+
+        self.tts_service.synthesizer.iter_segment_audio.side_effect = iter_segment_audio
+        completed = []
+        chunks = self.tts_service.stream_audio("One. Two.", "tts_models/multilingual/multi-dataset/xtts_v2",
+                                               "Tammie Ema", "en", on_complete=completed.append)
+
+        header = next(chunks)
+        assert header[:4] == b"RIFF" and header[36:40] == b"data" and len(header) == 44
+        assert next(chunks) == b"\x01\x00" * 4
+        assert len(synthesized) == 1, "The first segment should be sent before the second one is synthesized."
+        assert list(chunks) == [b"\x02\x00" * 2]
+
+        # The complete audio is cached as a regular WAV file and passed to on_complete.
+        with wave.open(BytesIO(completed[0]), "rb") as wave_file:
+            assert wave_file.readframes(wave_file.getnframes()) == b"\x01\x00" * 4 + b"\x02\x00" * 2
+        assert self.cache_manager.set.call_count == 1
+        self.tts_service.synthesizer.synthesize.assert_not_called()
+
+
+class DictCacheManager:
+    """Cache manager stand-in keeping entries in a dictionary."""
+
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, key, record_stats=True):
+        return self.entries.get(key)
+
+    def set(self, key, value):
+        self.entries[key] = value
+
+    def record_compute_time(self, key, seconds):
+        pass
+
+
+def test_synthesizer_resynthesizes_only_changed_sentences(monkeypatch, tmp_path):
+    """Tests that sentence audio is cached, so editing one sentence of a page only synthesizes that sentence."""
+    from backend.app.synthesizers.synthezier_coqui import TTSSynthesizer
+    from backend.app.utils.util_blob_store import BlobStore
+    monkeypatch.setattr(BlobStore, "_instance", None)
+    BlobStore(str(tmp_path))
+    config_manager = MagicMock()
+    config_manager.get_torch_device.return_value = "cpu"
+    synthesizer = TTSSynthesizer(config_manager, DictCacheManager())
+    synthesized = []
+    calls = itertools.count(1)
+
+    def tts_for_synthesize(segment, model, speaker=None, language=None):
+        synthesized.append(segment)
+        return _wav(bytes([next(calls), 0]) * 3)
+
+    monkeypatch.setattr(synthesizer, "_tts_for_synthesize", tts_for_synthesize)
+    model = "tts_models/multilingual/multi-dataset/xtts_v2"
+    sentences = ["Alpha " * 19 + "end.", "Beta " * 22 + "end.", "Gamma " * 19 + "end.", "The last sentence of the page."]
+
+    audio = synthesizer.synthesize(" ".join(sentences), model, "Tammie Ema", "en")
+    assert synthesized == sentences
+
+    synthesized.clear()
+    cached_audio = synthesizer.synthesize(" ".join(sentences), model, "Tammie Ema", "en")
+    assert synthesized == [], "Expected the page to be assembled from cached sentences."
+    assert cached_audio.getvalue() == audio.getvalue()
+
+    edited = sentences[:1] + ["An edited sentence in the middle."] + sentences[2:]
+    edited_audio = synthesizer.synthesize(" ".join(edited), model, "Tammie Ema", "en")
+    assert synthesized == ["An edited sentence in the middle."], "Expected only the edited sentence to be synthesized."
+    with wave.open(edited_audio, "rb") as wave_file:
+        frames = wave_file.readframes(wave_file.getnframes())
+    assert frames == b"\x01\x00" * 3 + b"\x05\x00" * 3 + b"\x03\x00" * 3 + b"\x04\x00" * 3
+
+
+def test_failed_segment_raises_and_caches_no_page_audio(monkeypatch, tmp_path):
+    """Tests that a segment failing to synthesize fails the whole page, so no partial audio is cached."""
+    from backend.app.synthesizers.synthezier_coqui import TTSSynthesizer
+    from backend.app.utils.util_blob_store import BlobStore
+    monkeypatch.setattr(BlobStore, "_instance", None)
+    BlobStore(str(tmp_path))
+    config_manager = MagicMock()
+    config_manager.get_torch_device.return_value = "cpu"
+    cache_manager = DictCacheManager()
+    tts_service = TTSService(config_manager=config_manager, cache_manager=cache_manager)
+    tts_service.synthesizer = TTSSynthesizer(config_manager, cache_manager)
+
+    def tts_for_synthesize(segment, model, speaker=None, language=None):
+        return None if segment.startswith("Broken") else _wav(b"\x01\x00" * 3)
+
+    monkeypatch.setattr(tts_service.synthesizer, "_tts_for_synthesize", tts_for_synthesize)
+    model = "tts_models/multilingual/multi-dataset/xtts_v2"
+    text = "Alpha " * 40 + "end. Broken sentence that fails. " + "Gamma " * 40 + "end."
+
+    with pytest.raises(ValueError, match="Broken"):
+        tts_service.synthesize_audio(text, model, "Tammie Ema", "en")
+    with pytest.raises(ValueError, match="Broken"):
+        list(tts_service.stream_audio(text, model, "Tammie Ema", "en"))
+
+    assert cache_manager.entries, "Expected the audio of the segment before the failure to be cached."
+    assert all("-seg-" in key for key in cache_manager.entries), "Expected no page audio to be cached."
+
+
+def test_synthesize_audio_file_reopens_collected_blob(monkeypatch, tmp_path):
+    """Tests that the audio file is returned open and looked up again if its blob was removed before opening."""
+    blob = tmp_path / "blob"
+    blob.write_bytes(b"RIFF audio")
+    lookups = MagicMock(side_effect=[str(tmp_path / "collected"), str(blob)])
+    tts_service = TTSService(config_manager=MagicMock(), cache_manager=DictCacheManager())
+    monkeypatch.setattr(tts_service, "_get_or_synthesize", lookups)
+
+    with tts_service.synthesize_audio_file("Hello", "model", "speaker", "en") as audio_file:
+        blob.unlink()
+        assert audio_file.read() == b"RIFF audio"
+    assert lookups.call_count == 2
+
 
 if __name__ == '__main__':
     pytest.main()
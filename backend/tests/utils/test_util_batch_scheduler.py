@@ -0,0 +1,148 @@
+import logging
+import threading
+import time
+import pytest
+from backend.app.utils.util_batch_scheduler import BatchScheduler, PRIORITY_BULK, PRIORITY_INTERACTIVE
+from backend.app.utils.util_priority_gate import PriorityGate
+
+# Configure logging to capture DEBUG, WARNING, and ERROR messages.
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def scheduler():
+    """
+    Fixture creating a fresh BatchScheduler with a wait window long enough for the test threads to join.
+    """
+    BatchScheduler._instance = None
+    yield BatchScheduler(max_wait_ms=200, max_batch_size=64)
+    BatchScheduler._instance = None
+
+
+def test_concurrent_requests_share_one_batch(scheduler):
+    """
+    Tests that concurrent requests for the same model are run as one micro-batch and get their own results.
+    """
+    logger.debug("Running test_concurrent_requests_share_one_batch.")
+    batches = []
+    results = {}
+
+    def translate_batch(segments):
+        batches.append(list(segments))
+        return [segment.upper() for segment in segments]
+
+    def request(name, segments):
+        results[name] = scheduler.submit("translation:Helsinki-NLP/opus-mt-en-de", segments, translate_batch)
+
+    threads = [threading.Thread(target=request, args=(f"r{i}", [f"r{i} a", f"r{i} b"])) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(batches) == 1, "Expected all concurrent requests in one micro-batch."
+    assert len(batches[0]) == 8
+    assert results == {f"r{i}": [f"R{i} A", f"R{i} B"] for i in range(4)}
+    assert scheduler.get_stats()["requests_per_batch"] == 4
+
+
+def test_batch_size_limit_and_errors(scheduler):
+    """
+    Tests that a micro-batch stops at max_batch_size and that a failing batch raises in its callers.
+    """
+    logger.debug("Running test_batch_size_limit_and_errors.")
+    scheduler.max_batch_size = 3
+    batches = []
+
+    def translate_batch(segments):
+        batches.append(len(segments))
+        return segments
+
+    threads = [threading.Thread(target=scheduler.submit, args=("translation:model", ["a", "b"], translate_batch))
+               for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert batches == [2, 2], "Expected requests exceeding the batch size to run separately."
+
+    def failing(segments):
+        raise RuntimeError("CUDA out of memory")
+
+    with pytest.raises(RuntimeError, match="CUDA out of memory"):
+        scheduler.submit("translation:model", ["a"], failing)
+
+
+
+def test_interactive_requests_run_before_queued_bulk_batches(scheduler):
+    """
+    Tests that a bulk submission is split into batches and an interactive request runs at the next batch boundary.
+    """
+    logger.debug("Running test_interactive_requests_run_before_queued_bulk_batches.")
+    scheduler.max_batch_size = 2
+    first_batch_started = threading.Event()
+    release = threading.Event()
+    batches = []
+
+    def translate_batch(segments):
+        batches.append(list(segments))
+        first_batch_started.set()
+        release.wait(5)
+        return [segment.upper() for segment in segments]
+
+    results = {}
+    bulk = threading.Thread(target=lambda: results.update(bulk=scheduler.submit(
+        "translation:model", ["b1", "b2", "b3", "b4", "b5", "b6"], translate_batch, PRIORITY_BULK)))
+    bulk.start()
+    assert first_batch_started.wait(5)
+    interactive = threading.Thread(target=lambda: results.update(interactive=scheduler.submit(
+        "translation:model", ["page"], translate_batch, PRIORITY_INTERACTIVE)))
+    interactive.start()
+    time.sleep(0.05)
+    release.set()
+    bulk.join(timeout=5)
+    interactive.join(timeout=5)
+
+    assert batches[0] == ["b1", "b2"]
+    assert batches[1][0] == "page", "Expected the interactive request to preempt the queued bulk batches."
+    assert results == {"bulk": ["B1", "B2", "B3", "B4", "B5", "B6"], "interactive": ["PAGE"]}
+    classes = scheduler.get_stats()["classes"]
+    assert classes[PRIORITY_INTERACTIVE]["requests"] == 1 and classes[PRIORITY_BULK]["requests"] == 3
+    with pytest.raises(ValueError, match="Unknown priority"):
+        scheduler.submit("translation:model", ["a"], translate_batch, "urgent")
+
+
+def test_priority_gate_admits_interactive_callers_first():
+    """
+    Tests that the PriorityGate admits a waiting interactive caller before bulk callers that waited longer.
+    """
+    logger.debug("Running test_priority_gate_admits_interactive_callers_first.")
+    PriorityGate._instance = None
+    gate = PriorityGate()
+    order = []
+
+    def synthesize(name, priority):
+        with gate.hold("tts:xtts_v2", priority):
+            order.append(name)
+
+    with gate.hold("tts:xtts_v2", PRIORITY_BULK):
+        threads = [threading.Thread(target=synthesize, args=(f"bulk{i}", PRIORITY_BULK)) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        threads.append(threading.Thread(target=synthesize, args=("page", PRIORITY_INTERACTIVE)))
+        threads[-1].start()
+        time.sleep(0.05)
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert order[0] == "page"
+    assert sorted(order[1:]) == ["bulk0", "bulk1"]
+    assert gate.get_stats()[PRIORITY_BULK]["requests"] == 3
+    PriorityGate._instance = None
+
+
+if __name__ == '__main__':
+    # Run the tests if this file is executed directly.
+    pytest.main()
@@ -0,0 +1,93 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+import pytest
+from backend.app.utils.util_blob_store import BlobStore
+
+# Configure logging to capture DEBUG, WARNING, and ERROR messages.
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def blob_store(tmp_path):
+    """
+    Fixture providing a fresh BlobStore in a temporary directory with a 100 byte limit.
+    """
+    BlobStore._instance = None
+    yield BlobStore(directory=str(tmp_path / "blobs"), max_bytes=100)
+    BlobStore._instance = None
+
+
+def test_blobs_are_content_addressed(blob_store):
+    """
+    Tests that blobs are stored under their SHA-256 digest and identical content is stored once.
+    """
+    logger.debug("Running test_blobs_are_content_addressed.")
+    digest = blob_store.put(b"RIFF audio")
+    assert digest == hashlib.sha256(b"RIFF audio").hexdigest()
+    assert blob_store.put(b"RIFF audio") == digest
+    assert blob_store.read(digest) == b"RIFF audio"
+    assert os.path.basename(blob_store.path(digest)) == digest
+    assert blob_store.get_stats()["bytes"] == len(b"RIFF audio")
+    assert blob_store.path("0" * 64) is None
+
+
+def test_gc_removes_least_recently_used_blobs(blob_store):
+    """
+    Tests that exceeding the size limit deletes the least recently used blobs.
+    """
+    logger.debug("Running test_gc_removes_least_recently_used_blobs.")
+    first = blob_store.put(b"a" * 40)
+    time.sleep(0.01)
+    second = blob_store.put(b"b" * 40)
+    time.sleep(0.01)
+    blob_store.path(first)  # 'first' becomes the most recently used blob.
+    time.sleep(0.01)
+    third = blob_store.put(b"c" * 40)
+
+    assert blob_store.path(second) is None
+    assert blob_store.read(first) == b"a" * 40 and blob_store.read(third) == b"c" * 40
+    assert blob_store.get_stats() == {"bytes": 80, "max_bytes": 100, "removed": 1}
+
+
+def test_existing_blobs_are_counted_on_start(tmp_path):
+    """
+    Tests that a new BlobStore instance picks up the blobs written by a previous one.
+    """
+    logger.debug("Running test_existing_blobs_are_counted_on_start.")
+    BlobStore._instance = None
+    digest = BlobStore(directory=str(tmp_path / "blobs"), max_bytes=0).put(b"x" * 30)
+    BlobStore._instance = None
+    reopened = BlobStore(directory=str(tmp_path / "blobs"), max_bytes=0)
+    BlobStore._instance = None
+
+    assert reopened.get_stats()["bytes"] == 30
+    assert reopened.read(digest) == b"x" * 30
+
+
+def test_concurrent_puts_of_same_content_are_counted_once(blob_store):
+    """
+    Tests that concurrent writes of identical content add its size to the total only once.
+    """
+    logger.debug("Running test_concurrent_puts_of_same_content_are_counted_once.")
+    barrier = threading.Barrier(8)
+
+    def put():
+        barrier.wait()
+        blob_store.put(b"RIFF audio")
+
+    threads = [threading.Thread(target=put) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert blob_store.get_stats()["bytes"] == len(b"RIFF audio")
+
+
+if __name__ == '__main__':
+    # Run the tests if this file is executed directly.
+    pytest.main()
@@ -0,0 +1,60 @@
+import logging
+import os
+import pickle
+import pytest
+from backend.app.utils.util_cache_codec import CacheCodec, CompressedValue
+from backend.app.utils.util_cache_namespaces import estimate_size
+
+# Configure logging to capture DEBUG, WARNING, and ERROR messages.
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+TRANSLATION = [f"Satz {i}: Das ist ein Satz, der sich in einer langen Übersetzung oft wiederholt." for i in range(100)]
+
+
+@pytest.mark.parametrize("codec_name", ["auto", "zlib"])
+def test_large_values_round_trip_compressed(codec_name):
+    """
+    Tests that large text and bytes values are compressed, smaller in RAM, and restored unchanged.
+    """
+    logger.debug("Running test_large_values_round_trip_compressed.")
+    codec = CacheCodec(codec_name, min_bytes=1024)
+    audio = b"RIFF" + b"\x00\x01" * 5000
+
+    for value in (TRANSLATION, audio):
+        encoded = codec.encode(value)
+        assert isinstance(encoded, CompressedValue)
+        assert estimate_size(encoded) < estimate_size(value)
+        assert codec.decode(pickle.loads(pickle.dumps(encoded))) == value
+
+    stats = codec.get_stats()
+    assert stats["compressed"] == 2 and stats["ratio"] > 1
+
+
+def test_small_and_incompressible_values_are_kept():
+    """
+    Tests that values below the threshold or without a saving are stored as they are.
+    """
+    logger.debug("Running test_small_and_incompressible_values_are_kept.")
+    codec = CacheCodec("zlib", min_bytes=1024)
+    random_bytes = os.urandom(4096)
+
+    assert codec.encode("Hallo Welt") == "Hallo Welt"
+    assert codec.encode(random_bytes) is random_bytes
+    assert codec.decode("Hallo Welt") == "Hallo Welt"
+    assert codec.get_stats()["skipped"] == 2
+
+
+def test_disabled_codec():
+    """
+    Tests that the "none" codec never compresses and unknown codecs are rejected.
+    """
+    logger.debug("Running test_disabled_codec.")
+    assert CacheCodec("none").encode(TRANSLATION) is TRANSLATION
+    with pytest.raises(ValueError):
+        CacheCodec("brotli")
+
+
+if __name__ == '__main__':
+    # Run the tests if this file is executed directly.
+    pytest.main()
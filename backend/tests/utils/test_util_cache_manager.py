@@ -1,4 +1,5 @@
 import logging
+import pickle
 import pytest
 from backend.app.utils.util_logger import Logger  # Import the Logger class
 from backend.app.utils import CacheManager
@@ -48,6 +49,68 @@ def test_cache_operations():
     logger.debug("test_cache_operations completed successfully.")
 
 
+VERSION_TAGS = {
+    "Helsinki-NLP/opus-mt-en-de-": "Helsinki-NLP/opus-mt-en-de@main",
+    "Helsinki-NLP/opus-mt-de-en-": "Helsinki-NLP/opus-mt-de-en@main",
+    "stt-": "turbo@main"
+}
+
+
+def _start(tmp_path, cache_version="1", version_tags=None):
+    """Creates a CacheManager on the same store as a restarted process would."""
+    CacheManager._instance = None
+    cache_manager = CacheManager(cache_file=str(tmp_path / "cache.db"), maxsize=10, compaction_interval=0,
+                                 cache_version=cache_version, version_tags=version_tags or VERSION_TAGS)
+    CacheManager._instance = None
+    return cache_manager
+
+
+def test_warm_start_reloads_entries(tmp_path):
+    """
+    Tests that entries persisted before a restart are in RAM right after the restart.
+    """
+    logger.debug("Running test_warm_start_reloads_entries.")
+    _start(tmp_path).set("Helsinki-NLP/opus-mt-en-de-abc", ["Hallo"])
+
+    restarted = _start(tmp_path)
+    assert "Helsinki-NLP/opus-mt-en-de-abc" in restarted.cache
+    assert restarted.get("Helsinki-NLP/opus-mt-en-de-abc") == ["Hallo"]
+
+
+def test_changed_model_revision_drops_only_its_entries(tmp_path):
+    """
+    Tests that a new revision of one model invalidates its entries and keeps those of other models.
+    """
+    logger.debug("Running test_changed_model_revision_drops_only_its_entries.")
+    cache_manager = _start(tmp_path)
+    cache_manager.set("Helsinki-NLP/opus-mt-en-de-abc", ["Hallo"])
+    cache_manager.set("Helsinki-NLP/opus-mt-de-en-abc", ["Hello"])
+    cache_manager.set("stt-abc", "Hallo Welt")
+
+    restarted = _start(tmp_path, version_tags=dict(VERSION_TAGS, **{
+        "Helsinki-NLP/opus-mt-en-de-": "Helsinki-NLP/opus-mt-en-de@v2"
+    }))
+    assert restarted.get("Helsinki-NLP/opus-mt-en-de-abc") is None
+    assert restarted.store.get("Helsinki-NLP/opus-mt-en-de-abc") is None, "Expected the stale row to be deleted."
+    assert restarted.get("Helsinki-NLP/opus-mt-de-en-abc") == ["Hello"]
+    assert restarted.get("stt-abc") == "Hallo Welt"
+
+
+def test_cache_version_and_legacy_entries_are_dropped(tmp_path):
+    """
+    Tests that bumping the cache version invalidates everything and unversioned rows are never served.
+    """
+    logger.debug("Running test_cache_version_and_legacy_entries_are_dropped.")
+    cache_manager = _start(tmp_path)
+    cache_manager.set("stt-abc", "Hallo Welt")
+    cache_manager.store.put("stt-legacy", pickle.dumps("unversioned"))
+    assert cache_manager.get("stt-legacy") is None
+
+    restarted = _start(tmp_path, cache_version="2")
+    assert len(restarted.cache) == 0
+    assert restarted.get("stt-abc") is None
+
+
 if __name__ == '__main__':
     # Run the tests if this file is executed directly.
     pytest.main()
@@ -0,0 +1,86 @@
+import logging
+import pytest
+from backend.app.utils.util_cache_namespaces import NamespacedCache, SizedLRUCache, get_cache_namespace
+
+# Configure logging to capture DEBUG, WARNING, and ERROR messages.
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+
+def test_get_cache_namespace():
+    """
+    Tests that cache keys are mapped to the expected namespaces by prefix.
+    """
+    logger.debug("Running test_get_cache_namespace.")
+    assert get_cache_namespace("tts-xtts_v2-Daisy Studious-de-abc") == "tts"
+    assert get_cache_namespace("stt-abc") == "stt"
+    assert get_cache_namespace("model-Helsinki-NLP/opus-mt-en-de") == "models"
+    assert get_cache_namespace("Helsinki-NLP/opus-mt-en-de-abc") == "translation"
+
+
+def test_sized_lru_cache_evicts_by_bytes():
+    """
+    Tests that a large value evicts the least recently used entries until it fits the byte budget.
+    """
+    logger.debug("Running test_sized_lru_cache_evicts_by_bytes.")
+    cache = SizedLRUCache(max_bytes=100, max_entries=10)
+    cache["a"] = b"x" * 40
+    cache["b"] = b"x" * 40
+    cache.get("a")  # 'a' becomes the most recently used entry.
+    cache["c"] = b"x" * 50
+
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert cache.currsize == 90
+    assert cache.evictions == 1
+
+
+def test_sized_lru_cache_evicts_by_entries():
+    """
+    Tests that the entry limit is enforced independently of the byte budget.
+    """
+    logger.debug("Running test_sized_lru_cache_evicts_by_entries.")
+    cache = SizedLRUCache(max_bytes=0, max_entries=2)
+    for key in ("a", "b", "c"):
+        cache[key] = b"x"
+    assert list(cache.keys()) == ["b", "c"]
+
+
+def test_namespaces_have_separate_budgets():
+    """
+    Tests that filling the TTS namespace does not evict translation entries and that
+    values larger than a namespace budget are not kept in RAM.
+    """
+    logger.debug("Running test_namespaces_have_separate_budgets.")
+    cache = NamespacedCache(max_entries=100, namespace_budgets={"tts": 1000})
+    cache["Helsinki-NLP/opus-mt-en-de-abc"] = ["Hallo"]
+    for i in range(5):
+        cache[f"tts-model-speaker-de-{i}"] = b"x" * 400
+    cache["tts-model-speaker-de-large"] = b"x" * 2000
+
+    assert cache.get("Helsinki-NLP/opus-mt-en-de-abc") == ["Hallo"]
+    assert "tts-model-speaker-de-large" not in cache
+
+    footprint = cache.get_footprint()
+    assert footprint["tts"]["entries"] == 2
+    assert footprint["tts"]["bytes"] == 800
+    assert footprint["tts"]["budget_bytes"] == 1000
+    assert footprint["translation"]["entries"] == 1
+
+
+def test_oversized_overwrite_removes_stale_value():
+    """
+    Tests that overwriting a key with a value larger than the namespace budget drops the old value,
+    so the cache never returns the value the caller replaced.
+    """
+    logger.debug("Running test_oversized_overwrite_removes_stale_value.")
+    cache = NamespacedCache(max_entries=100, namespace_budgets={"tts": 1000})
+    cache["tts-model-speaker-de-page"] = b"old" * 100
+    cache["tts-model-speaker-de-page"] = b"x" * 2000
+
+    assert cache.get("tts-model-speaker-de-page") is None
+    assert cache.get_footprint()["tts"] == {"entries": 0, "bytes": 0, "budget_bytes": 1000, "evictions": 0}
+
+
+if __name__ == '__main__':
+    # Run the tests if this file is executed directly.
+    pytest.main()
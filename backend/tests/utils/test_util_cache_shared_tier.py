@@ -0,0 +1,84 @@
+import logging
+import time
+import pytest
+from backend.app.utils.util_cache_mananger import CacheManager
+from backend.app.utils.util_cache_store import MemoryCacheStore
+
+# Configure logging to capture DEBUG, WARNING, and ERROR messages.
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+
+def _new_worker(tmp_path, name, shared_tier, shared_max_item_bytes=0):
+    """Creates a CacheManager with its own local store, as a separate worker process would."""
+    CacheManager._instance = None
+    worker = CacheManager(cache_file=str(tmp_path / f"{name}.db"), maxsize=10, compaction_interval=0,
+                          shared_tier=shared_tier, shared_max_item_bytes=shared_max_item_bytes)
+    CacheManager._instance = None
+    return worker
+
+
+def test_results_are_shared_between_workers(tmp_path):
+    """
+    Tests that a value computed by one worker is served to another worker from the shared tier.
+    """
+    logger.debug("Running test_results_are_shared_between_workers.")
+    shared_tier = MemoryCacheStore()
+    worker_a = _new_worker(tmp_path, "a", shared_tier)
+    worker_b = _new_worker(tmp_path, "b", shared_tier)
+
+    worker_a.set("Helsinki-NLP/opus-mt-en-de-abc", ["Hallo"])
+    assert worker_b.get("Helsinki-NLP/opus-mt-en-de-abc") == ["Hallo"]
+    assert "Helsinki-NLP/opus-mt-en-de-abc" in worker_b.cache, "Expected the shared hit to be promoted to RAM."
+
+
+def test_large_items_stay_local(tmp_path):
+    """
+    Tests that entries above the shared item limit are only cached by the worker that computed them.
+    """
+    logger.debug("Running test_large_items_stay_local.")
+    shared_tier = MemoryCacheStore()
+    worker_a = _new_worker(tmp_path, "a", shared_tier, shared_max_item_bytes=100)
+    worker_b = _new_worker(tmp_path, "b", shared_tier, shared_max_item_bytes=100)
+
+    worker_a.set("tts-xtts_v2-Daisy Studious-de-abc", b"x" * 1000)
+    assert worker_a.get("tts-xtts_v2-Daisy Studious-de-abc") == b"x" * 1000
+    assert worker_b.get("tts-xtts_v2-Daisy Studious-de-abc") is None
+
+
+def test_shared_tier_failures_are_misses(tmp_path):
+    """
+    Tests that an unreachable shared tier does not break lookups or writes.
+    """
+    logger.debug("Running test_shared_tier_failures_are_misses.")
+
+    class BrokenTier(MemoryCacheStore):
+        def get(self, key):
+            raise ConnectionError("shared tier unreachable")
+
+        def put(self, key, payload):
+            raise ConnectionError("shared tier unreachable")
+
+    worker = _new_worker(tmp_path, "a", BrokenTier())
+    worker.set("stt-abc", "Hallo")
+    worker.cache.clear()
+    assert worker.get("stt-abc") == "Hallo", "Expected a fallback to the local store."
+    assert worker.get("stt-missing") is None
+
+
+def test_memory_store_expires_entries():
+    """
+    Tests that the stand-in tier ignores entries older than its TTL.
+    """
+    logger.debug("Running test_memory_store_expires_entries.")
+    shared_tier = MemoryCacheStore(ttl_seconds=0.1)
+    shared_tier.put("stt-abc", b"payload")
+    assert shared_tier.get("stt-abc") == b"payload"
+    time.sleep(0.15)
+    assert shared_tier.get("stt-abc") is None
+    assert shared_tier.load(10) == []
+
+
+if __name__ == '__main__':
+    # Run the tests if this file is executed directly.
+    pytest.main()
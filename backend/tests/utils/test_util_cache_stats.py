@@ -0,0 +1,68 @@
+import logging
+import pytest
+from backend.app.utils.util_cache_stats import CacheStatistics
+
+# Configure logging to capture DEBUG, WARNING, and ERROR messages.
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+
+def test_hits_and_misses_are_counted_per_namespace():
+    """
+    Tests that lookups are attributed to the namespace of their key.
+    """
+    logger.debug("Running test_hits_and_misses_are_counted_per_namespace.")
+    stats = CacheStatistics()
+    stats.record_miss("tts-xtts_v2-Daisy Studious-de-abc")
+    stats.record_hit("tts-xtts_v2-Daisy Studious-de-abc")
+    stats.record_hit("tts-xtts_v2-Daisy Studious-de-abc")
+    stats.record_miss("stt-abc")
+
+    snapshot = stats.snapshot()
+    assert snapshot["tts"]["hits"] == 2 and snapshot["tts"]["misses"] == 1
+    assert snapshot["tts"]["hit_ratio"] == pytest.approx(2 / 3, abs=1e-4)
+    assert snapshot["stt"]["hits"] == 0 and snapshot["stt"]["hit_ratio"] == 0
+    assert "translation" not in snapshot
+
+
+def test_hits_accumulate_saved_compute_time():
+    """
+    Tests that every hit on a key adds the compute time recorded for that key.
+    """
+    logger.debug("Running test_hits_accumulate_saved_compute_time.")
+    stats = CacheStatistics()
+    key = "Helsinki-NLP/opus-mt-en-de-abc"
+    stats.record_miss(key)
+    stats.record_compute_time(key, 1.5)
+    stats.record_hit(key)
+    stats.record_hit(key)
+    stats.record_hit("Helsinki-NLP/opus-mt-en-de-unknown")  # e.g. loaded from the store after a restart
+
+    translation = stats.snapshot()["translation"]
+    assert translation["compute_seconds"] == 1.5
+    assert translation["compute_seconds_saved"] == 3.0
+
+
+def test_snapshot_includes_footprint():
+    """
+    Tests that the in-memory footprint is merged into the counters, also for namespaces without lookups.
+    """
+    logger.debug("Running test_snapshot_includes_footprint.")
+    stats = CacheStatistics()
+    stats.record_hit("stt-abc")
+    footprint = {
+        "stt": {"entries": 1, "bytes": 11, "budget_bytes": 100, "evictions": 2},
+        "tts": {"entries": 0, "bytes": 0, "budget_bytes": 100, "evictions": 0}
+    }
+
+    snapshot = stats.snapshot(footprint)
+    assert snapshot["stt"]["bytes"] == 11 and snapshot["stt"]["evictions"] == 2
+    assert snapshot["tts"]["hits"] == 0 and snapshot["tts"]["hit_ratio"] is None
+
+    stats.reset()
+    assert stats.snapshot() == {}
+
+
+if __name__ == '__main__':
+    # Run the tests if this file is executed directly.
+    pytest.main()
@@ -0,0 +1,93 @@
+import logging
+import pickle
+import pytest
+from backend.app.utils.util_cache_store import SQLiteCacheStore
+
+# Configure logging to capture DEBUG, WARNING, and ERROR messages.
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def cache_store(tmp_path):
+    """
+    Fixture providing a SQLiteCacheStore in a temporary directory without the background compaction thread.
+    """
+    store = SQLiteCacheStore(str(tmp_path / "cache.db"), max_entries=3, compaction_interval=0)
+    yield store
+    store.close()
+
+
+def test_put_get_and_delete(cache_store):
+    """
+    Tests that single entries can be written, read back, replaced and deleted.
+    """
+    logger.debug("Running test_put_get_and_delete.")
+    cache_store.put("key1", pickle.dumps(["Hallo"]))
+    assert pickle.loads(cache_store.get("key1")) == ["Hallo"]
+
+    cache_store.put("key1", pickle.dumps(["Hallo Welt"]))
+    assert pickle.loads(cache_store.get("key1")) == ["Hallo Welt"], "Expected the entry to be replaced."
+
+    cache_store.delete("key1")
+    assert cache_store.get("key1") is None, "Expected None after deleting the entry."
+
+
+def test_load_returns_most_recent_entries_oldest_first(cache_store):
+    """
+    Tests that load() returns the newest entries in write order so they can be replayed into an LRU cache.
+    """
+    logger.debug("Running test_load_returns_most_recent_entries_oldest_first.")
+    for i in range(5):
+        cache_store.put(f"key{i}", pickle.dumps(i))
+
+    loaded = cache_store.load(limit=2)
+    assert [key for key, _ in loaded] == ["key3", "key4"]
+
+
+def test_compact_trims_to_max_entries(cache_store):
+    """
+    Tests that compaction keeps only the `max_entries` most recently written rows.
+    """
+    logger.debug("Running test_compact_trims_to_max_entries.")
+    for i in range(5):
+        cache_store.put(f"key{i}", pickle.dumps(i))
+
+    cache_store.compact()
+    assert cache_store.get("key0") is None and cache_store.get("key1") is None
+    assert [key for key, _ in cache_store.load(limit=10)] == ["key2", "key3", "key4"]
+
+
+def test_entries_survive_reopen(tmp_path):
+    """
+    Tests that committed entries are recovered after the store is reopened.
+    """
+    logger.debug("Running test_entries_survive_reopen.")
+    db_path = str(tmp_path / "cache.db")
+    store = SQLiteCacheStore(db_path, compaction_interval=0)
+    store.put("stt-abc", pickle.dumps("transcription"))
+    store.close()
+
+    reopened = SQLiteCacheStore(db_path, compaction_interval=0)
+    assert pickle.loads(reopened.get("stt-abc")) == "transcription"
+    reopened.close()
+
+
+def test_corrupted_database_is_replaced(tmp_path):
+    """
+    Tests that a corrupted database file is moved aside and a fresh store is created.
+    """
+    logger.debug("Running test_corrupted_database_is_replaced.")
+    db_path = tmp_path / "cache.db"
+    db_path.write_bytes(b"this is not a sqlite database" * 100)
+
+    store = SQLiteCacheStore(str(db_path), compaction_interval=0)
+    store.put("key1", b"value1")
+    assert store.get("key1") == b"value1"
+    assert list(tmp_path.glob("cache.db.corrupt-*")), "Expected the corrupted file to be kept for inspection."
+    store.close()
+
+
+if __name__ == '__main__':
+    # Run the tests if this file is executed directly.
+    pytest.main()
@@ -1,8 +1,12 @@
+import configparser
+import importlib.util
 import logging
 import pytest
 from _pytest import unittest
+from unittest.mock import patch
 
 from backend.app.utils import CacheManager
+from backend.app.utils.util_config_manager import ConfigManager
 
 # Configure logging to capture DEBUG (and above) messages.
 logging.basicConfig(level=logging.DEBUG)
@@ -66,6 +70,42 @@ def test_mock_cache_manager(mock_cache_manager):
     logger.debug("test_mock_cache_manager passed.")
 
 
+def test_ctranslate2_falls_back_to_opus_in_engine_config_and_cache_tags(tmp_path):
+    """
+    Test that a ctranslate2 model without the package or its converted model is configured and tagged as opus.
+    """
+    logger.debug("Running test_ctranslate2_falls_back_to_opus_in_engine_config_and_cache_tags.")
+    model_path = tmp_path / "opus-mt-en-de-ct2"
+    manager = object.__new__(ConfigManager)  # Skip the singleton and the config file
+    manager._config_cache = {}
+    manager.config = configparser.ConfigParser()
+    manager.config.read_string(f"""
+[TRANSLATE]
+AVAILABLE_MODELS = Helsinki-NLP/opus-mt-en-de
+ENGINES = {{"Helsinki-NLP/opus-mt-en-de": "ctranslate2"}}
+CTRANSLATE2_MODELS = {{"Helsinki-NLP/opus-mt-en-de": "{model_path.as_posix()}"}}
+CTRANSLATE2_COMPUTE_TYPE = int8
+[TTS]
+AVAILABLE_MODELS = tts_models/multilingual/multi-dataset/xtts_v2
+[STT]
+MODEL = turbo
+""")
+
+    with patch.object(importlib.util, "find_spec", return_value=object()) as find_spec:
+        assert manager.get_translation_engine_config("Helsinki-NLP/opus-mt-en-de")["engine"] == "opus", \
+            "Expected opus while the converted model is missing."
+        assert manager.get_cache_version_tags()["Helsinki-NLP/opus-mt-en-de-"] == "Helsinki-NLP/opus-mt-en-de@main"
+        assert find_spec.call_count == 1, "Expected the engine to be resolved once."
+        model_path.mkdir()
+        manager._config_cache = {}  # The engine is resolved again after a restart.
+        assert manager.get_cache_version_tags()["Helsinki-NLP/opus-mt-en-de-"] == \
+            "Helsinki-NLP/opus-mt-en-de@main:ctranslate2-int8"
+    manager._config_cache = {}
+    with patch.object(importlib.util, "find_spec", return_value=None):
+        assert manager.get_translation_engine_config("Helsinki-NLP/opus-mt-en-de") == \
+            {"engine": "opus", "options": {"quantization": "none", "revision": "main"}}
+
+
 if __name__ == '__main__':
     # Start method: run the tests if this file is executed directly.
     # This allows running the tests manually with: python test_util_config_manager.py
@@ -0,0 +1,186 @@
+import logging
+import threading
+import time
+import pytest
+from backend.app.utils.util_job_manager import JobManager
+
+mongomock = pytest.importorskip("mongomock")
+
+# Configure logging to capture DEBUG, WARNING, and ERROR messages.
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def collection():
+    """
+    Fixture providing an in-memory jobs collection.
+    """
+    return mongomock.MongoClient().db.jobs
+
+
+@pytest.fixture
+def manager(collection):
+    """
+    Fixture creating a fresh JobManager with a short poll interval; the workers are stopped afterwards.
+    """
+    JobManager._instance = None
+    job_manager = JobManager(collection, workers=1, poll_interval=0.05)
+    yield job_manager
+    job_manager.stop(timeout=5)
+    JobManager._instance = None
+
+
+def _wait_for(manager, job_id, states=("done", "failed", "cancelled"), timeout=5):
+    """Waits until the job reaches one of the given states and returns it."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = manager.get(job_id)
+        if job["status"] in states:
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"Job {job_id} did not reach {states}.")
+
+
+def test_job_runs_pages_and_reports_progress(manager):
+    """
+    Tests that a submitted job is run by a worker, reports its progress and stores its result.
+    """
+    logger.debug("Running test_job_runs_pages_and_reports_progress.")
+    chunks = []
+
+    def handler(job, context):
+        context.run(range(1, 6), chunks.append, step=2)
+        return {"pages": 5, "title": job["params"]["title"]}
+
+    manager.register_handler("translate_book", handler, ("user", "title"))
+    manager.start()
+    job_id = manager.submit("translate_book", {"user": "alice", "title": "Book"}, user="alice")
+
+    job = _wait_for(manager, job_id)
+    assert job["status"] == "done"
+    assert job["result"] == {"pages": 5, "title": "Book"}
+    assert job["progress"] == {"done": 5, "total": 5}
+    assert chunks == [[1, 2], [3, 4], [5]]
+
+
+def test_submit_rejects_unknown_types_and_missing_params(manager):
+    """
+    Tests that jobs of unknown types or without their required parameters are rejected.
+    """
+    logger.debug("Running test_submit_rejects_unknown_types_and_missing_params.")
+    manager.register_handler("tts_book", lambda job, context: None, ("user", "title"))
+
+    with pytest.raises(ValueError, match="Unsupported job type"):
+        manager.submit("unknown", {})
+    with pytest.raises(ValueError, match="title"):
+        manager.submit("tts_book", {"user": "alice"})
+
+
+def test_cancel_stops_running_job(manager):
+    """
+    Tests that cancelling a running job stops it before its next chunk of pages.
+    """
+    logger.debug("Running test_cancel_stops_running_job.")
+    started = threading.Event()
+    release = threading.Event()
+    processed = []
+
+    def process(chunk):
+        processed.extend(chunk)
+        started.set()
+        release.wait(5)
+
+    manager.register_handler("ocr_book", lambda job, context: context.run([1, 2, 3], process))
+    manager.start()
+    job_id = manager.submit("ocr_book", {})
+
+    assert started.wait(5)
+    assert manager.cancel(job_id)["cancel_requested"] is True
+    release.set()
+
+    job = _wait_for(manager, job_id)
+    assert job["status"] == "cancelled"
+    assert processed == [1], "Expected no further pages after the cancellation."
+    assert manager.cancel("missing") is None
+
+
+def test_interrupted_job_resumes_unfinished_pages(manager, collection):
+    """
+    Tests that a job left running by a previous process is resumed and only processes its unfinished pages.
+    """
+    logger.debug("Running test_interrupted_job_resumes_unfinished_pages.")
+    collection.insert_one({
+        "_id": "interrupted", "type": "translate_book", "user": "alice", "params": {}, "status": "running",
+        "progress": {"done": 2, "total": 4}, "completed_units": [1, 2], "result": None, "error": None,
+        "cancel_requested": False, "attempts": 1, "created_at": time.time(), "updated_at": time.time()
+    })
+    processed = []
+
+    def handler(job, context):
+        context.run([1, 2, 3, 4], processed.extend)
+        return {"processed": len(processed)}
+
+    manager.register_handler("translate_book", handler)
+    manager.start()
+
+    job = _wait_for(manager, "interrupted")
+    assert job["status"] == "done"
+    assert processed == [3, 4]
+    assert job["progress"] == {"done": 4, "total": 4}
+    assert job["attempts"] == 2
+
+
+def test_only_jobs_with_expired_leases_are_taken_over(manager, collection):
+    """
+    Tests that a job whose worker stopped renewing its lease is resumed, while a job of a live worker is left alone.
+    """
+    logger.debug("Running test_only_jobs_with_expired_leases_are_taken_over.")
+    now = time.time()
+    for job_id, owner, lease in (("live", "other-worker", now + 60), ("expired", "dead-worker", now - 1)):
+        collection.insert_one({
+            "_id": job_id, "type": "translate_book", "user": "alice", "params": {}, "status": "running",
+            "owner": owner, "lease_expires_at": lease, "progress": {"done": 0, "total": 0}, "completed_units": [],
+            "result": None, "error": None, "cancel_requested": False, "attempts": 1, "created_at": now,
+            "updated_at": now
+        })
+    processed = []
+    manager.register_handler("translate_book", lambda job, context: processed.append(job["_id"]))
+    manager.start()
+
+    job = _wait_for(manager, "expired")
+    assert job["status"] == "done"
+    assert job["owner"] == manager.worker_id
+    live = manager.get("live")
+    assert live["status"] == "running"
+    assert live["owner"] == "other-worker"
+    assert processed == ["expired"]
+
+
+def test_heartbeat_keeps_long_running_job_owned(collection):
+    """
+    Tests that the lease of a job running longer than the lease is renewed, so the job is not started twice.
+    """
+    logger.debug("Running test_heartbeat_keeps_long_running_job_owned.")
+    JobManager._instance = None
+    job_manager = JobManager(collection, workers=2, poll_interval=0.02, lease_seconds=0.15)
+    runs = []
+
+    def handler(job, context):
+        runs.append(job["_id"])
+        time.sleep(0.6)
+
+    try:
+        job_manager.register_handler("tts_book", handler)
+        job_manager.start()
+        job_id = job_manager.submit("tts_book", {})
+        assert _wait_for(job_manager, job_id)["status"] == "done"
+        assert runs == [job_id]
+    finally:
+        job_manager.stop(timeout=5)
+        JobManager._instance = None
+
+
+if __name__ == '__main__':
+    # Run tests if this file is executed directly.
+    pytest.main()
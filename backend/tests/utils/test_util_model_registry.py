@@ -0,0 +1,140 @@
+import logging
+import pytest
+from backend.app.utils.util_model_registry import ModelRegistry
+
+# Configure logging to capture DEBUG, WARNING, and ERROR messages.
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def registry():
+    """
+    Fixture providing a fresh ModelRegistry with a 100 byte budget and no idle reaper thread.
+    """
+    ModelRegistry._instance = None
+    registry = ModelRegistry(ram_budget_bytes=100, idle_timeout=0)
+    yield registry
+    registry.stop()
+    ModelRegistry._instance = None
+
+
+def _loader(calls, name, size=40):
+    """Returns a loader producing a bytes 'model' of the given size and counting its calls."""
+    def load():
+        calls.append(name)
+        return b"x" * size
+    return load
+
+
+def test_models_are_loaded_lazily_once(registry):
+    """
+    Tests that registering does not load a model and that repeated acquires reuse the loaded model.
+    """
+    logger.debug("Running test_models_are_loaded_lazily_once.")
+    calls = []
+    registry.register("translation:a", _loader(calls, "a"))
+    assert calls == [] and not registry.is_loaded("translation:a")
+
+    with registry.acquire("translation:a") as model:
+        assert len(model) == 40
+    with registry.acquire("translation:a"):
+        pass
+    assert calls == ["a"]
+    assert registry.get_stats()["translation:a"]["bytes"] == 40
+
+
+def test_budget_unloads_least_recently_used_idle_model(registry):
+    """
+    Tests that loading beyond the RAM budget unloads the least recently used idle model.
+    """
+    logger.debug("Running test_budget_unloads_least_recently_used_idle_model.")
+    calls = []
+    for name in ("a", "b", "c"):
+        registry.register(f"translation:{name}", _loader(calls, name))
+
+    registry.preload("translation:a")
+    registry.preload("translation:b")
+    with registry.acquire("translation:a"):
+        pass  # 'a' is now more recently used than 'b'.
+    registry.preload("translation:c")
+
+    assert registry.is_loaded("translation:a")
+    assert not registry.is_loaded("translation:b")
+    assert registry.is_loaded("translation:c")
+    assert registry.get_loaded_bytes() <= 100
+
+
+def test_pinned_models_are_not_unloaded(registry):
+    """
+    Tests that models with in-flight requests survive budget enforcement and explicit unloads.
+    """
+    logger.debug("Running test_pinned_models_are_not_unloaded.")
+    calls = []
+    with registry.acquire("tts:a", _loader(calls, "a", size=80)):
+        with registry.acquire("tts:b", _loader(calls, "b", size=80)):
+            assert registry.is_loaded("tts:a") and registry.is_loaded("tts:b")
+            assert registry.unload("tts:a") is False
+            assert registry.get_stats()["tts:a"]["in_flight"] == 1
+
+    assert registry.unload("tts:a") is True
+    assert not registry.is_loaded("tts:a")
+
+
+def test_unload_idle(registry):
+    """
+    Tests that idle models are unloaded and reloaded on the next acquire.
+    """
+    logger.debug("Running test_unload_idle.")
+    calls = []
+    registry.preload("stt:turbo", _loader(calls, "turbo"))
+    registry.unload_idle(max_idle=0)
+    assert not registry.is_loaded("stt:turbo")
+
+    with registry.acquire("stt:turbo"):
+        pass
+    assert calls == ["turbo", "turbo"]
+
+
+def test_stop_ends_reaper_thread():
+    """
+    Tests that stop() ends the idle reaper thread instead of leaving it running.
+    """
+    logger.debug("Running test_stop_ends_reaper_thread.")
+    ModelRegistry._instance = None
+    registry = ModelRegistry(ram_budget_bytes=100, idle_timeout=60)
+    try:
+        assert registry._reaper_thread.is_alive()
+        registry.stop()
+        assert not registry._reaper_thread.is_alive()
+    finally:
+        ModelRegistry._instance = None
+
+
+def test_quantized_models_count_their_packed_weights():
+    """
+    Tests that int8 dynamically quantized layers, whose weights are not parameters, count against the RAM budget.
+    """
+    logger.debug("Running test_quantized_models_count_their_packed_weights.")
+    torch = pytest.importorskip("torch")
+    model = torch.nn.Sequential(torch.nn.Linear(256, 256), torch.nn.BatchNorm1d(256))
+    quantized = torch.ao.quantization.quantize_dynamic(torch.nn.Sequential(torch.nn.Linear(256, 256)),
+                                                       {torch.nn.Linear}, dtype=torch.qint8)
+    assert not list(quantized.parameters())
+
+    ModelRegistry._instance = None
+    registry = ModelRegistry(ram_budget_bytes=0, idle_timeout=0)
+    try:
+        registry.preload("translation:float", lambda: (None, model))
+        registry.preload("translation:int8", lambda: (None, quantized))
+        stats = registry.get_stats()
+    finally:
+        ModelRegistry._instance = None
+
+    assert stats["translation:float"]["bytes"] >= (256 * 256 + 256 + 4 * 256) * 4, "Expected parameters and buffers."
+    assert stats["translation:int8"]["bytes"] >= 256 * 256, "Expected the packed int8 weights."
+
+
+if __name__ == '__main__':
+    # Run the tests if this file is executed directly.
+    pytest.main()
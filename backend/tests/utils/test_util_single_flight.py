@@ -0,0 +1,67 @@
+import logging
+import threading
+import time
+import pytest
+from backend.app.utils.util_single_flight import SingleFlight
+
+# Configure logging to capture DEBUG, WARNING, and ERROR messages.
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+
+def _run_concurrently(count, target):
+    """Starts `count` threads running `target` and waits for all of them."""
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+
+def test_concurrent_calls_share_one_computation():
+    """
+    Tests that concurrent callers with the same key run the computation only once and all get its result.
+    """
+    logger.debug("Running test_concurrent_calls_share_one_computation.")
+    single_flight = SingleFlight()
+    calls = []
+    results = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return ["Hallo"]
+
+    _run_concurrently(5, lambda: results.append(single_flight.do("Helsinki-NLP/opus-mt-en-de-abc", compute)))
+
+    assert len(calls) == 1, "Expected the computation to run exactly once."
+    assert results == [["Hallo"]] * 5
+    assert single_flight.in_flight() == 0
+
+
+def test_errors_are_shared_and_not_cached():
+    """
+    Tests that waiting callers receive the leader's exception and that a later call computes again.
+    """
+    logger.debug("Running test_errors_are_shared_and_not_cached.")
+    single_flight = SingleFlight()
+    errors = []
+
+    def failing():
+        time.sleep(0.2)
+        raise ValueError("synthesis failed")
+
+    def call():
+        try:
+            single_flight.do("tts-model-speaker-de-abc", failing)
+        except ValueError as e:
+            errors.append(str(e))
+
+    _run_concurrently(3, call)
+    assert errors == ["synthesis failed"] * 3
+    assert single_flight.do("tts-model-speaker-de-abc", lambda: b"audio") == b"audio"
+
+
+if __name__ == '__main__':
+    # Run the tests if this file is executed directly.
+    pytest.main()
@@ -0,0 +1,131 @@
+import json
+import logging
+import pytest
+from backend.app.utils.util_text_manager import TTS_CHAR_LIMITS, count_tokens, iter_sentences, iter_tts_sentences, \
+    segment_text_for_tts, split_text_into_chunks
+
+# Configure logging to capture DEBUG, WARNING, and ERROR messages.
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+TEXT = "One two three. Four five. Six seven eight nine ten eleven. Twelve."
+
+
+class WordTokenizer:
+    """Tokenizer providing only tokenize, with one token per word, counting its tokenize calls."""
+
+    def __init__(self):
+        self.tokenize_calls = 0
+
+    def tokenize(self, sentence):
+        self.tokenize_calls += 1
+        return sentence.split()
+
+
+class BatchWordTokenizer(WordTokenizer):
+    """Slow Hugging Face style tokenizer encoding a whole batch in one call."""
+    is_fast = False
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def __call__(self, sentences, add_special_tokens=True):
+        self.batches.append(list(sentences))
+        return {"input_ids": [list(range(len(sentence.split()))) for sentence in sentences]}
+
+
+def test_tokenizers_count_in_one_call():
+    """
+    Tests that tokenizers, fast or slow, count all sentences with one batched call and tokenize-only objects use tokenize.
+    """
+    logger.debug("Running test_tokenizers_count_in_one_call.")
+    sentences = ["One two three.", "Four five."]
+
+    batched = BatchWordTokenizer()
+    assert count_tokens(batched, sentences) == [3, 2]
+    assert batched.batches == [sentences] and batched.tokenize_calls == 0
+
+    plain = WordTokenizer()
+    assert count_tokens(plain, sentences) == [3, 2]
+    assert plain.tokenize_calls == 2
+
+
+def test_token_counts_match_tokenize_with_language_codes(tmp_path):
+    """
+    Tests that the batched counts of a (locally trained) Marian tokenizer equal its tokenize counts,
+    including language codes.
+    """
+    logger.debug("Running test_token_counts_match_tokenize_with_language_codes.")
+    transformers = pytest.importorskip("transformers")
+    sentencepiece = pytest.importorskip("sentencepiece")
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text("\n".join(["The weather is nice today.", "Leading whitespace is removed.",
+                                  "Plain fine text with two sentences.", "A code in the middle of the text."] * 20))
+    sentencepiece.SentencePieceTrainer.train(input=str(corpus), model_prefix=str(tmp_path / "spm"), vocab_size=40,
+                                             character_coverage=1.0, minloglevel=2)
+    processor = sentencepiece.SentencePieceProcessor(model_file=str(tmp_path / "spm.model"))
+    pieces = [processor.id_to_piece(index) for index in range(processor.get_piece_size())]
+    vocab = {piece: index for index, piece in enumerate(pieces + ["<pad>", ">>de<<", ">>fr<<", ">>es<<"])}
+    (tmp_path / "vocab.json").write_text(json.dumps(vocab))
+    spm_model = str(tmp_path / "spm.model")
+    tokenizer = transformers.MarianTokenizer(spm_model, spm_model, str(tmp_path / "vocab.json"))
+    sentences = [">>de<< The weather is nice today.", "  >>fr<< Leading whitespace.", "Plain ﬁne text.",
+                 "Two sentences, >>es<< with a code in the middle."]
+
+    assert count_tokens(tokenizer, sentences) == [len(tokenizer.tokenize(sentence)) for sentence in sentences]
+
+
+def test_batched_chunking_matches_per_sentence_chunking():
+    """
+    Tests that chunks packed from batched token counts equal the chunks of the per-sentence tokenizer.
+    """
+    logger.debug("Running test_batched_chunking_matches_per_sentence_chunking.")
+    expected = ["One two three. Four five.", "Six seven eight nine ten eleven.", "Twelve."]
+
+    assert split_text_into_chunks(WordTokenizer(), TEXT, max_tokens=5) == expected
+    assert split_text_into_chunks(BatchWordTokenizer(), TEXT, max_tokens=5) == expected
+    assert split_text_into_chunks(BatchWordTokenizer(), TEXT, max_tokens=5, preprocessed=True) == expected
+
+
+def test_tts_segments_respect_limit_without_dropping_text():
+    """
+    Tests that TTS segments stay within the character limit, split long sentences and keep all of the text.
+    """
+    logger.debug("Running test_tts_segments_respect_limit_without_dropping_text.")
+    long_sentence = ", ".join(["a clause of several words"] * 20) + " and an unterminated tail"
+    text = f"First sentence. {long_sentence} Second sentence! Trailing text without a full stop"
+
+    segments = list(segment_text_for_tts(text, "en", char_limit=60))
+    assert all(len(segment) <= 60 for segment in segments)
+    assert " ".join(segments).split() == text.split(), "Expected every word in order, including the trailing text."
+    assert segments[-1].endswith("Trailing text without a full stop")
+
+    pieces = list(iter_tts_sentences(text, "en", char_limit=60))
+    assert pieces[0] == "First sentence." and all(len(piece) <= 60 for piece in pieces)
+    assert " ".join(pieces).split() == text.split(), "Expected sentences to be split but not packed."
+
+    assert list(segment_text_for_tts("x" * 130, char_limit=50)) == ["x" * 50, "x" * 50, "x" * 30]
+    assert list(segment_text_for_tts("Short text.", "en")) == ["Short text."]
+    assert list(segment_text_for_tts("   ", "en")) == []
+
+
+def test_tts_segmenter_is_language_aware():
+    """
+    Tests that abbreviations do not end sentences and that the character limit follows the language.
+    """
+    logger.debug("Running test_tts_segmenter_is_language_aware.")
+    assert list(iter_sentences("Dr. Smith met Mr. Jones. They talked.", "en")) == \
+        ["Dr. Smith met Mr. Jones.", "They talked."]
+    assert list(iter_sentences("Das ist z.B. ein Test. Noch einer.", "de")) == ["Das ist z.B. ein Test.", "Noch einer."]
+    assert list(iter_sentences("你好。今天天气很好！", "zh-cn")) == ["你好。", "今天天气很好！"]
+
+    chinese = "今天天气很好。" * 30
+    assert all(len(segment) <= TTS_CHAR_LIMITS["zh"] for segment in segment_text_for_tts(chinese, "zh-cn"))
+    assert "".join(segment_text_for_tts(chinese, "zh-cn")).replace(" ", "") == chinese
+    assert len(list(segment_text_for_tts("Word. " * 100, "eng"))) == 3, "Expected the English limit for 'eng'."
+
+
+if __name__ == '__main__':
+    # Run tests if this file is executed directly.
+    pytest.main()
@@ -0,0 +1,75 @@
+import logging
+import pytest
+from backend.app.utils.util_translation_memory import TranslationMemory, get_translation_memory_key
+
+# Configure logging to capture DEBUG, WARNING, and ERROR messages.
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+MODEL = "Helsinki-NLP/opus-mt-en-de"
+
+
+class DictCacheManager:
+    """Minimal stand-in for CacheManager backed by a dictionary."""
+
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def set(self, key, value):
+        self.entries[key] = value
+
+
+def _fake_translator(calls):
+    """Returns a translate_fn that records its input and 'translates' by upper-casing."""
+    def translate(sentences):
+        calls.append(list(sentences))
+        return [sentence.upper() for sentence in sentences]
+    return translate
+
+
+def test_keys_use_normalized_sentences():
+    """
+    Tests that whitespace and Unicode variants of a sentence share one memory entry.
+    """
+    logger.debug("Running test_keys_use_normalized_sentences.")
+    assert get_translation_memory_key(MODEL, "Hello  world.") == get_translation_memory_key(MODEL, " Hello world. ")
+    assert get_translation_memory_key(MODEL, "ﬁne.") == get_translation_memory_key(MODEL, "fine.")
+    assert get_translation_memory_key(MODEL, "Hello.") != get_translation_memory_key("Helsinki-NLP/opus-mt-de-en", "Hello.")
+    assert get_translation_memory_key(MODEL, "Hello.").startswith(f"tm-{MODEL}-")
+
+
+def test_only_unseen_sentences_are_translated():
+    """
+    Tests that a retranslation after an edit only translates the changed sentence.
+    """
+    logger.debug("Running test_only_unseen_sentences_are_translated.")
+    memory = TranslationMemory(DictCacheManager())
+    calls = []
+
+    first = memory.translate(MODEL, ["One.", "Two.", "Three."], _fake_translator(calls))
+    second = memory.translate(MODEL, ["One.", "Two, edited.", "Three."], _fake_translator(calls))
+
+    assert first == ["ONE.", "TWO.", "THREE."]
+    assert second == ["ONE.", "TWO, EDITED.", "THREE."]
+    assert calls == [["One.", "Two.", "Three."], ["Two, edited."]]
+
+
+def test_repeated_sentences_are_translated_once():
+    """
+    Tests that boilerplate repeated within one request reaches the model only once.
+    """
+    logger.debug("Running test_repeated_sentences_are_translated_once.")
+    memory = TranslationMemory(DictCacheManager())
+    calls = []
+
+    result = memory.translate(MODEL, ["Chapter one.", "Text.", "Chapter one."], _fake_translator(calls))
+    assert result == ["CHAPTER ONE.", "TEXT.", "CHAPTER ONE."]
+    assert calls == [["Chapter one.", "Text."]]
+
+
+if __name__ == '__main__':
+    # Run the tests if this file is executed directly.
+    pytest.main()